@@ -0,0 +1,372 @@
+#===================================================================================================================================
+#  File        : bdd.py
+#  Project     : Combinational Logic Simulator
+#  Description : Analyze combinational logic circuits symbolically with binary decision diagrams.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Logic gate simulation
+# Reference: gate.py
+from gate import GATE_TYPES
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Terminal nodes of every binary decision diagram
+FALSE = 0
+TRUE = 1
+
+#===================================================================================================================================
+#  Class Definition
+#===================================================================================================================================
+
+class BDD(object):
+    """Build reduced ordered binary decision diagrams (ROBDDs) over a fixed number of variables.
+
+    Nodes are ints, where 0 and 1 are the FALSE and TRUE terminals. Every other node tests the variable at its level, with level 0
+    tested first. A unique table keeps a single node for each (level, low child, high child), so two functions are equal exactly
+    when their nodes are equal, and a computed cache keeps the result of every if-then-else operation.
+
+    Keyword arguments:
+    num_vars  -- Number of variables
+    max_nodes -- Maximum number of nodes before building fails with a ValueError (None for no limit)
+    """
+    def __init__(self, num_vars, max_nodes=None):
+        self.num_vars = num_vars
+        self.__max_nodes = max_nodes
+
+        # Store the level, low child (variable at 0), and high child (variable at 1) of each node, starting with the terminals,
+        # which sit below every variable.
+        self.__levels = [num_vars, num_vars]
+        self.__lows = [FALSE, TRUE]
+        self.__highs = [FALSE, TRUE]
+
+        self.__unique_table = {}
+        self.__computed_cache = {}
+
+    def __len__(self):
+        return len(self.__levels)
+
+    def get_variable(self, level):
+        """Get the node of the function equal to a single variable.
+
+        Keyword arguments:
+        level -- Level of the variable
+        """
+        return self.__make_node(level, FALSE, TRUE)
+
+    def ite(self, f, g, h):
+        """Get the node of the function "if f then g else h".
+
+        The cofactors are expanded with an explicit stack instead of recursion, so diagrams over thousands of variables do not
+        hit the recursion limit.
+
+        Keyword arguments:
+        f -- Node of the condition
+        g -- Node of the function where f is 1
+        h -- Node of the function where f is 0
+        """
+        # Each pending operation either expands (f, g, h) into its cofactors (level None) or, once the results of both cofactors
+        # are on the results stack, combines them into a node testing the variable at its level.
+        results = []
+        pending = [(f, g, h, None)]
+        while pending:
+            f, g, h, level = pending.pop()
+            if level is not None:
+                high = results.pop()
+                low = results.pop()
+                result = self.__make_node(level, low, high)
+                self.__computed_cache[(f, g, h)] = result
+                results.append(result)
+                continue
+
+            # Resolve the terminal cases directly.
+            if f == TRUE or g == h:
+                results.append(g)
+                continue
+            elif f == FALSE:
+                results.append(h)
+                continue
+            elif g == TRUE and h == FALSE:
+                results.append(f)
+                continue
+
+            # Otherwise, split on the top variable of the three functions, reusing any computed result.
+            result = self.__computed_cache.get((f, g, h))
+            if result is not None:
+                results.append(result)
+                continue
+            level = min(self.__levels[f], self.__levels[g], self.__levels[h])
+            f0, f1 = self.__get_cofactors(f, level)
+            g0, g1 = self.__get_cofactors(g, level)
+            h0, h1 = self.__get_cofactors(h, level)
+            pending.append((f, g, h, level))
+            pending.append((f1, g1, h1, None))
+            pending.append((f0, g0, h0, None))
+        return results.pop()
+
+    def not_(self, f):
+        """Get the node of the complement of a function.
+
+        Keyword arguments:
+        f -- Node of the function
+        """
+        return self.ite(f, FALSE, TRUE)
+
+    def and_(self, f, g):
+        """Get the node of the AND of two functions.
+
+        Keyword arguments:
+        f -- Node of the first function
+        g -- Node of the second function
+        """
+        return self.ite(f, g, FALSE)
+
+    def or_(self, f, g):
+        """Get the node of the OR of two functions.
+
+        Keyword arguments:
+        f -- Node of the first function
+        g -- Node of the second function
+        """
+        return self.ite(f, TRUE, g)
+
+    def xor(self, f, g):
+        """Get the node of the XOR of two functions.
+
+        Keyword arguments:
+        f -- Node of the first function
+        g -- Node of the second function
+        """
+        return self.ite(f, self.not_(g), g)
+
+    def count(self, f):
+        """Count the assignments of all variables where a function is 1.
+
+        Keyword arguments:
+        f -- Node of the function
+        """
+        # Count the assignments of the variables from the level of each node down, where a skipped level doubles the count.
+        counts = {FALSE: 0, TRUE: 1}
+        pending = [f]
+        while pending:
+            node = pending[-1]
+            low = self.__lows[node]
+            high = self.__highs[node]
+            if node in counts:
+                pending.pop()
+            elif low in counts and high in counts:
+                pending.pop()
+                level = self.__levels[node]
+                counts[node] = ((counts[low] << (self.__levels[low] - level - 1))
+                                + (counts[high] << (self.__levels[high] - level - 1)))
+            else:
+                pending.extend([child for child in (low, high) if child not in counts])
+        return counts[f] << self.__levels[f]
+
+    def get_witness(self, f):
+        """Get an assignment of every variable where a function is 1, indexed by level (None if the function is always 0).
+
+        Variables that do not affect the result are assigned 0.
+
+        Keyword arguments:
+        f -- Node of the function
+        """
+        if f == FALSE:
+            return None
+        assignment = [0] * self.num_vars
+        node = f
+        while node != TRUE:
+            if self.__lows[node] != FALSE:
+                node = self.__lows[node]
+            else:
+                assignment[self.__levels[node]] = 1
+                node = self.__highs[node]
+        return assignment
+
+    def __get_cofactors(self, f, level):
+        """Get the (low, high) cofactors of a function with respect to the variable at a level.
+
+        Keyword arguments:
+        f     -- Node of the function
+        level -- Level of the variable, at or above the level of f
+        """
+        if self.__levels[f] == level:
+            return self.__lows[f], self.__highs[f]
+        else:
+            return f, f
+
+    def __make_node(self, level, low, high):
+        """Get the unique node testing a variable, skipping the test if both children are the same.
+
+        Keyword arguments:
+        level -- Level of the variable
+        low   -- Node where the variable is 0
+        high  -- Node where the variable is 1
+        """
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self.__unique_table.get(key)
+        if node is None:
+            node = len(self.__levels)
+            if self.__max_nodes is not None and node >= self.__max_nodes:
+                raise ValueError("Binary decision diagram exceeded " + str(self.__max_nodes) + " nodes")
+            self.__levels.append(level)
+            self.__lows.append(low)
+            self.__highs.append(high)
+            self.__unique_table[key] = node
+        return node
+
+class CircuitBDD(object):
+    """Build the binary decision diagram of each gate of a circuit to analyze it without enumerating the truth table.
+
+    The variables are the general input values. Unless an order is given, they are ordered by a depth-first walk from the outputs,
+    which keeps related inputs (such as the bits of an adder) next to each other and the diagrams small.
+
+    Keyword arguments:
+    circuit          -- Circuit to analyze
+    selected_outputs -- List of gate indexes to build diagrams for, along with their fan-in cone (None to build every gate)
+    variable_order   -- List of general input positions from the first variable tested to the last (None to order automatically)
+    max_nodes        -- Maximum number of nodes before building fails with a ValueError (None for no limit)
+    """
+    def __init__(self, circuit, selected_outputs=None, variable_order=None, max_nodes=None):
+        num_general_values, input_slots, fan_out, levels, order = circuit.get_netlist()
+        codes = circuit.get_gate_type_codes()
+        self.__num_general_values = num_general_values
+        if selected_outputs:
+            outputs = [int(output) for output in selected_outputs]
+        else:
+            outputs = list(range(len(codes)))
+
+        # Walk depth-first from the outputs to find the gates to build and the order in which general inputs are first reached.
+        is_in_cone = [False] * (num_general_values + len(codes))
+        reached_inputs = []
+        pending = [num_general_values + i for i in reversed(outputs)]
+        while pending:
+            slot = pending.pop()
+            if is_in_cone[slot]:
+                continue
+            is_in_cone[slot] = True
+            if slot < num_general_values:
+                reached_inputs.append(slot)
+            else:
+                pending.extend(reversed(input_slots[slot - num_general_values]))
+
+        # Order the variables, placing general inputs outside of the cone last.
+        if variable_order is None:
+            variable_order = reached_inputs + [i for i in range(num_general_values) if not is_in_cone[i]]
+        if sorted(variable_order) != list(range(num_general_values)):
+            raise ValueError("Variable order must list each of the " + str(num_general_values) + " general inputs once")
+        self.variable_order = list(variable_order)
+
+        # Build the diagram of each gate in the cone in topological order.
+        self.bdd = BDD(num_general_values, max_nodes)
+        self.__nodes = [None] * (num_general_values + len(codes))
+        for level, input in enumerate(self.variable_order):
+            self.__nodes[input] = self.bdd.get_variable(level)
+        for i in order:
+            if is_in_cone[num_general_values + i]:
+                inputs = [self.__nodes[slot] for slot in input_slots[i]]
+                self.__nodes[num_general_values + i] = self.__build_gate(GATE_TYPES[codes[i]], inputs)
+
+    def get_node(self, output):
+        """Get the diagram node of a gate.
+
+        Keyword arguments:
+        output -- Index of the gate in the sorted list of gates
+        """
+        node = self.__nodes[self.__num_general_values + output]
+        if node is None:
+            raise ValueError("Gate at index " + str(output) + " is outside of the selected outputs")
+        return node
+
+    def count_satisfying(self, output):
+        """Count the combinations of the general inputs where a gate is 1.
+
+        Keyword arguments:
+        output -- Index of the gate in the sorted list of gates
+        """
+        return self.bdd.count(self.get_node(output))
+
+    def get_witness(self, output):
+        """Get the general input values of a combination where a gate is 1 (None if the gate is always 0).
+
+        Keyword arguments:
+        output -- Index of the gate in the sorted list of gates
+        """
+        return self.__get_input_values(self.bdd.get_witness(self.get_node(output)))
+
+    def is_equivalent(self, output_a, output_b):
+        """Determine if two gates have the same value for every combination of the general inputs.
+
+        Keyword arguments:
+        output_a -- Index of the first gate in the sorted list of gates
+        output_b -- Index of the second gate in the sorted list of gates
+        """
+        return self.get_node(output_a) == self.get_node(output_b)
+
+    def get_counterexample(self, output_a, output_b):
+        """Get the general input values of a combination where two gates differ (None if they are equivalent).
+
+        Keyword arguments:
+        output_a -- Index of the first gate in the sorted list of gates
+        output_b -- Index of the second gate in the sorted list of gates
+        """
+        difference = self.bdd.xor(self.get_node(output_a), self.get_node(output_b))
+        return self.__get_input_values(self.bdd.get_witness(difference))
+
+    def __get_input_values(self, assignment):
+        """Get the values of the general inputs in order from an assignment of the variables by level.
+
+        Keyword arguments:
+        assignment -- List of variable values indexed by level (None for no assignment)
+        """
+        if assignment is None:
+            return None
+        values = [0] * self.__num_general_values
+        for level, input in enumerate(self.variable_order):
+            values[input] = assignment[level]
+        return values
+
+    def __build_gate(self, type, inputs):
+        """Build the diagram of a gate from the diagrams of its inputs.
+
+        Keyword arguments:
+        type   -- Logic gate type
+        inputs -- List of diagram nodes of the gate inputs
+        """
+        bdd = self.bdd
+        if type == "NOT":
+            return bdd.not_(inputs[0])
+        elif type == "BUFFER":
+            return inputs[0]
+
+        # Combine the inputs with the base operation of the gate type, then invert it for NAND, NOR, and XNOR gates.
+        if type == "AND" or type == "NAND":
+            node = TRUE
+            for input in inputs:
+                node = bdd.and_(node, input)
+        elif type == "OR" or type == "NOR":
+            node = FALSE
+            for input in inputs:
+                node = bdd.or_(node, input)
+        else:
+            node = FALSE
+            for input in inputs:
+                node = bdd.xor(node, input)
+
+        if type == "NAND" or type == "NOR" or type == "XNOR":
+            return bdd.not_(node)
+        else:
+            return node
@@ -0,0 +1,468 @@
+#===================================================================================================================================
+#  File        : benchmark.py
+#  Project     : Combinational Logic Simulator
+#  Description : Benchmark the simulator on generated synthetic circuits.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Parser for command-line options, arguments, and sub-commands
+# Reference: https://docs.python.org/3.3/library/argparse.html
+import argparse
+
+# JSON encoder and decoder
+# Reference: https://docs.python.org/3/library/json.html
+import json
+
+# Miscellaneous operating system interfaces and common pathname manipulations
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# Access underlying platform's identifying data
+# Reference: https://docs.python.org/3/library/platform.html
+import platform
+
+# Generate pseudo-random numbers
+# Reference: https://docs.python.org/3/library/random.html
+import random
+
+# Generate temporary files and directories
+# Reference: https://docs.python.org/3/library/tempfile.html
+import tempfile
+
+# Time access and conversions
+# Reference: https://docs.python.org/3/library/time.html
+from time import perf_counter
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Combinational logic simulation
+# Reference: circuit.py
+from circuit import Circuit
+
+# Logic gate simulation
+# Reference: gate.py
+from gate import GATE_TYPES
+
+# Simulate combinational logic circuits using Python
+# Reference: main.py
+from main import VERSION
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Version of the benchmark report format (increment whenever the report layout changes)
+REPORT_VERSION = 1
+
+# Benchmark suites as lists of (circuit generator name, generator parameters)
+SUITES = {
+    "quick": [("ripple_carry_adder", {"bits": 4}),
+              ("carry_lookahead_adder", {"bits": 4}),
+              ("mux_tree", {"select_bits": 2}),
+              ("decoder", {"bits": 3}),
+              ("parity_tree", {"bits": 8}),
+              ("random_dag", {"num_inputs": 8, "depth": 6, "width": 8, "seed": 1})],
+    "default": [("ripple_carry_adder", {"bits": 8}),
+                ("carry_lookahead_adder", {"bits": 8}),
+                ("mux_tree", {"select_bits": 3}),
+                ("decoder", {"bits": 8}),
+                ("parity_tree", {"bits": 16}),
+                ("random_dag", {"num_inputs": 16, "depth": 20, "width": 20, "seed": 1})],
+    "large": [("ripple_carry_adder", {"bits": 10}),
+              ("carry_lookahead_adder", {"bits": 10}),
+              ("mux_tree", {"select_bits": 4}),
+              ("decoder", {"bits": 10}),
+              ("parity_tree", {"bits": 20}),
+              ("random_dag", {"num_inputs": 20, "depth": 100, "width": 100, "seed": 1})]
+}
+
+#===================================================================================================================================
+#  Class Definition
+#===================================================================================================================================
+
+class NetlistBuilder(object):
+    """Build the lines of a circuit file one gate at a time.
+
+    Gate IDs are numbered consecutively from 0 in the order the gates are added.
+
+    Keyword arguments:
+    <None>
+    """
+    def __init__(self):
+        self.lines = []
+
+    def add_gate(self, name, type, inputs):
+        """Add a gate and return its ID as an input token for other gates.
+
+        Keyword arguments:
+        name   -- Gate name
+        type   -- Logic gate type
+        inputs -- List of input tokens (general input values like I0 or gate IDs)
+        """
+        id = str(len(self.lines))
+        self.lines.append(" ".join([id, name, type] + inputs))
+        return id
+
+    def write(self, file):
+        """Write the circuit file.
+
+        Keyword arguments:
+        file -- Path to the circuit file to write
+        """
+        with open(file, "w") as circuit_file:
+            circuit_file.write("\n".join(self.lines) + "\n")
+
+#===================================================================================================================================
+#  Circuit Generators
+#===================================================================================================================================
+
+# Each generator returns a NetlistBuilder holding the circuit and the list of names of its output gates.
+
+def ripple_carry_adder(bits):
+    """Generate an adder of two numbers where the carry ripples through each full adder.
+
+    The first number is I0 to In-1, the second number is In to I2n-1, and the carry in is I2n (least significant bits first).
+
+    Keyword arguments:
+    bits -- Number of bits of each number
+    """
+    builder = NetlistBuilder()
+    outputs = []
+    carry = "I" + str(2 * bits)
+    for i in range(bits):
+        a = "I" + str(i)
+        b = "I" + str(bits + i)
+        propagate = builder.add_gate("P" + str(i), "XOR", [a, b])
+        generate = builder.add_gate("G" + str(i), "AND", [a, b])
+        builder.add_gate("S" + str(i), "XOR", [propagate, carry])
+        transfer = builder.add_gate("T" + str(i), "AND", [propagate, carry])
+        carry = builder.add_gate("C" + str(i + 1), "OR", [generate, transfer])
+        outputs.append("S" + str(i))
+    outputs.append("C" + str(bits))
+    return builder, outputs
+
+def carry_lookahead_adder(bits):
+    """Generate an adder of two numbers where every carry is calculated directly from the propagate and generate signals.
+
+    The inputs are laid out like ripple_carry_adder().
+
+    Keyword arguments:
+    bits -- Number of bits of each number
+    """
+    builder = NetlistBuilder()
+    outputs = []
+    propagates = []
+    generates = []
+    for i in range(bits):
+        a = "I" + str(i)
+        b = "I" + str(bits + i)
+        propagates.append(builder.add_gate("P" + str(i), "XOR", [a, b]))
+        generates.append(builder.add_gate("G" + str(i), "AND", [a, b]))
+
+    # Carry i is G(i-1) | P(i-1)G(i-2) | ... | P(i-1)...P(0)C0, with each term as a single wide AND gate.
+    carries = ["I" + str(2 * bits)]
+    for i in range(1, bits + 1):
+        terms = [generates[i - 1]]
+        for j in range(i - 1, -1, -1):
+            source = generates[j - 1] if j > 0 else carries[0]
+            terms.append(builder.add_gate("L" + str(i) + "_" + str(j), "AND", propagates[j:i] + [source]))
+        carries.append(builder.add_gate("C" + str(i), "OR", terms))
+
+    for i in range(bits):
+        builder.add_gate("S" + str(i), "XOR", [propagates[i], carries[i]])
+        outputs.append("S" + str(i))
+    outputs.append("C" + str(bits))
+    return builder, outputs
+
+def mux_tree(select_bits):
+    """Generate a multiplexer as a tree of 2-to-1 multiplexers.
+
+    The data inputs are I0 to I(2^k - 1) and the select inputs follow them (least significant bit first).
+
+    Keyword arguments:
+    select_bits -- Number of select inputs (k)
+    """
+    builder = NetlistBuilder()
+    num_data = 1 << select_bits
+    level = ["I" + str(i) for i in range(num_data)]
+    for k in range(select_bits):
+        select = "I" + str(num_data + k)
+        inverted_select = builder.add_gate("NS" + str(k), "NOT", [select])
+        next_level = []
+        for i in range(0, len(level), 2):
+            name = "M" + str(k) + "_" + str(i // 2)
+            low = builder.add_gate(name + "L", "AND", [level[i], inverted_select])
+            high = builder.add_gate(name + "H", "AND", [level[i + 1], select])
+            next_level.append(builder.add_gate(name, "OR", [low, high]))
+        level = next_level
+    return builder, ["M" + str(select_bits - 1) + "_0"] if select_bits > 0 else []
+
+def decoder(bits):
+    """Generate a decoder with one output for each combination of its inputs.
+
+    Keyword arguments:
+    bits -- Number of inputs
+    """
+    builder = NetlistBuilder()
+    inverted = [builder.add_gate("N" + str(i), "NOT", ["I" + str(i)]) for i in range(bits)]
+    outputs = []
+    for value in range(1 << bits):
+        inputs = ["I" + str(i) if (value >> (bits - 1 - i)) & 1 else inverted[i] for i in range(bits)]
+        builder.add_gate("D" + str(value), "AND", inputs)
+        outputs.append("D" + str(value))
+    return builder, outputs
+
+def parity_tree(bits):
+    """Generate a balanced tree of 2-input XOR gates calculating the parity of its inputs.
+
+    Keyword arguments:
+    bits -- Number of inputs
+    """
+    builder = NetlistBuilder()
+    level = ["I" + str(i) for i in range(bits)]
+    depth = 0
+    while len(level) > 1:
+        next_level = []
+        for i in range(0, len(level) - 1, 2):
+            next_level.append(builder.add_gate("X" + str(depth) + "_" + str(i // 2), "XOR", [level[i], level[i + 1]]))
+        if len(level) % 2 == 1:
+            next_level.append(level[-1])
+        level = next_level
+        depth = depth + 1
+    if not builder.lines:
+        builder.add_gate("X0_0", "BUFFER", level)
+    return builder, [builder.lines[-1].split()[1]]
+
+def random_dag(num_inputs, depth, width, seed):
+    """Generate a random acyclic circuit of gates arranged in levels.
+
+    Each gate draws its inputs mostly from the level right before it, and sometimes from the general inputs or any earlier level.
+    The gates of the last level are the outputs.
+
+    Keyword arguments:
+    num_inputs -- Number of general inputs
+    depth      -- Number of levels of gates
+    width      -- Number of gates in each level
+    seed       -- Seed of the random number generator
+    """
+    generator = random.Random(seed)
+    builder = NetlistBuilder()
+    general_values = ["I" + str(i) for i in range(num_inputs)]
+    earlier = list(general_values)
+    previous = general_values
+    outputs = []
+    for level in range(depth):
+        current = []
+        for i in range(width):
+            type = generator.choice(GATE_TYPES)
+            num_gate_inputs = 1 if type == "NOT" or type == "BUFFER" else generator.randint(2, 4)
+            inputs = []
+            for j in range(num_gate_inputs):
+                draw = generator.random()
+                if draw < 0.7:
+                    inputs.append(generator.choice(previous))
+                elif draw < 0.85:
+                    inputs.append(generator.choice(general_values))
+                else:
+                    inputs.append(generator.choice(earlier))
+
+            # Make sure every general input is used in the first level.
+            if level == 0 and i < num_inputs:
+                inputs[0] = general_values[i]
+            name = "R" + str(level) + "_" + str(i)
+            current.append(builder.add_gate(name, type, inputs))
+            if level == depth - 1:
+                outputs.append(name)
+        earlier.extend(current)
+        previous = current
+    return builder, outputs
+
+# Circuit generators by name
+GENERATORS = {"ripple_carry_adder": ripple_carry_adder,
+              "carry_lookahead_adder": carry_lookahead_adder,
+              "mux_tree": mux_tree,
+              "decoder": decoder,
+              "parity_tree": parity_tree,
+              "random_dag": random_dag}
+
+#===================================================================================================================================
+#  Functions
+#===================================================================================================================================
+
+def get_args():
+    parser = argparse.ArgumentParser(description='v' + VERSION + ' - Benchmarks the simulator on generated synthetic circuits.')
+    parser.add_argument('--suite',
+                        choices=sorted(SUITES),
+                        default='default',
+                        dest='suite',
+                        help='set of circuits to benchmark (default: default)')
+    parser.add_argument('-o', '--out',
+                        dest='output_file',
+                        help='output the JSON report to the specified file instead of printing it to console')
+    parser.add_argument('-r', '--repeat',
+                        type=int,
+                        default=3,
+                        dest='repeat',
+                        help='number of times each stage is timed, keeping the fastest time (default: 3)')
+    parser.add_argument('--circuit-dir',
+                        dest='circuit_dir',
+                        help='keep the generated circuit files in the specified directory instead of a temporary directory')
+    parser.add_argument('--compare',
+                        dest='baseline_file',
+                        help='compare the evaluation speed against a previous JSON report and exit with status 1 on regressions')
+    parser.add_argument('--tolerance',
+                        type=float,
+                        default=0.1,
+                        dest='tolerance',
+                        help='fraction of the baseline rows/sec a benchmark may lose before it counts as a regression '
+                             '(default: 0.1)')
+
+    return parser.parse_args()
+
+def benchmark_circuit(circuit_file, output_names, repeat):
+    """Time each stage of generating the truth table of a circuit file.
+
+    Returns a dict with the size of the circuit and the fastest wall time of each stage in seconds.
+
+    Keyword arguments:
+    circuit_file -- Path to the circuit file
+    output_names -- List of names of the output gates
+    repeat       -- Number of times each stage is timed
+    """
+    output_file = os.path.splitext(circuit_file)[0] + ".txt"
+    times = {"parse": [], "index": [], "compile": [], "optimize": [], "evaluate": [], "output": []}
+    for i in range(repeat):
+        # Time parsing, indexing, compiling, and optimizing the circuit file.
+        circuit = Circuit(circuit_file, output_file, False)
+        for stage, stage_time in circuit.get_stage_times().items():
+            times[stage].append(stage_time)
+        outputs = [circuit.get_gate_index_by_name(name) for name in output_names]
+
+        # Time evaluating the packed truth table without formatting it.
+        start_time = perf_counter()
+        for block in circuit.generate_packed_truth_table(outputs):
+            pass
+        evaluate_time = perf_counter() - start_time
+        times["evaluate"].append(evaluate_time)
+
+        # Time formatting and writing the whole truth table to a file.
+        if os.path.exists(output_file):
+            os.remove(output_file)
+        circuit.print_truth_table(outputs)
+        table_times = circuit.get_stats().stage_times
+        times["output"].append(table_times.get("format", 0.0) + table_times.get("write", 0.0))
+        os.remove(output_file)
+
+    # Report the fastest time of each stage, which is the least disturbed by other processes.
+    rows = circuit.get_num_of_combinations(outputs)
+    num_gates = circuit.get_num_of_evaluated_gates(outputs)
+    stage_times = {stage: min(stage_times) for stage, stage_times in times.items()}
+    evaluate_time = max(stage_times["evaluate"], 1e-9)
+    return {"num_inputs": len(circuit.get_truth_table_inputs(outputs)),
+            "num_gates": circuit.get_num_of_gates(),
+            "num_evaluated_gates": num_gates,
+            "num_outputs": len(outputs),
+            "rows": rows,
+            "times": stage_times,
+            "rows_per_second": rows / evaluate_time,
+            "gate_rows_per_second": rows * num_gates / evaluate_time}
+
+def run_suite(suite, circuit_dir, repeat):
+    """Generate and benchmark every circuit of a suite.
+
+    Keyword arguments:
+    suite       -- List of (circuit generator name, generator parameters)
+    circuit_dir -- Directory to write the generated circuit files to
+    repeat      -- Number of times each stage is timed
+    """
+    results = []
+    for generator_name, parameters in suite:
+        # Name the circuit after its generator and parameters (e.g. ripple_carry_adder-bits8).
+        name = "-".join([generator_name] + [key.replace("_", "") + str(value) for key, value in sorted(parameters.items())])
+        circuit_file = os.path.join(circuit_dir, name + ".in")
+        builder, output_names = GENERATORS[generator_name](**parameters)
+        builder.write(circuit_file)
+
+        result = {"name": name, "generator": generator_name, "parameters": parameters}
+        result.update(benchmark_circuit(circuit_file, output_names, repeat))
+        results.append(result)
+    return results
+
+def compare_reports(report, baseline, tolerance):
+    """Compare the evaluation speed of each benchmark against a baseline report.
+
+    Returns the list of names of the benchmarks that regressed.
+
+    Keyword arguments:
+    report    -- Current benchmark report
+    baseline  -- Previous benchmark report
+    tolerance -- Fraction of the baseline rows/sec a benchmark may lose before it counts as a regression
+    """
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        if result["name"] in baseline_results:
+            baseline_speed = baseline_results[result["name"]]["rows_per_second"]
+            ratio = result["rows_per_second"] / baseline_speed
+            print("INFO::  " + result["name"] + ": " + format(ratio, ".2f") + "x baseline rows/sec")
+            if ratio < 1 - tolerance:
+                regressions.append(result["name"])
+    return regressions
+
+def main():
+    # Parse the command-line arguments.
+    args = get_args()
+    if args.repeat < 1:
+        print("ERROR:: The number of repeats must be at least 1.")
+        return 1
+
+    # Generate and benchmark the circuits, either in the requested directory or in a temporary one.
+    if args.circuit_dir:
+        os.makedirs(args.circuit_dir, exist_ok=True)
+        results = run_suite(SUITES[args.suite], args.circuit_dir, args.repeat)
+    else:
+        with tempfile.TemporaryDirectory() as circuit_dir:
+            results = run_suite(SUITES[args.suite], circuit_dir, args.repeat)
+
+    report = {"report_version": REPORT_VERSION,
+              "simulator_version": VERSION,
+              "python_version": platform.python_version(),
+              "platform": platform.platform(),
+              "suite": args.suite,
+              "repeat": args.repeat,
+              "results": results}
+
+    # Output the report.
+    if args.output_file:
+        with open(args.output_file, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+            output_file.write("\n")
+    else:
+        print(json.dumps(report, indent=2))
+
+    # Compare against the baseline report (if applicable).
+    if args.baseline_file:
+        with open(args.baseline_file) as baseline_file:
+            regressions = compare_reports(report, json.load(baseline_file), args.tolerance)
+        if regressions:
+            print("ERROR:: Evaluation regressed for " + ", ".join(regressions))
+            return 1
+    return 0
+
+#===================================================================================================================================
+#  Main Execution
+#===================================================================================================================================
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,236 @@
+#===================================================================================================================================
+#  File        : binarytable.py
+#  Project     : Combinational Logic Simulator
+#  Description : Write and read truth tables in a bit-packed binary format.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Memory-mapped file support
+# Reference: https://docs.python.org/3/library/mmap.html
+import mmap
+
+# Miscellaneous operating system interfaces
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# Interpret bytes as packed binary data
+# Reference: https://docs.python.org/3/library/struct.html
+import struct
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# File signature and format version at the start of every binary truth table
+BINARY_TABLE_MAGIC = b"CLSB"
+BINARY_TABLE_VERSION = 1
+
+# Header layout: signature, version, number of enumerated general inputs, and number of output columns
+BINARY_TABLE_HEADER = struct.Struct("<4sBII")
+
+# Layout of the number of each enumerated general input (i.e. n for In)
+BINARY_TABLE_INPUT = struct.Struct("<I")
+
+# Layout of the length prefix of each output name
+BINARY_TABLE_NAME_LENGTH = struct.Struct("<H")
+
+# Alignment (in bytes) of the start of the column data
+BINARY_TABLE_ALIGNMENT = 8
+
+#===================================================================================================================================
+#  Functions Definition
+#===================================================================================================================================
+
+def get_column_size(num_general_values):
+    """Get the number of bytes used by each packed output column.
+
+    Keyword arguments:
+    num_general_values -- Number of general input values
+    """
+    return max(1, (1 << num_general_values) // 8)
+
+#===================================================================================================================================
+#  Class Definition
+#===================================================================================================================================
+
+class BinaryTableWriter(object):
+    """Write a truth table as bit-packed output columns.
+
+    The file starts with a header holding the enumerated general inputs and the output names, followed by one column per output.
+    Bit r of a column (byte r // 8, bit r % 8) holds the output value for combination r. The general input values are not stored
+    because they are the bits of the combination index itself (the first enumerated input being the most significant bit).
+
+    Keyword arguments:
+    output_file -- Path to output file
+    inputs      -- List of enumerated general inputs (i.e. n for In)
+    names       -- List of output names
+    resume      -- Determines if the blocks already written to the output file are kept instead of starting a new file
+    """
+    def __init__(self, output_file, inputs, names, resume=False):
+        self.__file = open(output_file, "r+b" if resume else "wb")
+        self.__num_outputs = len(names)
+        self.__column_size = get_column_size(len(inputs))
+
+        # Write the header followed by the enumerated general inputs and the length-prefixed output names.
+        header = [BINARY_TABLE_HEADER.pack(BINARY_TABLE_MAGIC, BINARY_TABLE_VERSION, len(inputs), len(names))]
+        for input in inputs:
+            header.append(BINARY_TABLE_INPUT.pack(input))
+        for name in names:
+            encoded_name = name.encode("utf-8")
+            header.append(BINARY_TABLE_NAME_LENGTH.pack(len(encoded_name)))
+            header.append(encoded_name)
+        header = b"".join(header)
+
+        # Pad the header so the column data is aligned, then reserve the space for every column (unless the file is resumed, in
+        # which case it must already hold the same header).
+        self.__data_offset = -(-len(header) // BINARY_TABLE_ALIGNMENT) * BINARY_TABLE_ALIGNMENT
+        if resume:
+            if self.__file.read(self.__data_offset) != header.ljust(self.__data_offset, b"\0"):
+                self.close()
+                raise ValueError("Output file \"" + output_file + "\" does not hold the same binary truth table header")
+        else:
+            self.__file.write(header.ljust(self.__data_offset, b"\0"))
+        self.__file.truncate(self.__data_offset + self.__num_outputs * self.__column_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def write_block(self, block_start, block_size, packed_values):
+        """Write the packed output values for a block of consecutive combinations.
+
+        Keyword arguments:
+        block_start   -- Index of the first combination in the block (a multiple of 8 unless it is the only block)
+        block_size    -- Number of combinations in the block
+        packed_values -- List of packed values for each output, where bit r holds the value for combination block_start + r
+        """
+        num_bytes = max(1, block_size // 8)
+        for i in range(self.__num_outputs):
+            self.__file.seek(self.__data_offset + i * self.__column_size + block_start // 8)
+            self.__file.write(packed_values[i].to_bytes(num_bytes, "little"))
+
+    def sync(self):
+        """Force the written blocks to disk and get the size of the output file in bytes.
+
+        Keyword arguments:
+        <None>
+        """
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        return self.__data_offset + self.__num_outputs * self.__column_size
+
+    def close(self):
+        """Flush and close the output file.
+
+        Keyword arguments:
+        <None>
+        """
+        if self.__file:
+            self.__file.close()
+            self.__file = None
+
+class BinaryTableReader(object):
+    """Read a bit-packed binary truth table through a memory map.
+
+    Any row or output column can be accessed directly without loading the whole file.
+
+    Keyword arguments:
+    file -- Binary truth table file to read
+    """
+    def __init__(self, file):
+        with open(file, "rb") as file_content:
+            self.__map = mmap.mmap(file_content.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Read and validate the header.
+        magic, version, self.num_general_values, num_outputs = BINARY_TABLE_HEADER.unpack_from(self.__map, 0)
+        if magic != BINARY_TABLE_MAGIC or version != BINARY_TABLE_VERSION:
+            self.close()
+            raise ValueError("\"" + file + "\" is not a supported binary truth table")
+
+        # Read the enumerated general inputs.
+        offset = BINARY_TABLE_HEADER.size
+        self.inputs = []
+        for i in range(self.num_general_values):
+            self.inputs.append(BINARY_TABLE_INPUT.unpack_from(self.__map, offset)[0])
+            offset = offset + BINARY_TABLE_INPUT.size
+
+        # Read the length-prefixed output names.
+        self.names = []
+        for i in range(num_outputs):
+            length = BINARY_TABLE_NAME_LENGTH.unpack_from(self.__map, offset)[0]
+            offset = offset + BINARY_TABLE_NAME_LENGTH.size
+            self.names.append(self.__map[offset:offset + length].decode("utf-8"))
+            offset = offset + length
+
+        self.num_rows = 1 << self.num_general_values
+        self.__column_size = get_column_size(self.num_general_values)
+        self.__data_offset = -(-offset // BINARY_TABLE_ALIGNMENT) * BINARY_TABLE_ALIGNMENT
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.num_rows
+
+    def get_value(self, row, output):
+        """Get the value of an output for a single combination.
+
+        Keyword arguments:
+        row    -- Index of the combination
+        output -- Index of the output column
+        """
+        byte = self.__map[self.__data_offset + output * self.__column_size + (row >> 3)]
+        return (byte >> (row & 7)) & 1
+
+    def get_combination(self, row):
+        """Get the values of the enumerated general inputs of a combination.
+
+        Keyword arguments:
+        row -- Index of the combination
+        """
+        return tuple([(row >> (self.num_general_values - 1 - i)) & 1 for i in range(self.num_general_values)])
+
+    def get_row(self, row):
+        """Get a row of the truth table as a (combination, output values) tuple.
+
+        Keyword arguments:
+        row -- Index of the combination
+        """
+        if row < 0 or row >= self.num_rows:
+            raise IndexError("Row " + str(row) + " is out of range")
+        return self.get_combination(row), tuple([self.get_value(row, i) for i in range(len(self.names))])
+
+    def get_column(self, output):
+        """Get the packed bytes of an output column, where bit r holds the value for combination r.
+
+        Keyword arguments:
+        output -- Index or name of the output column
+        """
+        if isinstance(output, str):
+            output = self.names.index(output.upper())
+        start = self.__data_offset + output * self.__column_size
+        return self.__map[start:start + self.__column_size]
+
+    def close(self):
+        """Close the memory map.
+
+        Keyword arguments:
+        <None>
+        """
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
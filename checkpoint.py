@@ -0,0 +1,134 @@
+#===================================================================================================================================
+#  File        : checkpoint.py
+#  Project     : Combinational Logic Simulator
+#  Description : Checkpoint truth tables written to files so interrupted runs can resume.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# JSON encoder and decoder
+# Reference: https://docs.python.org/3/library/json.html
+import json
+
+# Miscellaneous operating system interfaces
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# Time access and conversions
+# Reference: https://docs.python.org/3/library/time.html
+from time import perf_counter
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Minimum number of seconds between checkpoints of a truth table
+CHECKPOINT_INTERVAL = 60.0
+
+# Version of the checkpoint file format (increment whenever its fields change)
+CHECKPOINT_VERSION = 1
+
+# Extension appended to the output file to name its checkpoint file
+CHECKPOINT_EXTENSION = ".checkpoint"
+
+#===================================================================================================================================
+#  Class Definition
+#===================================================================================================================================
+
+class Checkpoint(object):
+    """Periodically record how far a truth table was written to its output file.
+
+    Each checkpoint holds the number of rows fully written and the size of the output file at that point, and is saved next to
+    the output file (e.g. table.txt.checkpoint) only after the output is forced to disk, so it never claims rows that could be lost.
+    The checkpoint also holds a fingerprint of the truth table (circuit file, outputs, and format), so a run is only resumed into
+    the same truth table. The checkpoint file is removed once the truth table is done.
+
+    Keyword arguments:
+    output_file -- Path to output file of the truth table
+    fingerprint -- JSON-serializable dict identifying the truth table
+    interval    -- Minimum number of seconds between checkpoints
+    """
+    def __init__(self, output_file, fingerprint, interval=CHECKPOINT_INTERVAL):
+        self.file = output_file + CHECKPOINT_EXTENSION
+        self.__output_file = output_file
+        self.__fingerprint = fingerprint
+        self.__interval = interval
+        self.__last_save_time = perf_counter()
+
+    def exists(self):
+        """Determine if a checkpoint file was left by an interrupted truth table.
+
+        Keyword arguments:
+        <None>
+        """
+        return os.path.isfile(self.file)
+
+    def load(self):
+        """Load the (rows done, output file size) of the last checkpoint (None if there is no checkpoint).
+
+        Raises a ValueError if the checkpoint belongs to a different truth table or does not match the output file.
+
+        Keyword arguments:
+        <None>
+        """
+        if not self.exists():
+            return None
+
+        # Read the checkpoint and ensure it was saved for the same truth table.
+        try:
+            with open(self.file) as checkpoint_file:
+                state = json.load(checkpoint_file)
+            rows_done = int(state["rows_done"])
+            offset = int(state["offset"])
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            raise ValueError("Cannot read checkpoint \"" + self.file + "\": " + str(error))
+        if state.get("version") != CHECKPOINT_VERSION or state.get("fingerprint") != self.__fingerprint:
+            raise ValueError("Checkpoint \"" + self.file + "\" was saved for a different circuit, selection, or format")
+
+        # The output file must still hold every byte written before the checkpoint.
+        if not os.path.isfile(self.__output_file) or os.path.getsize(self.__output_file) < offset:
+            raise ValueError("Output file \"" + self.__output_file + "\" is shorter than its checkpoint")
+        return rows_done, offset
+
+    def update(self, rows_done, writer):
+        """Save a checkpoint if the interval passed since the last one.
+
+        Keyword arguments:
+        rows_done -- Number of rows fully passed to the writer
+        writer    -- Writer of the output file, providing sync()
+        """
+        if perf_counter() - self.__last_save_time >= self.__interval:
+            self.save(rows_done, writer)
+
+    def save(self, rows_done, writer):
+        """Force the written rows to disk, then atomically replace the checkpoint file.
+
+        Keyword arguments:
+        rows_done -- Number of rows fully passed to the writer
+        writer    -- Writer of the output file, providing sync()
+        """
+        state = {"version": CHECKPOINT_VERSION, "fingerprint": self.__fingerprint, "rows_done": rows_done, "offset": writer.sync()}
+        temporary_file = self.file + ".tmp"
+        with open(temporary_file, "w") as checkpoint_file:
+            json.dump(state, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temporary_file, self.file)
+        self.__last_save_time = perf_counter()
+
+    def remove(self):
+        """Remove the checkpoint file (if applicable).
+
+        Keyword arguments:
+        <None>
+        """
+        if self.exists():
+            os.remove(self.file)
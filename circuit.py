@@ -14,22 +14,128 @@
 #  Existing Python Modules
 #-----------------------------------------------------------------------------------------------------------------------------------
 
+# Efficient arrays of numeric values
+# Reference: https://docs.python.org/3/library/array.html
+from array import array
+
+# Array bisection algorithm
+# Reference: https://docs.python.org/3/library/bisect.html
+from bisect import bisect_left
+
+# Garbage collector interface
+# Reference: https://docs.python.org/3/library/gc.html
+import gc
+
+# Secure hashes and message digests
+# Reference: https://docs.python.org/3/library/hashlib.html
+import hashlib
+
 # Functions creating iterators for efficient looping
 # Reference: https://docs.python.org/2/library/itertools.html
 from itertools import *
 
+# Process-based parallelism
+# Reference: https://docs.python.org/3/library/multiprocessing.html
+from multiprocessing import Pool
+
+# Miscellaneous operating system interfaces
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# Generate pseudo-random numbers
+# Reference: https://docs.python.org/3/library/random.html
+from random import Random
+
+# Share repeated strings in memory
+# Reference: https://docs.python.org/3/library/sys.html#sys.intern
+from sys import intern
+
+# Time access and conversions
+# Reference: https://docs.python.org/3/library/time.html
+from time import perf_counter
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Optional Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Fundamental package for array computing (only needed to simulate input vectors)
+# Reference: https://numpy.org/doc/stable/
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 #-----------------------------------------------------------------------------------------------------------------------------------
 #  Custom Modules
 #-----------------------------------------------------------------------------------------------------------------------------------
 
+# Bit-packed binary truth tables
+# Reference: binarytable.py
+from binarytable import BinaryTableWriter
+
+# Checkpoints of truth tables written to files
+# Reference: checkpoint.py
+from checkpoint import Checkpoint, CHECKPOINT_INTERVAL
+
 # Logic gate simulation
 # Reference: gate.py
-from gate import Gate
+from gate import Gate, GATE_TYPES, GATE_TYPE_CODES, get_kernels, get_packed_expression
+
+# Event-driven simulation of single input vectors
+# Reference: simulator.py
+from simulator import Simulator
+
+# Progress and performance of generating truth tables
+# Reference: stats.py
+from stats import TruthTableStats, PROGRESS_INTERVAL
 
 # Handle basic system operations
 # Reference: system.py
 from system import *
 
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Maximum number of bits used to index the combinations evaluated together in one packed block (i.e. 2^12 combinations per block)
+MAX_BLOCK_BITS = 12
+
+# Version of the compiled circuit format stored in netlist caches (increment whenever the compiled attributes change)
+NETLIST_CACHE_VERSION = 6
+
+# Attributes holding a compiled circuit, which are stored in and restored from netlist caches
+COMPILED_ATTRIBUTES = ("_Circuit__gate_ids", "_Circuit__gate_names", "_Circuit__gate_type_codes", "_Circuit__num_general_values",
+                       "_Circuit__fan_in_offsets", "_Circuit__fan_in_slots", "_Circuit__fan_out_offsets", "_Circuit__fan_out_gates",
+                       "_Circuit__levels", "_Circuit__evaluation_plan", "_Circuit__topological_order", "_Circuit__output_slots")
+
+# Array type code of the gate IDs, gate input references, and value slots of the compact netlist (signed 64-bit ints)
+NETLIST_ARRAY_TYPE = "q"
+
+# Gate types sharing a base operation, as (base type, inverted type)
+GATE_TYPE_FAMILIES = {"AND": ("AND", "NAND"), "NAND": ("AND", "NAND"), "OR": ("OR", "NOR"), "NOR": ("OR", "NOR"),
+                      "XOR": ("XOR", "XNOR"), "XNOR": ("XOR", "XNOR"), "BUFFER": ("BUFFER", "NOT"), "NOT": ("BUFFER", "NOT")}
+
+# Number of packed blocks of combinations in each range evaluated by a worker process
+PARALLEL_RANGE_BLOCKS = 16
+
+# Orders in which the combinations of the truth table can be enumerated:
+#   blocks      -- Binary order, evaluating packed blocks of combinations at once
+#   gray        -- Gray-code order, flipping a single input and re-evaluating only its fan-out cone between rows
+#   gray-binary -- Gray-code evaluation like gray, reordered back to binary order (buffers the whole truth table in memory)
+ENUMERATIONS = ("blocks", "gray", "gray-binary")
+
+# Maximum number of bytes of the unpacked values or printed rows of each batch of input vectors
+VECTOR_BATCH_BYTES = 16 * OUTPUT_BUFFER_SIZE
+
+# Circuit shared with each worker process of a parallel truth table
+worker_circuit = None
+
+# Translation table from unpacked bit characters to raw int bytes
+BIT_CHARACTERS_TO_INTS = bytes.maketrans(b"01", b"\x00\x01")
+
+# Start and end of the first line of every generated Python module
+PYTHON_MODULE_HEADER = ("# Generated from ", " by the Combinational Logic Simulator. Do not edit.")
+
 #===================================================================================================================================
 #  Class Definition
 #===================================================================================================================================
@@ -37,13 +143,96 @@ from system import *
 class Circuit(object):
     """Simulate combinational logic circuits.
 
+    The gates are kept in a compact netlist sorted by ID: arrays of gate IDs and type codes, a list of gate names, and the value
+    slots of each gate's inputs in one flat array, where the inputs of the gate at index i run from fan_in_offsets[i] to
+    fan_in_offsets[i + 1]. Slots 0 to n - 1 hold the general input values and slot n + i holds the value of the gate at index i.
+    Gate objects are only created on demand (see get_gate()).
+
     Keyword arguments:
-    file -- Circuit file to read
+    file          -- Circuit file to read
+    output_file   -- Path to output file (None to print to console)
+    format_csv    -- Determines if the truth table is printed in CSV format
+    format_binary -- Determines if the truth table is output in bit-packed binary format (requires an output file)
+    prune_inputs  -- Determines if only the general inputs reaching the selected outputs are enumerated in the truth table
+    use_python    -- Determines if the truth table is evaluated by a generated straight-line Python function
+    cache         -- Netlist cache to restore the compiled circuit from and store it in (None to always parse the file)
+    optimize      -- Determines if duplicate, redundant, and constant gates are eliminated before evaluation
     """
-    def __init__(self, file, output_file, format_csv):
-        self.__parse_circuit_file(file)
+    def __init__(self, file, output_file, format_csv, format_binary=False, prune_inputs=False, use_python=False, cache=None,
+                 optimize=True):
+        self.__circuit_file = file
+        self.__optimize = optimize
+        self.__gate_name_indexes = None
+        self.__load_circuit(file, cache)
         self.__output_file = output_file
         self.__format_csv = format_csv
+        self.__format_binary = format_binary
+        self.__prune_inputs = prune_inputs
+        self.__use_python = use_python
+        self.__python_functions = {}
+        self.__progress_callback = None
+        self.__progress_interval = PROGRESS_INTERVAL
+        self.__checkpoint_interval = CHECKPOINT_INTERVAL
+        self.__held_inputs = {}
+        self.__stats = None
+
+    def __getstate__(self):
+        # Generated Python functions and progress callbacks cannot always be pickled, so worker processes go without them.
+        state = self.__dict__.copy()
+        state["_Circuit__python_functions"] = {}
+        state["_Circuit__progress_callback"] = None
+        state["_Circuit__stats"] = None
+        return state
+
+    def __load_circuit(self, file, cache):
+        """Load the compiled circuit from the netlist cache (if applicable) or parse and compile the circuit file.
+
+        The garbage collector is paused while loading, since the netlist only allocates objects that are kept until the circuit is
+        compiled and would otherwise trigger many full collections on large circuits.
+
+        Keyword arguments:
+        file  -- Circuit file to read
+        cache -- Netlist cache to restore the compiled circuit from and store it in (None to always parse the file)
+        """
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.__load_compiled_circuit(file, cache)
+        finally:
+            if is_gc_enabled:
+                gc.enable()
+
+    def __load_compiled_circuit(self, file, cache):
+        """Restore the compiled circuit from the netlist cache (if applicable) or parse and compile the circuit file.
+
+        Keyword arguments:
+        file  -- Circuit file to read
+        cache -- Netlist cache to restore the compiled circuit from and store it in (None to always parse the file)
+        """
+        # If the circuit file was already compiled, then simply restore it from the cache.
+        self.__stage_times = {}
+        start_time = perf_counter()
+        if cache:
+            key = cache.get_key(read_binary_file(file), (NETLIST_CACHE_VERSION, self.__optimize))
+            state = cache.get(key)
+            if state is not None:
+                self.__dict__.update(state)
+                self.__stage_times["cache"] = perf_counter() - start_time
+                return
+
+        # Otherwise, parse and compile the circuit file, then store it in the cache (if applicable).
+        self.__parse_circuit_file(file)
+        start_time = perf_counter()
+        self.__compile_circuit()
+        self.__stage_times["compile"] = perf_counter() - start_time
+
+        # Eliminate duplicate, redundant, and constant gates from the evaluation plan (if applicable).
+        if self.__optimize:
+            start_time = perf_counter()
+            self.__optimize_circuit()
+            self.__stage_times["optimize"] = perf_counter() - start_time
+        if cache:
+            cache.put(key, {name: self.__dict__[name] for name in COMPILED_ATTRIBUTES})
 
     def __parse_circuit_file(self, file):
         """Parse the circuit file.
@@ -51,104 +240,462 @@ class Circuit(object):
         Keyword arguments:
         file -- Circuit file to read
         """
+        start_time = perf_counter()
         self.__get_gates_from_file(file)
-        self.__sort_gates_by_id(0, len(self.__gates) - 1)
+        index_time = perf_counter()
+        self.__index_gates_by_id()
+        self.__stage_times["parse"] = index_time - start_time
+        self.__stage_times["index"] = perf_counter() - index_time
 
     def __get_gates_from_file(self, file):
-        """Get all the gates from the circuit file and store it in the circuit.
+        """Get all the gates from the circuit file and store them in the compact netlist.
+
+        The file is read one line at a time. Blank lines and comments (starting with #) are skipped, repeated names are interned,
+        and any invalid line is reported with its line number. Each gate input is stored as an int reference: the gate ID itself
+        for gate inputs, or ~k (i.e. -k - 1) for general input value Ik, so no input string is kept once its line is parsed.
 
         Keyword arguments:
         file -- Circuit file to read
         """
-        # Initialize a private list to hold logic gates.
-        self.__gates = []
-        
-        # Read the .in file and get each line.
-        file_content = read_file(file)
-        file_content_lines = file_content.splitlines()
-
-        # Parse each line for gate information.
-        for i in range(len(file_content_lines)):
-            # Get the gate information separated by whitespaces.
-            data = file_content_lines[i].split()
-            data_fields = []
-            gate_inputs = []
-
-            # Temporarily store each data field.
-            for j in range(len(data)):
-                # If j is 0, then store an int for the gate ID.
-                if j == 0:
-                    data_fields.append(int(data[j]))
-
-                # Else if j is greater than 2, then store the gate inputs.
-                elif j > 2:
-                    gate_inputs.append(data[j].upper())
-
-                # Otherwise, simply store either the name or type.
+        # Initialize the arrays holding the gates in file order, and track the line number of each gate ID.
+        self.__gate_ids = array(NETLIST_ARRAY_TYPE)
+        self.__gate_names = []
+        self.__gate_type_codes = array("B")
+        self.__fan_in_offsets = array(NETLIST_ARRAY_TYPE, [0])
+        self.__fan_in_references = array(NETLIST_ARRAY_TYPE)
+        self.__gate_line_numbers = array(NETLIST_ARRAY_TYPE)
+        first_line_numbers = {}
+        num_general_values = 0
+
+        # Parse each line of the .in file for gate information.
+        with open(file) as lines:
+            for line_number, line in enumerate(lines, 1):
+                # Get the gate information separated by whitespaces, ignoring any comment.
+                data = line.split("#", 1)[0].split()
+
+                # If the line is blank, then skip it.
+                if not data:
+                    continue
+
+                # Every gate needs at least an ID, a name, and a type.
+                if len(data) < 3:
+                    raise ValueError("Line " + str(line_number) + ": Expected a gate ID, name, type, and inputs")
+
+                # The gate ID must be a unique integer.
+                try:
+                    id = int(data[0])
+                    self.__gate_ids.append(id)
+                except (ValueError, OverflowError):
+                    raise ValueError("Line " + str(line_number) + ": Invalid gate ID \"" + data[0] + "\"")
+                if id in first_line_numbers:
+                    raise ValueError("Line " + str(line_number) + ": Duplicate gate ID " + str(id)
+                                     + " (first defined on line " + str(first_line_numbers[id]) + ")")
+
+                # The gate type must be supported.
+                code = GATE_TYPE_CODES.get(data[2].upper())
+                if code is None:
+                    raise ValueError("Line " + str(line_number) + ": Invalid gate type \"" + data[2] + "\"")
+
+                # Each gate input must be either a general input value (e.g. I0) or a gate ID.
+                for token in data[3:]:
+                    input = token.upper()
+                    try:
+                        if input.isdigit():
+                            self.__fan_in_references.append(int(input))
+                        elif input.startswith("I") and input[1:].isdigit():
+                            general_value = int(input[1:])
+                            self.__fan_in_references.append(~general_value)
+                            if general_value >= num_general_values:
+                                num_general_values = general_value + 1
+                        else:
+                            raise ValueError
+                    except (ValueError, OverflowError):
+                        raise ValueError("Line " + str(line_number) + ": Invalid gate input \"" + token + "\"")
+
+                # NOT and BUFFER gates take exactly 1 input, and every other gate type takes at least 1 input.
+                num_inputs = len(data) - 3
+                if GATE_TYPES[code] in ("NOT", "BUFFER") and num_inputs != 1:
+                    raise ValueError("Line " + str(line_number) + ": " + GATE_TYPES[code] + " gate expects 1 input but got "
+                                     + str(num_inputs))
+                elif num_inputs < 1:
+                    raise ValueError("Line " + str(line_number) + ": " + GATE_TYPES[code] + " gate expects at least 1 input")
+
+                # Store the gate.
+                self.__gate_names.append(intern(data[1].upper()))
+                self.__gate_type_codes.append(code)
+                self.__fan_in_offsets.append(len(self.__fan_in_references))
+                self.__gate_line_numbers.append(line_number)
+                first_line_numbers[id] = line_number
+
+        self.__num_general_values = num_general_values
+
+    def __index_gates_by_id(self):
+        """Sort the gates of the netlist by ID.
+
+        If the IDs are compact (as with the convention of numbering from 0), then the gates are placed directly into a dense list
+        of ID slots in linear time. Otherwise, the sparse IDs are sorted with the built-in sort. Gates are then found by ID with a
+        binary search of the sorted IDs.
+
+        Keyword arguments:
+        <None>
+        """
+        ids = self.__gate_ids
+        num_gates = len(ids)
+        if num_gates > 0:
+            min_id = min(ids)
+            max_id = max(ids)
+
+            # If the IDs are compact, then place the file position of each gate in the slot of its ID and drop the unused slots.
+            if max_id - min_id < 2 * num_gates:
+                id_slots = [None] * (max_id - min_id + 1)
+                for position in range(num_gates):
+                    id_slots[ids[position] - min_id] = position
+                positions = [position for position in id_slots if position is not None]
+
+            # Otherwise, sort the file positions of the gates by their sparse IDs.
+            else:
+                positions = sorted(range(num_gates), key=ids.__getitem__)
+
+            # Reorder every array of the netlist by ID, unless the gates are already in order.
+            if positions != list(range(num_gates)):
+                offsets = self.__fan_in_offsets
+                references = self.__fan_in_references
+                self.__gate_ids = array(NETLIST_ARRAY_TYPE, [ids[position] for position in positions])
+                self.__gate_names = [self.__gate_names[position] for position in positions]
+                self.__gate_type_codes = array("B", [self.__gate_type_codes[position] for position in positions])
+                self.__gate_line_numbers = array(NETLIST_ARRAY_TYPE, [self.__gate_line_numbers[position] for position in positions])
+                self.__fan_in_offsets = array(NETLIST_ARRAY_TYPE, [0])
+                self.__fan_in_references = array(NETLIST_ARRAY_TYPE)
+                for position in positions:
+                    self.__fan_in_references.extend(references[offsets[position]:offsets[position + 1]])
+                    self.__fan_in_offsets.append(len(self.__fan_in_references))
+
+    def __compile_circuit(self):
+        """Compile the gates into a topologically ordered evaluation plan.
+
+        Every gate input is resolved once to an integer slot in a flat list of values, where slots 0 to n - 1 hold the general
+        input values and slot n + i holds the value of the gate at index i. The gates are then ordered so that each gate comes after
+        every gate feeding it, which lets each combination be evaluated in a single linear pass.
+
+        Keyword arguments:
+        <None>
+        """
+        num_general_values = self.__num_general_values
+        num_gates = len(self.__gate_ids)
+        offsets = self.__fan_in_offsets
+        references = self.__fan_in_references
+        gate_indexes = {id: i for i, id in enumerate(self.__gate_ids)}
+
+        # Resolve each gate input reference to a value slot and count the gates fed by each value slot.
+        slots = array(NETLIST_ARRAY_TYPE, references)
+        num_fan_out = [0] * (num_general_values + num_gates)
+        num_pending_inputs = [0] * num_gates
+        for i in range(num_gates):
+            for k in range(offsets[i], offsets[i + 1]):
+                reference = references[k]
+
+                # If the input is a general input value, then its slot is its general position.
+                if reference < 0:
+                    slot = ~reference
+
+                # Otherwise, the input must reference an existing gate ID.
+                else:
+                    if reference not in gate_indexes:
+                        raise ValueError("Line " + str(self.__gate_line_numbers[i]) + ": Gate " + str(self.__gate_ids[i]) + " ("
+                                         + self.__gate_names[i] + ") references an unknown gate ID " + str(reference))
+                    slot = num_general_values + gate_indexes[reference]
+                    num_pending_inputs[i] = num_pending_inputs[i] + 1
+                slots[k] = slot
+                num_fan_out[slot] = num_fan_out[slot] + 1
+
+        # Track the gates fed by each value slot in the same flat layout as the gate inputs, in order of gate index.
+        fan_out_offsets = array(NETLIST_ARRAY_TYPE, [0])
+        fan_out_offsets.extend(accumulate(num_fan_out))
+        fan_out_gates = array(NETLIST_ARRAY_TYPE, [0]) * len(slots)
+        next_positions = list(fan_out_offsets[:-1])
+        for i in range(num_gates):
+            for k in range(offsets[i], offsets[i + 1]):
+                fan_out_gates[next_positions[slots[k]]] = i
+                next_positions[slots[k]] = next_positions[slots[k]] + 1
+
+        # Sort the gates topologically, starting from the gates fed only by general input values.
+        order = [i for i in range(num_gates) if num_pending_inputs[i] == 0]
+        for i in order:
+            slot = num_general_values + i
+            for successor in fan_out_gates[fan_out_offsets[slot]:fan_out_offsets[slot + 1]]:
+                num_pending_inputs[successor] = num_pending_inputs[successor] - 1
+                if num_pending_inputs[successor] == 0:
+                    order.append(successor)
+
+        # If some gates were never reached, then they form a feedback loop, which is not combinational logic.
+        if len(order) < num_gates:
+            cycle_ids = [str(self.__gate_ids[i]) for i in range(num_gates) if num_pending_inputs[i] > 0]
+            raise ValueError("Circuit contains a feedback loop through gate(s) " + ", ".join(cycle_ids))
+
+        # Assign each gate a level one above the highest level of the gates feeding it (gates fed only by general input values
+        # are at level 0).
+        levels = array(NETLIST_ARRAY_TYPE, [0]) * num_gates
+        for i in order:
+            for slot in slots[offsets[i]:offsets[i + 1]]:
+                if slot >= num_general_values and levels[slot - num_general_values] >= levels[i]:
+                    levels[i] = levels[slot - num_general_values] + 1
+
+        # Store the evaluation plan as (gate index, type code, packed gate kernel, input slots) in topological order, where the
+        # value of each gate is read from its own slot. The line numbers and input references are no longer needed.
+        codes = self.__gate_type_codes
+        self.__fan_in_slots = slots
+        self.__fan_out_offsets = fan_out_offsets
+        self.__fan_out_gates = fan_out_gates
+        self.__levels = levels
+        self.__topological_order = array(NETLIST_ARRAY_TYPE, order)
+        self.__evaluation_plan = []
+        for i in order:
+            input_slots = slots[offsets[i]:offsets[i + 1]].tolist()
+            self.__evaluation_plan.append((i, codes[i], get_kernels(codes[i], len(input_slots))[1], input_slots))
+        self.__output_slots = [num_general_values + i for i in range(num_gates)]
+        del self.__gate_line_numbers
+        del self.__fan_in_references
+
+    def __optimize_circuit(self):
+        """Eliminate duplicate, redundant, and constant gates from the evaluation plan.
+
+        The gates are rewritten in topological order. BUFFER gates, double inverters, and gates left with a single input are
+        replaced by their input, constant inputs are folded, and gates of the same type with the same inputs are merged by hashing
+        their structure. Each gate keeps an output slot holding its value, so every gate can still be output by its original ID.
+
+        Keyword arguments:
+        <None>
+        """
+        num_general_values = self.__num_general_values
+        resolved_slots = list(range(num_general_values + len(self.__gate_ids)))
+        constant_values = {}
+        inverter_sources = {}
+        node_slots = {}
+        plan = []
+
+        def add_node(i, type, inputs):
+            """Get the slot of a gate with the structure, adding the gate to the plan if it is new."""
+            code = GATE_TYPE_CODES[type]
+            key = (code, tuple(inputs))
+            if key not in node_slots:
+                node_slots[key] = num_general_values + i
+                plan.append((i, code, get_kernels(code, len(inputs))[1], inputs))
+                if type == "NOT" and inputs:
+                    inverter_sources[num_general_values + i] = inputs[0]
+                elif not inputs and type != "NOT" and type != "BUFFER":
+                    constant_values[num_general_values + i] = 1 if type == "AND" or type == "NOR" or type == "XNOR" else 0
+            return node_slots[key]
+
+        def get_constant(i, value):
+            """Get the slot of a constant value."""
+            return add_node(i, "AND" if value else "OR", [])
+
+        def get_literal(i, slot, is_inverted):
+            """Get the slot of a value or its inverse."""
+            if slot in constant_values:
+                return get_constant(i, constant_values[slot] ^ is_inverted)
+            elif not is_inverted:
+                return slot
+            elif slot in inverter_sources:
+                return inverter_sources[slot]
+            else:
+                return add_node(i, "NOT", [slot])
+
+        for i, code, kernel, slots in self.__evaluation_plan:
+            type = GATE_TYPES[code]
+            base_type, inverted_type = GATE_TYPE_FAMILIES[type]
+            is_inverted = 1 if type == inverted_type else 0
+            inputs = [resolved_slots[slot] for slot in slots]
+
+            # NOT and BUFFER gates only use their first input.
+            if base_type == "BUFFER":
+                if inputs:
+                    slot = get_literal(i, inputs[0], is_inverted)
+                else:
+                    slot = add_node(i, type, inputs)
+
+            # An XOR gate is inverted by each constant 1 or inverted input, and each pair of identical inputs cancels out.
+            elif base_type == "XOR":
+                odd_inputs = set()
+                for input in inputs:
+                    if input in constant_values:
+                        is_inverted = is_inverted ^ constant_values[input]
+                        continue
+                    if input in inverter_sources:
+                        is_inverted = is_inverted ^ 1
+                        input = inverter_sources[input]
+                    odd_inputs.symmetric_difference_update([input])
+                if len(odd_inputs) > 1:
+                    slot = add_node(i, inverted_type if is_inverted else base_type, sorted(odd_inputs))
+                elif odd_inputs:
+                    slot = get_literal(i, odd_inputs.pop(), is_inverted)
+                else:
+                    slot = get_constant(i, is_inverted)
+
+            # An AND or OR gate is decided by any controlling constant input (0 for AND, 1 for OR) or any input next to its inverse,
+            # while other constant inputs and repeated inputs are dropped.
+            else:
+                controlling_value = 0 if base_type == "AND" else 1
+                unique_inputs = set()
+                is_decided = False
+                for input in inputs:
+                    if input in constant_values:
+                        is_decided = is_decided or constant_values[input] == controlling_value
+                    else:
+                        unique_inputs.add(input)
+                is_decided = is_decided or any([inverter_sources.get(input) in unique_inputs for input in unique_inputs])
+                if is_decided:
+                    slot = get_constant(i, controlling_value ^ is_inverted)
+                elif len(unique_inputs) > 1:
+                    slot = add_node(i, inverted_type if is_inverted else base_type, sorted(unique_inputs))
+                elif unique_inputs:
+                    slot = get_literal(i, unique_inputs.pop(), is_inverted)
                 else:
-                    data_fields.append(data[j].upper())
+                    slot = get_constant(i, (1 - controlling_value) ^ is_inverted)
+
+            resolved_slots[num_general_values + i] = slot
+
+        # Store the optimized evaluation plan, and read the value of each gate from the slot it was resolved to.
+        self.__evaluation_plan = plan
+        self.__output_slots = resolved_slots[num_general_values:]
+
+    def get_stage_times(self):
+        """Get the wall times in seconds spent loading the circuit.
 
-            # Merge the gate inputs into the data fields list.
-            data_fields.append(gate_inputs)
+        The times are returned as a dict with the "parse", "index" (sorting the gates by ID), "compile", and "optimize" (if
+        applicable) stages, or with the "cache" stage if the compiled circuit was restored from a netlist cache.
+
+        Keyword arguments:
+        <None>
+        """
+        return dict(self.__stage_times)
 
-            # Create a new Gate object and store it.
-            self.__gates.append(Gate(data_fields[0], data_fields[1], data_fields[2], data_fields[3]))
+    def get_netlist(self):
+        """Get the compiled gate graph of the circuit.
 
-    def __sort_gates_by_id(self, left, right):
-        """Sort the stored gates by ID using quick sort algorithm.
+        The graph is returned as a tuple of (number of general input values, input slots of each gate, gates fed by each value
+        slot, level of each gate, gate indexes in topological order). Slots 0 to n - 1 hold the general input values and slot
+        n + i holds the value of the gate at index i of get_gates(). The lists of input slots and fed gates are built on demand
+        from the compact netlist.
 
         Keyword arguments:
         <None>
         """
-        # Base Condition: If all left and right indexes have finished parsing, then do nothing.
-        if left == right:
-            pass
+        offsets = self.__fan_in_offsets
+        slots = self.__fan_in_slots
+        input_slots = [slots[offsets[i]:offsets[i + 1]].tolist() for i in range(len(self.__gate_ids))]
+        offsets = self.__fan_out_offsets
+        gates = self.__fan_out_gates
+        fan_out = [gates[offsets[slot]:offsets[slot + 1]].tolist() for slot in range(len(offsets) - 1)]
+        return (self.__num_general_values, input_slots, fan_out, self.__levels, self.__topological_order)
 
-        # Base Condition: If there are only 2 elements being compared, then simply check the order.
-        elif left == right - 1:
-            # If the gate's ID at left index is greater than that of the right, then swap the 2 gates.
-            if self.__gates[left].id > self.__gates[right].id:
-                temp = self.__gates[left]
-                self.__gates[left] = self.__gates[right]
-                self.__gates[right] = temp
+    def __get_evaluation(self, outputs):
+        """Get the evaluation plan and enumerated general inputs needed to calculate the outputs.
 
-        # Recursive Condition: Continue sorting the data.
+        Only the gates in the fan-in cone of the outputs are evaluated. If inputs are pruned, then only the general inputs reaching
+        the outputs are enumerated in the truth table; otherwise, all general inputs are enumerated. Held inputs are never enumerated.
+
+        Keyword arguments:
+        outputs -- List of gate indexes to output
+        """
+        # Walk back from the output slots through every input of the gates in the evaluation plan to find the fan-in cone.
+        num_general_values = self.__num_general_values
+        plan_input_slots = {step[0]: step[3] for step in self.__evaluation_plan}
+        is_in_cone = [False] * len(self.__gate_ids)
+        cone_inputs = set()
+        pending = [self.__output_slots[i] for i in outputs]
+        while pending:
+            slot = pending.pop()
+            if slot < num_general_values:
+                cone_inputs.add(slot)
+            elif not is_in_cone[slot - num_general_values]:
+                is_in_cone[slot - num_general_values] = True
+                pending.extend(plan_input_slots[slot - num_general_values])
+
+        # Keep only the gates in the cone, still in topological order.
+        plan = [step for step in self.__evaluation_plan if is_in_cone[step[0]]]
+        if self.__prune_inputs:
+            return plan, [i for i in sorted(cone_inputs) if i not in self.__held_inputs]
         else:
-            # Sum the ID values starting from the left index to the right index.
-            sum = 0
-            for i in range(left, right + 1):
-                sum = sum + self.__gates[i].id
-
-            # Calculate the average of the ID sum.
-            average = sum / (right - left + 1)
-
-            # Track the left and right pointers.
-            left_pointer = left
-            right_pointer = right
-
-            # Divide the list into 2 sub-lists (if applicable) while the left pointer is less than the right pointer.
-            while left_pointer < right_pointer:
-                # While the left pointer is less than the average, keep incrementing the left pointer.
-                while self.__gates[left_pointer].id < average:
-                    left_pointer = left_pointer + 1
-
-                # While the right pointer is greater than or equal to the average, keep incrementing the right pointer.
-                while self.__gates[right_pointer].id >= average:
-                    right_pointer = right_pointer - 1
-
-                # If the left pointer is less than the right pointer, then swap the gates at the left and right pointers.
-                if left_pointer < right_pointer:
-                    temp = self.__gates[left_pointer]
-                    self.__gates[left_pointer] = self.__gates[right_pointer]
-                    self.__gates[right_pointer] = temp
-
-            # If the left index is less than the right pointer, then sort the lower half sub-list.
-            if left < right_pointer:
-                self.__sort_gates_by_id(left, right_pointer)
-
-            # If the right pointer is less than the left pointer, then sort the upper half sub-list.
-            if right_pointer < left_pointer:
-                self.__sort_gates_by_id(left_pointer, right)
+            return plan, [i for i in range(num_general_values) if i not in self.__held_inputs]
+
+    def get_python_source(self, selected_outputs=None):
+        """Get the source of a Python module with a straight-line function evaluating the selected outputs (if applicable).
+
+        The function evaluate(inputs, mask=1) takes the list of packed values of every general input and returns the list of
+        packed values of the selected outputs, with one local variable assignment per gate in topological order. With the default
+        mask, it evaluates a single combination of 0 and 1 input values.
+
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        """
+        outputs = self.__get_output_indexes(selected_outputs)
+        plan, inputs = self.__get_evaluation(outputs)
+        num_general_values = self.__num_general_values
+
+        # Name the local variable of each value slot after its general input or gate index.
+        def get_variable(slot):
+            if slot < num_general_values:
+                return "i" + str(slot)
+            else:
+                return "g" + str(slot - num_general_values)
+
+        # Describe the module and the values it evaluates.
+        lines = [PYTHON_MODULE_HEADER[0] + "\"" + self.__circuit_file + "\"" + PYTHON_MODULE_HEADER[1],
+                 "",
+                 "# Gate names of the returned outputs",
+                 "OUTPUTS = " + repr([self.__gate_names[i] for i in outputs]),
+                 "",
+                 "def evaluate(inputs, mask=1):",
+                 "    \"\"\"Evaluate the packed values of the outputs from the packed values of every general input.\"\"\""]
+
+        # Read each general input used by the gates or output directly.
+        output_slots = [self.__output_slots[i] for i in outputs]
+        used_slots = set([slot for step in plan for slot in step[3]] + output_slots)
+        used_inputs = sorted([slot for slot in used_slots if slot < num_general_values])
+        for slot in used_inputs:
+            lines.append("    " + get_variable(slot) + " = inputs[" + str(slot) + "]")
+
+        # Assign each gate in topological order.
+        for i, code, kernel, slots in plan:
+            operands = [get_variable(slot) for slot in slots]
+            lines.append("    g" + str(i) + " = " + get_packed_expression(code, operands, "mask"))
+
+        # Return the outputs.
+        lines.append("    return [" + ", ".join([get_variable(slot) for slot in output_slots]) + "]")
+        return "\n".join(lines) + "\n"
+
+    def get_python_function(self, selected_outputs=None):
+        """Get a compiled straight-line Python function evaluating the selected outputs (if applicable).
+
+        See get_python_source() for the arguments of the function. Functions are only generated once per selection of outputs.
+
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        """
+        outputs = tuple(self.__get_output_indexes(selected_outputs))
+        if outputs not in self.__python_functions:
+            namespace = {}
+            exec(compile(self.get_python_source(outputs), "<circuit " + self.__circuit_file + ">", "exec"), namespace)
+            self.__python_functions[outputs] = namespace["evaluate"]
+        return self.__python_functions[outputs]
+
+    def export_python_module(self, file, selected_outputs=None):
+        """Export the straight-line Python function evaluating the selected outputs (if applicable) as a module.
+
+        An existing file is only overwritten if it is a previously generated module, so any other source file is never replaced.
+
+        Keyword arguments:
+        file             -- Path to the Python module to write
+        selected_outputs -- List of selected outputs
+        """
+        if os.path.exists(file):
+            with open(file, errors="replace") as module:
+                first_line = module.readline().rstrip("\n")
+            if not (first_line.startswith(PYTHON_MODULE_HEADER[0]) and first_line.endswith(PYTHON_MODULE_HEADER[1])):
+                raise ValueError("\"" + file + "\" already exists and was not generated by the simulator")
+        with open(file, "w") as module:
+            module.write(self.get_python_source(selected_outputs))
 
     def print_gates(self):
         """Print the gates in the current circuit sorted by ID.
@@ -161,216 +708,913 @@ class Circuit(object):
         print("-" * 80)
 
         # Print each gate.
-        for gate in self.__gates:
+        for i in range(len(self.__gate_ids)):
             # Print the gate's ID, name, and type.
-            print(str(gate.id).ljust(8) + gate.name.ljust(16)
-                  + gate.type.ljust(4) + " " * 4, end="")
+            print(str(self.__gate_ids[i]).ljust(8) + self.__gate_names[i].ljust(16)
+                  + GATE_TYPES[self.__gate_type_codes[i]].ljust(4) + " " * 4, end="")
 
             # Print the gate's inputs.
-            for input in gate.input:
+            for input in self.__get_input_names(i):
                 print(input.ljust(5) + "  ", end="")
             print()
 
     def get_gates(self):
-        """Get the gates in the current circuit.
+        """Get the gates in the current circuit sorted by ID.
+
+        A new Gate object is created for every gate on each call, so prefer get_gate() or get_netlist() for large circuits.
+
+        Keyword arguments:
+        <None>
+        """
+        return [self.get_gate(i) for i in range(len(self.__gate_ids))]
+
+    def get_gate(self, index):
+        """Create a Gate object for a gate of the circuit.
+
+        Keyword arguments:
+        index -- Index of the gate in the sorted list of gates
+        """
+        return Gate(self.__gate_ids[index], self.__gate_names[index], GATE_TYPES[self.__gate_type_codes[index]],
+                    self.__get_input_names(index))
+
+    def get_num_of_gates(self):
+        """Get the number of gates in the current circuit.
 
         Keyword arguments:
         <None>
         """
-        return self.__gates
+        return len(self.__gate_ids)
+
+    def get_gate_type_codes(self):
+        """Get the array of the type code of each gate (see GATE_TYPES), indexed like get_gates().
+
+        Keyword arguments:
+        <None>
+        """
+        return self.__gate_type_codes
+
+    def get_gate_index(self, id):
+        """Get the index of a gate in the sorted list of gates from its ID.
+
+        Returns None if no gate has the ID.
 
-    def print_truth_table(self, selected_outputs):
+        Keyword arguments:
+        id -- Gate ID
+        """
+        index = bisect_left(self.__gate_ids, id)
+        if index < len(self.__gate_ids) and self.__gate_ids[index] == id:
+            return index
+        return None
+
+    def get_gate_index_by_name(self, name):
+        """Get the index of a gate in the sorted list of gates from its name (case-insensitive).
+
+        Returns None if no gate has the name. If several gates share the name, then the one with the lowest ID is used.
+
+        Keyword arguments:
+        name -- Gate name
+        """
+        # Map each gate name to its index in the sorted list of gates the first time a gate is looked up by name.
+        if self.__gate_name_indexes is None:
+            self.__gate_name_indexes = {}
+            for i in range(len(self.__gate_names)):
+                self.__gate_name_indexes.setdefault(self.__gate_names[i], i)
+        return self.__gate_name_indexes.get(name.upper())
+
+    def set_progress_callback(self, callback, interval=PROGRESS_INTERVAL):
+        """Set a function to call with the TruthTableStats of each truth table while it is printed.
+
+        The callback is called at most once per interval while the rows are printed, and once more when the truth table is done.
+
+        Keyword arguments:
+        callback -- Function taking a TruthTableStats (None to remove the callback)
+        interval -- Minimum number of seconds between periodic callbacks
+        """
+        self.__progress_callback = callback
+        self.__progress_interval = interval
+
+    def set_checkpoint_interval(self, interval):
+        """Set the minimum number of seconds between checkpoints of truth tables written to files.
+
+        Keyword arguments:
+        interval -- Minimum number of seconds between checkpoints
+        """
+        self.__checkpoint_interval = interval
+
+    def set_held_inputs(self, held_inputs):
+        """Hold general inputs at constant values while the truth table enumerates the rest.
+
+        Held inputs are left out of the combinations (like pruned inputs), so the truth table has 2^k rows for the k general inputs
+        still enumerated. Input vectors given to simulate_vectors() are simulated as is.
+
+        Keyword arguments:
+        held_inputs -- Dict of {general input position: value} (empty to enumerate every general input again)
+        """
+        for input, value in held_inputs.items():
+            if input < 0 or input >= self.__num_general_values:
+                raise ValueError("General input I" + str(input) + " is out of range")
+            if value != 0 and value != 1:
+                raise ValueError("General input I" + str(input) + " must be held at 0 or 1")
+        self.__held_inputs = dict(held_inputs)
+
+    def get_held_inputs(self):
+        """Get the general inputs held at constant values as a dict of {general input position: value}.
+
+        Keyword arguments:
+        <None>
+        """
+        return dict(self.__held_inputs)
+
+    def get_stats(self):
+        """Get the TruthTableStats of the last printed truth table (None if no truth table was printed yet).
+
+        Keyword arguments:
+        <None>
+        """
+        return self.__stats
+
+    def print_truth_table(self, selected_outputs, jobs=1, enumeration="blocks", resume=False, start=0, stop=None):
         """Print the truth table with the selected outputs (if applicable).
 
-        If no outputs are selected, then all gates will be printed.
+        If no outputs are selected, then all gates will be printed. If more than 1 job is requested, then contiguous ranges of
+        combinations are evaluated in parallel by a pool of worker processes and printed back in order. The progress and wall time
+        of each stage are tracked in a TruthTableStats (see get_stats() and set_progress_callback()).
+
+        When the truth table is output to a file with the blocks enumeration, a Checkpoint is saved periodically (see
+        set_checkpoint_interval()) and removed once the truth table is done. If resuming, then the output file is truncated to the
+        last checkpoint and the truth table continues from the next row, or starts over in a new file if there is no checkpoint.
+        Otherwise, the output file is overwritten, unless it still has the checkpoint of an interrupted truth table (which raises a
+        ValueError rather than losing the rows written so far).
+
+        A contiguous range of rows can be printed instead of the whole truth table (only for the blocks enumeration in a text
+        format), e.g. rows 2^30 to 2^30 + 2^20 of a truth table too large to print in full.
 
         Keyword arguments:
         selected_outputs -- List of selected outputs
+        jobs             -- Number of worker processes to evaluate the truth table with (only for the blocks enumeration)
+        enumeration      -- Order in which the combinations are enumerated (see ENUMERATIONS, only blocks for the binary format)
+        resume           -- Determines if the truth table continues from the checkpoint of its output file
+        start            -- Index of the first combination to print
+        stop             -- Index after the last combination to print (None to print through the last combination)
         """
-        # Get the number of general input values.
-        num_general_values = self.get_num_of_general_input_values()
+        # Gray-code enumerations simulate one combination at a time in this process, so they only print text formats.
+        if enumeration not in ENUMERATIONS:
+            raise ValueError("Unknown enumeration \"" + str(enumeration) + "\" (expected one of " + ", ".join(ENUMERATIONS) + ")")
+        if enumeration != "blocks" and (self.__format_binary or jobs > 1):
+            raise ValueError("The " + enumeration + " enumeration requires a text format and a single job")
+
+        # Get the indexes of the gates to print and the range of combinations to print.
+        outputs = self.__get_output_indexes(selected_outputs)
+        num_combinations = self.get_num_of_combinations(outputs)
+        if stop is None:
+            stop = num_combinations
+        if start < 0 or start > stop or stop > num_combinations:
+            raise ValueError("Row range " + str(start) + " to " + str(stop) + " is outside of the " + str(num_combinations)
+                             + " combinations")
+        if start > 0 or stop < num_combinations:
+            if enumeration != "blocks" or self.__format_binary:
+                raise ValueError("Row ranges require the blocks enumeration and a text format")
+
+        # Load the checkpoint of the output file (if applicable).
+        checkpoint = None
+        state = None
+        if self.__output_file and enumeration == "blocks":
+            checkpoint = Checkpoint(self.__output_file, self.__get_checkpoint_fingerprint(outputs, start, stop),
+                                    self.__checkpoint_interval)
+            if resume:
+                state = checkpoint.load()
+            elif checkpoint.exists():
+                raise ValueError("Checkpoint \"" + checkpoint.file + "\" of an interrupted truth table already exists (resume it, or "
+                                 "remove the checkpoint to start over)")
+        elif resume:
+            raise ValueError("Resuming requires an output file and the blocks enumeration")
+        start, resume_offset = state if state else (start, 0)
+
+        # Start tracking the stats of the rows left in the truth table.
+        self.__stats = TruthTableStats(stop - start, self.__stage_times, self.__progress_callback, self.__progress_interval)
+
+        # If the truth table is in binary format, then simply write the packed values of each block.
+        if self.__format_binary:
+            self.__write_binary_truth_table(outputs, jobs, checkpoint, start, state is not None)
+            self.__stats.finish()
+            return
+
+        # Open the output once for the whole truth table.
+        stats = self.__stats
+        with OutputWriter(self.__output_file, resume_offset=resume_offset) as writer:
+            # Print the truth table headers, unless they were written before the checkpoint.
+            if state is None:
+                self.__print_truth_table_headers(writer, self.get_truth_table_inputs(outputs), outputs)
+
+            # If the combinations are enumerated in Gray-code order, then print each batch of rows as they are simulated.
+            if enumeration != "blocks":
+                row_format = self.__get_row_format(self.get_truth_table_inputs(outputs), outputs)
+                rows = self.generate_gray_code_rows(outputs, enumeration == "gray-binary")
+                while True:
+                    start_time = perf_counter()
+                    batch = list(islice(rows, 1 << MAX_BLOCK_BITS))
+                    if not batch:
+                        break
+                    format_time = perf_counter()
+                    text = "".join([row_format.format(*combination, *gate_values) for combination, gate_values in batch])
+                    write_time = perf_counter()
+                    writer.write(text)
+                    stats.add_time("evaluate", format_time - start_time)
+                    stats.add_time("format", write_time - format_time)
+                    stats.add_time("write", perf_counter() - write_time)
+                    stats.add_rows(len(batch))
+
+            # Otherwise, print the rows of each range of combinations in order. Rows formatted by worker processes are counted
+            # as evaluation time, since the evaluation happens in the same workers.
+            else:
+                results = self.__map_row_ranges(format_truth_table_rows_in_worker, self.format_truth_table_rows, outputs, jobs,
+                                                start, stop)
+                num_plan_gates = len(self.__get_evaluation(outputs)[0])
+                block_size = 1 << min(len(self.get_truth_table_inputs(outputs)), MAX_BLOCK_BITS)
+                rows_done = start
+                try:
+                    for start, stop, rows in stats.time_iterations(results, "format" if jobs <= 1 else "evaluate", "evaluate"):
+                        write_time = perf_counter()
+                        writer.write(rows)
+                        rows_done = stop
+                        if checkpoint:
+                            checkpoint.update(rows_done, writer)
+                        stats.add_time("write", perf_counter() - write_time)
+                        stats.add_rows(stop - start, num_plan_gates * -(-(stop - start) // block_size),
+                                       num_plan_gates * (stop - start))
+
+                # If the truth table is interrupted, then save the rows written so far before stopping.
+                except KeyboardInterrupt:
+                    if checkpoint:
+                        checkpoint.save(rows_done, writer)
+                    raise
+        if checkpoint:
+            checkpoint.remove()
+        stats.finish()
+
+    def get_truth_table_inputs(self, selected_outputs=None):
+        """Get the general inputs enumerated in the truth table with the selected outputs (if applicable).
+
+        These are all general inputs, unless inputs are pruned to only those reaching the selected outputs.
 
-        # Print the truth table headers.
-        self.__print_truth_table_headers(num_general_values, selected_outputs)
-                    
-        # Calculate the values of each gate and print the outputs of the selected gates (if applicable) in the truth table for
-        # 2^n combinations.
-        for combination in product([0, 1], repeat=num_general_values):
-            gate_values = self.__calculate_outputs_for_combinations(combination)
-            self.__print_gate_outputs(combination, selected_outputs, gate_values)
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        """
+        return self.__get_evaluation(self.__get_output_indexes(selected_outputs))[1]
 
-    def __print_truth_table_headers(self, num_bits, selected_outputs):
-        """Print the headers of the truth table.
+    def get_num_of_evaluated_gates(self, selected_outputs=None):
+        """Get the number of gates evaluated for each combination of the truth table with the selected outputs (if applicable).
 
         Keyword arguments:
-        num_bits         -- Max number of combination inputs
         selected_outputs -- List of selected outputs
         """
-        # Print the headers for the general combinations.
-        for i in range(num_bits):
-            if self.__format_csv:
-                print_or_output("I" + str(i) + ",", self.__output_file)
+        return len(self.__get_evaluation(self.__get_output_indexes(selected_outputs))[0])
+
+    def get_num_of_combinations(self, selected_outputs=None):
+        """Get the number of combinations in the truth table with the selected outputs (if applicable).
+
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        """
+        return 1 << len(self.get_truth_table_inputs(selected_outputs))
+
+    def generate_truth_table_rows(self, selected_outputs=None, batch_size=None, start=0, stop=None):
+        """Generate the rows of the truth table with the selected outputs (if applicable).
+
+        Rows are generated lazily in order as (combination, gate values) tuples of ints, so the truth table can be consumed in
+        constant memory. If no outputs are selected, then the values of all gates will be generated. Each combination holds the
+        values of the general inputs given by get_truth_table_inputs().
+
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        batch_size       -- Number of rows to generate together in a list (None to generate single rows)
+        start            -- Index of the first combination to generate
+        stop             -- Index after the last combination to generate (None to generate through the last combination)
+        """
+        outputs = self.__get_output_indexes(selected_outputs)
+        num_general_values = len(self.get_truth_table_inputs(outputs))
+        rows = self.__generate_rows(outputs, start, stop)
+
+        # If no batch size was given, then generate each row on its own.
+        if batch_size is None:
+            for row in rows:
+                yield row[:num_general_values], row[num_general_values:]
+
+        # Otherwise, generate lists of up to batch_size rows.
+        else:
+            while True:
+                batch = [(row[:num_general_values], row[num_general_values:]) for row in islice(rows, batch_size)]
+                if not batch:
+                    break
+                yield batch
+
+    def generate_gray_code_rows(self, selected_outputs=None, binary_order=False):
+        """Generate the rows of the truth table with the selected outputs (if applicable) by Gray-code enumeration.
+
+        Consecutive combinations differ in a single input, so only the fan-out cone of that input is re-evaluated between rows.
+        Rows are generated as (combination, gate values) tuples of ints like generate_truth_table_rows().
+
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        binary_order     -- Determines if the rows are reordered back to binary order (buffers the whole truth table in memory)
+        """
+        outputs = self.__get_output_indexes(selected_outputs)
+        inputs = self.get_truth_table_inputs(outputs)
+        num_inputs = len(inputs)
+        simulator = Simulator(self, outputs)
+        simulator.set_inputs(self.__held_inputs)
+        combination = [0] * num_inputs
+        table = [None] * (1 << num_inputs) if binary_order else None
+
+        for k in range(1 << num_inputs):
+            # Flip the input at the lowest set bit of k, which turns the previous Gray code into the Gray code of k.
+            if k > 0:
+                position = num_inputs - (k & -k).bit_length()
+                combination[position] = combination[position] ^ 1
+                simulator.flip_input(inputs[position])
+
+            # Either generate the row directly or store it at its binary index.
+            row = (tuple(combination), tuple(simulator.get_outputs(outputs)))
+            if binary_order:
+                table[k ^ (k >> 1)] = row
             else:
-                print_or_output(("I" + str(i)).ljust(len(str(i)) + 2), self.__output_file)
-
-        # If outputs were selected, then only print headers for those outputs.
-        if len(selected_outputs) > 0:
-            for i in range(len(selected_outputs)):
-                output = selected_outputs[i]
-                if self.__format_csv:
-                    print_or_output(self.__gates[int(output)].name, self.__output_file)
-                    if i < len(selected_outputs) - 1:
-                        print_or_output(",", self.__output_file)
-                else:
-                    print_or_output(self.__gates[int(output)].name.ljust(len(self.__gates[int(output)].name) + 1), self.__output_file)
+                yield row
+
+        if binary_order:
+            yield from table
+
+        # Count the gate evaluations in the stats of the truth table being printed (if applicable).
+        if self.__stats is not None and not self.__stats.is_done:
+            self.__stats.gate_evaluations = self.__stats.gate_evaluations + simulator.num_evaluations
+            self.__stats.gate_row_evaluations = self.__stats.gate_row_evaluations + simulator.num_evaluations
+
+    def format_truth_table_rows(self, selected_outputs, start, stop):
+        """Format a range of rows of the truth table as printed text.
+
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        start            -- Index of the first combination to format
+        stop             -- Index after the last combination to format
+        """
+        outputs = self.__get_output_indexes(selected_outputs)
+        row_format = self.__get_row_format(self.get_truth_table_inputs(outputs), outputs)
+        return "".join([row_format.format(*combination, *gate_values)
+                        for combination, gate_values in self.generate_truth_table_rows(outputs, None, start, stop)])
+
+    def generate_packed_truth_table(self, selected_outputs=None, start=0, stop=None):
+        """Generate the packed output values of the truth table one block of combinations at a time.
+
+        Each block is generated as a (block start, block size, packed values) tuple, where bit r of each packed value holds the
+        value of an output for combination block_start + r.
+
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        start            -- Index of the first combination to generate
+        stop             -- Index after the last combination to generate (None to generate through the last combination)
+        """
+        return self.__generate_packed_blocks(self.__get_output_indexes(selected_outputs), False, start, stop)
+
+    def get_packed_truth_table(self, selected_outputs, start, stop):
+        """Get the packed output values of a range of the truth table as a list of blocks.
+
+        Keyword arguments:
+        selected_outputs -- List of selected outputs
+        start            -- Index of the first combination to get
+        stop             -- Index after the last combination to get
+        """
+        return list(self.generate_packed_truth_table(selected_outputs, start, stop))
+
+    def simulate_vectors(self, vectors, selected_outputs=None):
+        """Simulate a batch of input vectors with the selected outputs (if applicable).
+
+        The vectors are packed 8 per byte along each general input column, so each gate is evaluated with a single NumPy bitwise
+        operation per input over a whole batch of vectors. Returns a 2-D uint8 array with one row per vector and one column per
+        selected output. Requires NumPy.
+
+        Keyword arguments:
+        vectors          -- 2-D array of 0/1 or bool values with one row per vector and one column per general input
+        selected_outputs -- List of selected outputs
+        """
+        num_general_values = self.__num_general_values
+        vectors = self.__check_vectors(vectors)
+
+        # Get the gates to evaluate, either through the interpreted evaluation plan or a generated Python function.
+        outputs = self.__get_output_indexes(selected_outputs)
+        plan = self.__get_evaluation(outputs)[0]
+        function = self.get_python_function(outputs) if self.__use_python else None
+        mask = numpy.uint8(0xFF)
+
+        # Simulate each batch of vectors, sized so the unpacked values of the batch stay within the byte budget.
+        results = numpy.empty((len(vectors), len(outputs)), numpy.uint8)
+        batch_size = get_vector_batch_size(num_general_values + len(outputs))
+        for start in range(0, len(vectors), batch_size):
+            batch = vectors[start:start + batch_size]
+
+            # Pack the values of each general input into a contiguous column of bytes.
+            packed_batch = numpy.packbits(batch != 0, axis=0)
+            columns = [numpy.ascontiguousarray(packed_batch[:, i]) for i in range(num_general_values)]
+
+            # Evaluate the gates column-wise, then unpack the output columns.
+            if function:
+                packed_values = function(columns, mask)
+            else:
+                values = self.__calculate_outputs_for_block(columns, mask, plan)
+                packed_values = [values[self.__output_slots[i]] for i in outputs]
+            if outputs:
+                packed_values = [numpy.broadcast_to(numpy.asarray(value, numpy.uint8), (len(packed_batch),)) for value in packed_values]
+                results[start:start + len(batch)] = numpy.unpackbits(numpy.stack(packed_values), axis=1, count=len(batch)).T
+
+        return results
+
+    def __check_vectors(self, vectors):
+        """Check that every input vector has a value for each general input and get the vectors as an array.
+
+        Keyword arguments:
+        vectors -- 2-D array of 0/1 or bool values with one row per vector and one column per general input
+        """
+        if numpy is None:
+            raise ImportError("NumPy is required to simulate input vectors")
+        vectors = numpy.asarray(vectors)
+        if vectors.ndim != 2 or vectors.shape[1] != self.__num_general_values:
+            raise ValueError("Expected input vectors with " + str(self.__num_general_values) + " values each")
+        return vectors
+
+    def print_vector_table(self, vectors, selected_outputs):
+        """Print the table of input vectors with the selected outputs (if applicable).
+
+        The table has the same format as the truth table, but with one row per input vector. Requires NumPy.
+
+        Keyword arguments:
+        vectors          -- 2-D array of 0/1 or bool values with one row per vector and one column per general input
+        selected_outputs -- List of selected outputs
+        """
+        vectors = self.__check_vectors(vectors)
+        outputs = self.__get_output_indexes(selected_outputs)
+        inputs = list(range(self.__num_general_values))
+
+        # Size each batch so its printed rows stay within the byte budget, however wide the rows are.
+        line_size = len(self.__get_row_format(inputs, outputs).format(*([0] * (len(inputs) + len(outputs)))))
+        batch_size = get_vector_batch_size(line_size)
+        with OutputWriter(self.__output_file, resume_offset=0) as writer:
+            self.__print_truth_table_headers(writer, inputs, outputs)
+            for start in range(0, len(vectors), batch_size):
+                batch = (vectors[start:start + batch_size] != 0).astype(numpy.uint8)
+                table = numpy.concatenate([batch, self.simulate_vectors(batch, outputs)], axis=1)
+                writer.write(self.__format_table_rows(table, inputs, outputs))
+
+    def generate_random_rows(self, num_vectors, selected_outputs=None, seed=None):
+        """Generate the rows of uniformly random combinations with the selected outputs (if applicable).
+
+        Each block of up to 2^MAX_BLOCK_BITS combinations draws a packed random value for every enumerated general input and
+        evaluates the gates for the whole block at once, like a block of the truth table. Rows are generated as (combination, gate
+        values) tuples of ints like generate_truth_table_rows(), and the same seed always generates the same rows.
+
+        Keyword arguments:
+        num_vectors      -- Number of random combinations to generate
+        selected_outputs -- List of selected outputs
+        seed             -- Seed of the random number generator (None to seed from the operating system)
+        """
+        outputs = self.__get_output_indexes(selected_outputs)
+        plan, inputs = self.__get_evaluation(outputs)
+        output_slots = [self.__output_slots[i] for i in outputs]
+        function = self.get_python_function(outputs) if self.__use_python else None
+        random_generator = Random(seed)
+        stats = self.__stats if self.__stats is not None and not self.__stats.is_done else None
+
+        for block_start in range(0, num_vectors, 1 << MAX_BLOCK_BITS):
+            if stats is not None:
+                start_time = perf_counter()
+
+            # Draw a random bit for each combination in the block and every enumerated general input.
+            block_size = min(1 << MAX_BLOCK_BITS, num_vectors - block_start)
+            mask = (1 << block_size) - 1
+            packed_combinations = self.__get_held_combinations(mask)
+            for i in inputs:
+                packed_combinations[i] = random_generator.getrandbits(block_size)
+
+            # Evaluate the block and generate its rows.
+            if function:
+                packed_values = function(packed_combinations, mask)
+            else:
+                values = self.__calculate_outputs_for_block(packed_combinations, mask, plan)
+                packed_values = [values[slot] for slot in output_slots]
+            if stats is not None:
+                stats.add_time("evaluate", perf_counter() - start_time)
+            for row in self.__unpack_rows(block_size, [packed_combinations[i] for i in inputs] + packed_values):
+                yield row[:len(inputs)], row[len(inputs):]
+
+    def print_random_table(self, num_vectors, selected_outputs, seed=None):
+        """Print the table of uniformly random combinations with the selected outputs (if applicable).
+
+        The table has the same format as the truth table, but with one row per random combination (see generate_random_rows()).
+        The progress and wall time of each stage are tracked like the truth table (see get_stats()).
+
+        Keyword arguments:
+        num_vectors      -- Number of random combinations to print
+        selected_outputs -- List of selected outputs
+        seed             -- Seed of the random number generator (None to seed from the operating system)
+        """
+        if self.__format_binary:
+            raise ValueError("Random combinations require a text format")
+        outputs = self.__get_output_indexes(selected_outputs)
+        inputs = self.get_truth_table_inputs(outputs)
+        row_format = self.__get_row_format(inputs, outputs)
+        num_plan_gates = len(self.__get_evaluation(outputs)[0])
+        self.__stats = TruthTableStats(num_vectors, self.__stage_times, self.__progress_callback, self.__progress_interval)
+        stats = self.__stats
+
+        # Print the headers, then format and print each block of rows as they are simulated.
+        with OutputWriter(self.__output_file, resume_offset=0) as writer:
+            self.__print_truth_table_headers(writer, inputs, outputs)
+            rows = self.generate_random_rows(num_vectors, outputs, seed)
+            batches = iter(lambda: list(islice(rows, 1 << MAX_BLOCK_BITS)), [])
+            for batch in stats.time_iterations(batches, "format", "evaluate"):
+                format_time = perf_counter()
+                text = "".join([row_format.format(*combination, *gate_values) for combination, gate_values in batch])
+                write_time = perf_counter()
+                writer.write(text)
+                stats.add_time("format", write_time - format_time)
+                stats.add_time("write", perf_counter() - write_time)
+                stats.add_rows(len(batch), num_plan_gates, num_plan_gates * len(batch))
+        stats.finish()
+
+    def __format_table_rows(self, table, inputs, outputs):
+        """Format the rows of a 2-D array of 0 and 1 values as printed text.
+
+        Every row is laid out at once as fixed-width ASCII characters, using the same column widths as __get_row_format().
 
-        # Otherwise, print headers for all outputs.
+        Keyword arguments:
+        table   -- 2-D array with one column per general input followed by one column per output
+        inputs  -- List of general inputs
+        outputs -- List of gate indexes to output
+        """
+        # Get the width of each column, counting its separator (or newline) in CSV format.
+        if self.__format_csv:
+            widths = [2] * (len(inputs) + len(outputs))
+            line_size = sum(widths)
         else:
-            for i in range(len(self.__gates)):
-                gate = self.__gates[i]
-                if self.__format_csv:
-                    print_or_output(gate.name, self.__output_file)
-                    if i < len(self.__gates) - 1:
-                        print_or_output(",", self.__output_file)
-                else:
-                    print_or_output(gate.name.ljust(len(gate.name) + 1), self.__output_file)
-        print_or_output("", self.__output_file, False)
+            widths = [len(str(i)) + 2 for i in inputs] + [len(self.__gate_names[i]) + 1 for i in outputs]
+            line_size = sum(widths) + 1
+        if not widths:
+            return "\n" * len(table)
+
+        # Fill each line with spaces, then place the value characters and the separators.
+        offsets = numpy.cumsum([0] + widths[:-1])
+        lines = numpy.full((len(table), line_size), ord(" "), numpy.uint8)
+        lines[:, offsets] = table + ord("0")
+        if self.__format_csv:
+            lines[:, offsets[1:] - 1] = ord(",")
+        lines[:, -1] = ord("\n")
+        return lines.tobytes().decode("ascii")
+
+    def __generate_rows(self, outputs, start, stop):
+        """Generate the unpacked rows of the truth table as tuples of the combination followed by the output values.
+
+        Keyword arguments:
+        outputs -- List of gate indexes to output
+        start   -- Index of the first combination to generate
+        stop    -- Index after the last combination to generate (None to generate through the last combination)
+        """
+        for block_start, block_size, packed_values in self.__generate_packed_blocks(outputs, True, start, stop):
+            yield from self.__unpack_rows(block_size, packed_values)
 
-    def __calculate_outputs_for_combinations(self, combination):
-        """Calculate the outputs for the current bit combination.
+    def __unpack_rows(self, block_size, packed_values):
+        """Unpack a block of packed values into rows, generated as tuples holding bit r of each packed value for row r.
 
         Keyword arguments:
-        combination -- Current bit combination
+        block_size    -- Number of rows in the block
+        packed_values -- List of packed values, one per column
         """
-        # Create and initialize an empty list of gate values.
-        gate_values = [''] * len(self.__gates)
+        # Unpack each packed value into bytes where byte r is the value for row r of the block, then generate each row.
+        bit_format = "0" + str(block_size) + "b"
+        columns = [format(value, bit_format)[::-1].encode().translate(BIT_CHARACTERS_TO_INTS) for value in packed_values]
+        return zip(*columns)
 
-        # While all the gate values are not found, determine the gate values.
-        while not self.__are_all_gate_values_found(gate_values):
-            # Parse each gate value.
-            for i in range(len(gate_values)):
-                # If the gate value has already been determined, then skip the current iteration.
-                if gate_values[i] != '':
-                    continue
+    def __generate_packed_blocks(self, outputs, include_combinations=False, start=0, stop=None):
+        """Generate the packed output values of the truth table one block of combinations at a time.
 
-                # If all the required inputs for the current gate are available, then calculate the gate value.
-                if self.__are_all_required_inputs_available(self.__gates[i], gate_values):
-                    # Get the int input values for the current gate.
-                    inputs = []
-                    for input in self.__gates[i].input:
-                        if input.startswith("I"):
-                            inputs.append(combination[self.__get_int_of_general_value(input)])
-                        else:
-                            inputs.append(gate_values[int(input)])
+        Each block is generated as a (block start, block size, packed values) tuple, where bit r of each packed value holds the
+        value for combination block_start + r.
 
-                    # Assign the gate value to the current index of the list of block values.
-                    gate_values[i] = self.__gates[i].output(inputs)
+        Keyword arguments:
+        outputs              -- List of gate indexes to output
+        include_combinations -- Determines if the packed general input values come before the output values
+        start                -- Index of the first combination to generate
+        stop                 -- Index after the last combination to generate (None to generate through the last combination)
+        """
+        # Get the gates to evaluate, either through the interpreted evaluation plan or a generated Python function.
+        plan, inputs = self.__get_evaluation(outputs)
+        output_slots = [self.__output_slots[i] for i in outputs]
+        function = self.get_python_function(outputs) if self.__use_python else None
+        if stop is None:
+            stop = 1 << len(inputs)
+        if start >= stop:
+            return
+
+        # Calculate the values of each gate for a whole block of combinations at once.
+        block_bits = min(len(inputs), MAX_BLOCK_BITS)
+        block_size = 1 << block_bits
+        mask = (1 << block_size) - 1
+        stats = self.__stats if self.__stats is not None and not self.__stats.is_done else None
+        for block_start in range(start - start % block_size, stop, block_size):
+            if stats is not None:
+                start_time = perf_counter()
+            packed_combinations = self.__get_packed_combinations(block_start, block_bits, inputs)
+            if function:
+                packed_values = function(packed_combinations, mask)
+            else:
+                values = self.__calculate_outputs_for_block(packed_combinations, mask, plan)
+                packed_values = [values[slot] for slot in output_slots]
+            if stats is not None:
+                stats.add_time("evaluate", perf_counter() - start_time)
+            if include_combinations:
+                packed_values = [packed_combinations[i] for i in inputs] + packed_values
+
+            # If the range covers the whole block, then generate the packed values as is.
+            first = max(start, block_start)
+            last = min(stop, block_start + block_size)
+            if last - first == block_size:
+                yield block_start, block_size, packed_values
+
+            # Otherwise, shift out the combinations outside of the range.
+            else:
+                shift = first - block_start
+                range_mask = (1 << (last - first)) - 1
+                yield first, last - first, [(value >> shift) & range_mask for value in packed_values]
 
-        # Return the calculated gate values.
-        return gate_values
+    def __write_binary_truth_table(self, outputs, jobs, checkpoint=None, start=0, resume=False):
+        """Write the truth table to the output file in bit-packed binary format.
 
-    def __print_gate_outputs(self, combination, selected_outputs, gate_values):
-        """Print the outputs of the selected gates in the truth table.
+        Keyword arguments:
+        outputs    -- List of gate indexes to output
+        jobs       -- Number of worker processes to evaluate the truth table with
+        checkpoint -- Checkpoint to save periodically while writing (None to write without checkpoints)
+        start      -- Index of the first combination to write
+        resume     -- Determines if the blocks already written to the output file are kept
+        """
+        names = [self.__gate_names[i] for i in outputs]
+        stats = self.__stats
+        num_plan_gates = len(self.__get_evaluation(outputs)[0])
+        with BinaryTableWriter(self.__output_file, self.get_truth_table_inputs(outputs), names, resume) as writer:
+            results = self.__map_row_ranges(get_packed_truth_table_in_worker, self.get_packed_truth_table, outputs, jobs, start)
+            rows_done = start
+            try:
+                for start, stop, blocks in stats.time_iterations(results, "evaluate", "evaluate"):
+                    write_time = perf_counter()
+                    for block_start, block_size, packed_values in blocks:
+                        writer.write_block(block_start, block_size, packed_values)
+                    rows_done = stop
+                    if checkpoint:
+                        checkpoint.update(rows_done, writer)
+                    stats.add_time("write", perf_counter() - write_time)
+                    stats.add_rows(stop - start, num_plan_gates * len(blocks), num_plan_gates * (stop - start))
+
+            # If the truth table is interrupted, then save the blocks written so far before stopping.
+            except KeyboardInterrupt:
+                if checkpoint:
+                    checkpoint.save(rows_done, writer)
+                raise
+        if checkpoint:
+            checkpoint.remove()
+
+    def __get_checkpoint_fingerprint(self, outputs, start, stop):
+        """Get the fingerprint identifying the truth table of the outputs in its checkpoints.
+
+        Keyword arguments:
+        outputs -- List of gate indexes to output
+        start   -- Index of the first combination of the truth table
+        stop    -- Index after the last combination of the truth table
+        """
+        if self.__format_binary:
+            format = "binary"
+        elif self.__format_csv:
+            format = "csv"
+        else:
+            format = "text"
+        return {"circuit": hashlib.sha256(read_binary_file(self.__circuit_file)).hexdigest(),
+                "inputs": self.get_truth_table_inputs(outputs), "outputs": outputs, "format": format,
+                "held": [[input, value] for input, value in sorted(self.__held_inputs.items())], "rows": [start, stop]}
+
+    def __map_row_ranges(self, worker_function, method, outputs, jobs, first_start=0, last_stop=None):
+        """Apply a truth table method to contiguous ranges of combinations and generate the results in order.
+
+        Each result is generated as a (start, stop, result) tuple with the range of combinations it covers. If more than 1 job is
+        requested, then the ranges are evaluated by a pool of worker processes.
+
+        Keyword arguments:
+        worker_function -- Module-level function applying the method in a worker process
+        method          -- Method taking (outputs, start, stop) to apply in this process
+        outputs         -- List of gate indexes to output
+        jobs            -- Number of worker processes to evaluate the truth table with
+        first_start     -- Index of the first combination (e.g. from a checkpoint)
+        last_stop       -- Index after the last combination (None to apply the method through the last combination)
+        """
+        # Split the combinations into ranges of whole blocks, using larger ranges when they are sent to worker processes. Only the
+        # first and last ranges may be partial, so that no block is evaluated twice.
+        num_inputs = len(self.get_truth_table_inputs(outputs))
+        if last_stop is None:
+            last_stop = 1 << num_inputs
+        range_size = 1 << min(num_inputs, MAX_BLOCK_BITS)
+        if jobs > 1:
+            range_size = range_size * PARALLEL_RANGE_BLOCKS
+        aligned_start = first_start - first_start % range_size
+        ranges = [(outputs, max(start, first_start), min(start + range_size, last_stop))
+                  for start in range(aligned_start, last_stop if last_stop > first_start else aligned_start, range_size)]
+
+        # If only 1 job is requested, then simply apply the method to each range in this process.
+        if jobs <= 1 or len(ranges) <= 1:
+            for arguments in ranges:
+                yield arguments[1], arguments[2], method(*arguments)
+
+        # Otherwise, share the circuit with a pool of worker processes and collect their results in order.
+        else:
+            with Pool(min(jobs, len(ranges)), initialize_worker, (self,)) as pool:
+                for arguments, result in zip(ranges, pool.imap(worker_function, ranges)):
+                    yield arguments[1], arguments[2], result
+
+    def __get_output_indexes(self, selected_outputs):
+        """Get the indexes of the gates to output.
+
+        If no outputs are selected, then all gates will be output.
 
         Keyword arguments:
-        combination      -- Current combination to calculate
         selected_outputs -- List of selected outputs
-        gate_values      -- List of values for each gate
         """
-        # Print the current general input combination.
-        for i in range(len(combination)):
+        if selected_outputs:
+            return [int(output) for output in selected_outputs]
+        else:
+            return list(range(len(self.__gate_ids)))
+
+    def __print_truth_table_headers(self, writer, inputs, outputs):
+        """Print the headers of the truth table.
+
+        Keyword arguments:
+        writer  -- Output writer for the truth table
+        inputs  -- List of enumerated general inputs
+        outputs -- List of gate indexes to output
+        """
+        headers = []
+
+        # Print the headers for the general combinations.
+        for i in inputs:
             if self.__format_csv:
-                print_or_output(str(combination[i]) + ",", self.__output_file)
+                headers.append("I" + str(i) + ",")
             else:
-                print_or_output(str(combination[i]).ljust(len(str(i)) + 2), self.__output_file)
-
-        # If outputs were selected, then only print the values for those outputs.
-        if len(selected_outputs) > 0:
-            for i in range(len(selected_outputs)):
-                output = selected_outputs[i]
-                if self.__format_csv:
-                    print_or_output(str(gate_values[int(output)]), self.__output_file)
-                    if i < len(selected_outputs) - 1:
-                        print_or_output(",", self.__output_file)
-                else:
-                    print_or_output(str(gate_values[int(output)]).ljust(len(self.__gates[int(output)].name) + 1), self.__output_file)
+                headers.append(("I" + str(i)).ljust(len(str(i)) + 2))
 
-        # Otherwise, print values for all outputs.
+        # Print the header of each output.
+        names = [self.__gate_names[i] for i in outputs]
+        if self.__format_csv:
+            headers.append(",".join(names))
         else:
-            for i in range(len(self.__gates)):
-                gate = self.__gates[i]
-                if self.__format_csv:
-                    print_or_output(str(gate_values[gate.id]), self.__output_file)
-                    if i < len(self.__gates) - 1:
-                        print_or_output(",", self.__output_file)
-                else:
-                    print_or_output(str(gate_values[gate.id]).ljust(len(gate.name) + 1), self.__output_file)
-        print_or_output("", self.__output_file, False)
+            for name in names:
+                headers.append(name.ljust(len(name) + 1))
+        writer.write("".join(headers), False)
 
-    def get_num_of_general_input_values(self):
-        """Get the number of general input values.
+    def __get_row_format(self, inputs, outputs):
+        """Get the format string for a row of the truth table.
 
         Keyword arguments:
-        <None>
+        inputs  -- List of enumerated general inputs
+        outputs -- List of gate indexes to output
         """
-        # Track the number of general input values.
-        num_general_values = 0
+        # If the truth table is in CSV format, then simply separate each value with a comma.
+        if self.__format_csv:
+            return ",".join(["{}"] * (len(inputs) + len(outputs))) + "\n"
 
-        # Parse each gate to determine the maximum number of general input values.
-        for gate in self.__gates:
-            # Parse each gate input.
-            for input in gate.input:
-                # If the current input starts with an I, then get its general position.
-                if input.startswith("I"):
-                    # Get only the integer value of the general input value.
-                    general_value = self.__get_int_of_general_value(input)
-                    
-                    # If its general position is greater than the current stored number of general values, then store that position.
-                    if general_value + 1 > num_general_values:
-                        num_general_values = general_value + 1
+        # Otherwise, pad each value to the width of its column header.
+        fields = ["{:<" + str(len(str(i)) + 2) + "}" for i in inputs]
+        for i in outputs:
+            fields.append("{:<" + str(len(self.__gate_names[i]) + 1) + "}")
+        return "".join(fields) + "\n"
 
-        # Return the number of general input values.
-        return num_general_values
+    def __calculate_outputs_for_block(self, packed_combinations, mask, plan):
+        """Calculate the outputs for a block of consecutive bit combinations at once.
 
-    def __get_int_of_general_value(self, general_value):
-        """Get the integer component of the general value formatted I0, I1, etc.
+        Every value is packed into an int where bit r holds the value for combination r of the block, so each gate is evaluated
+        with a single bitwise operation for the whole block.
 
         Keyword arguments:
-        general_value -- General value formatted I0, I1, etc.
+        packed_combinations -- List of packed values of each general input
+        mask                -- Packed value with a logic 1 for every combination in the block
+        plan                -- Evaluation plan of the gates to calculate
         """
-        general_values = general_value.split("I")
-        return int(general_values[1])
+        # Fill the general input slots with the packed combinations and evaluate each gate in topological order.
+        num_general_values = self.__num_general_values
+        values = packed_combinations + [0] * len(self.__gate_ids)
+        for i, code, kernel, slots in plan:
+            values[num_general_values + i] = kernel([values[slot] for slot in slots], mask)
 
-    def __are_all_gate_values_found(self, gate_values):
-        """Check if all the gate values are found.
+        # Return the packed general input values followed by the packed gate values.
+        return values
 
-        This is using a developer-chosen definition of empty being ''.
+    def __get_packed_combinations(self, block_start, block_bits, inputs):
+        """Get the packed values of each general input for a block of 2^block_bits consecutive bit combinations.
+
+        The first enumerated input is the most significant bit of the combination index, so the nth of k enumerated inputs toggles
+        every 2^(k - 1 - n) combinations. Held inputs are constant for the whole block, and all other general inputs that are not
+        enumerated are left at logic 0.
 
         Keyword arguments:
-        gate_values -- List of gate values
+        block_start -- Index of the first combination in the block (a multiple of 2^block_bits)
+        block_bits  -- Number of bits used to index the combinations in the block
+        inputs      -- List of enumerated general inputs
         """
-        # Return False if any gate values are empty.
-        for value in gate_values:
-            if value == '':
-                return False
+        block_size = 1 << block_bits
+        mask = (1 << block_size) - 1
+        packed_values = self.__get_held_combinations(mask)
+        for i in range(len(inputs)):
+            bit = len(inputs) - 1 - i
+
+            # If the input toggles within the block, then repeat a run of 2^bit zeros followed by 2^bit ones.
+            if bit < block_bits:
+                run = 1 << bit
+                pattern = ((1 << run) - 1) << run
+                period = run * 2
+                while period < block_size:
+                    pattern = pattern | (pattern << period)
+                    period = period * 2
+                packed_values[inputs[i]] = pattern
+
+            # Otherwise, the input is constant for the whole block.
+            elif (block_start >> bit) & 1:
+                packed_values[inputs[i]] = mask
+
+        return packed_values
+
+    def __get_held_combinations(self, mask):
+        """Get the packed values of each general input for a block where only the held inputs are set.
+
+        Keyword arguments:
+        mask -- Packed value with a logic 1 for every combination in the block
+        """
+        packed_values = [0] * self.__num_general_values
+        for input, value in self.__held_inputs.items():
+            if value:
+                packed_values[input] = mask
+        return packed_values
+
+    def get_num_of_general_input_values(self):
+        """Get the number of general input values.
 
-        # Otherwise, return True.
-        return True
+        Keyword arguments:
+        <None>
+        """
+        return self.__num_general_values
 
-    def __are_all_required_inputs_available(self, gate, gate_values):
-        """Check if all the required inputs for the current gate are available.
+    def __get_input_names(self, index):
+        """Get the input names of a gate (e.g. I3 for a general input value or 12 for a gate ID).
 
         Keyword arguments:
-        gate        -- Current logic gate
-        combination -- List of general input values
-        gate_values -- List of gate values
+        index -- Index of the gate in the sorted list of gates
         """
-        # Return False if any required gate values are empty.
-        for input in gate.input:
-            if not input.startswith("I"):
-                if gate_values[int(input)] == '':
-                    return False
+        names = []
+        for slot in self.__fan_in_slots[self.__fan_in_offsets[index]:self.__fan_in_offsets[index + 1]]:
+            if slot < self.__num_general_values:
+                names.append("I" + str(slot))
+            else:
+                names.append(str(self.__gate_ids[slot - self.__num_general_values]))
+        return names
+
+#===================================================================================================================================
+#  Functions Definition
+#===================================================================================================================================
+
+def get_vector_batch_size(row_size):
+    """Get the number of input vectors to simulate together so a batch of rows stays within VECTOR_BATCH_BYTES.
 
-        # Otherwise, return True.
-        return True
-        
\ No newline at end of file
+    The batch size is a multiple of 8, so every batch but the last packs into whole bytes.
+
+    Keyword arguments:
+    row_size -- Number of bytes of each row of the batch
+    """
+    return max(8, VECTOR_BATCH_BYTES // max(1, row_size) // 8 * 8)
+
+#===================================================================================================================================
+#  Worker Functions
+#===================================================================================================================================
+
+def initialize_worker(circuit):
+    """Store the circuit shared with the current worker process.
+
+    Keyword arguments:
+    circuit -- Circuit to evaluate
+    """
+    global worker_circuit
+    worker_circuit = circuit
+
+def format_truth_table_rows_in_worker(arguments):
+    """Format a range of rows of the truth table in the current worker process.
+
+    Keyword arguments:
+    arguments -- Tuple of (selected outputs, start, stop)
+    """
+    return worker_circuit.format_truth_table_rows(*arguments)
+
+def get_packed_truth_table_in_worker(arguments):
+    """Get the packed output values of a range of the truth table in the current worker process.
+
+    Keyword arguments:
+    arguments -- Tuple of (selected outputs, start, stop)
+    """
+    return worker_circuit.get_packed_truth_table(*arguments)
@@ -18,6 +18,167 @@
 # Reference: https://docs.python.org/2/library/itertools.html
 from itertools import *
 
+# Higher-order functions and operations on callable objects
+# Reference: https://docs.python.org/3/library/functools.html
+from functools import reduce
+
+# Standard operators as functions
+# Reference: https://docs.python.org/3/library/operator.html
+from operator import and_, or_, xor
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Supported gate types, where the index of each type is its type code
+GATE_TYPES = ("NOT", "OR", "AND", "XOR", "NAND", "NOR", "XNOR", "BUFFER")
+
+# Type code of each supported gate type
+GATE_TYPE_CODES = {type: code for code, type in enumerate(GATE_TYPES)}
+
+# Maximum number of inputs of a gate with a lookup table (i.e. up to 2^6 entries per table)
+MAX_LOOKUP_TABLE_INPUTS = 6
+
+# Lookup tables shared by all gates of the same type code and number of inputs, built on first use
+LOOKUP_TABLES = {}
+
+#===================================================================================================================================
+#  Kernel Functions
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Single Combination Kernels
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Each kernel takes the list of input values of a gate (or a single int for NOT and BUFFER gates) and returns its logic output.
+# NAND, NOR, and XNOR are fused into a single expression instead of inverting the result of another kernel.
+
+def not_kernel(input):
+    return 1 - (input if type(input) is int else input[0])
+
+def buffer_kernel(input):
+    return input if type(input) is int else input[0]
+
+def or_kernel(input):
+    return 1 if 1 in input else 0
+
+def and_kernel(input):
+    return 0 if 0 in input else 1
+
+def xor_kernel(input):
+    return sum(input) & 1
+
+def nor_kernel(input):
+    return 0 if 1 in input else 1
+
+def nand_kernel(input):
+    return 1 if 0 in input else 0
+
+def xnor_kernel(input):
+    return (sum(input) & 1) ^ 1
+
+def single_input_kernel(input):
+    return input[0]
+
+def inverted_single_input_kernel(input):
+    return 1 - input[0]
+
+def or2_kernel(input):
+    return input[0] | input[1]
+
+def and2_kernel(input):
+    return input[0] & input[1]
+
+def xor2_kernel(input):
+    return input[0] ^ input[1]
+
+def nor2_kernel(input):
+    return (input[0] | input[1]) ^ 1
+
+def nand2_kernel(input):
+    return (input[0] & input[1]) ^ 1
+
+def xnor2_kernel(input):
+    return input[0] ^ input[1] ^ 1
+
+def invalid_kernel(input):
+    print("ERROR:: Invalid gate type")
+    print("        Use a valid gate type (NOT, OR, AND, XOR, NAND, NOR, XNOR, or BUFFER).")
+    return 0
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Packed Combinations Kernels
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Each kernel takes the list of packed input values of a gate and a mask with a logic 1 for every combination in use, and returns
+# the packed logic output with a single bitwise operation per input.
+
+def packed_not_kernel(input, mask):
+    return input[0] ^ mask
+
+def packed_buffer_kernel(input, mask):
+    return input[0]
+
+def packed_or_kernel(input, mask):
+    return reduce(or_, input, 0)
+
+def packed_and_kernel(input, mask):
+    return reduce(and_, input, mask)
+
+def packed_xor_kernel(input, mask):
+    return reduce(xor, input, 0)
+
+def packed_nor_kernel(input, mask):
+    return reduce(or_, input, 0) ^ mask
+
+def packed_nand_kernel(input, mask):
+    return reduce(and_, input, mask) ^ mask
+
+def packed_xnor_kernel(input, mask):
+    return reduce(xor, input, mask)
+
+def packed_or2_kernel(input, mask):
+    return input[0] | input[1]
+
+def packed_and2_kernel(input, mask):
+    return input[0] & input[1]
+
+def packed_xor2_kernel(input, mask):
+    return input[0] ^ input[1]
+
+def packed_nor2_kernel(input, mask):
+    return (input[0] | input[1]) ^ mask
+
+def packed_nand2_kernel(input, mask):
+    return (input[0] & input[1]) ^ mask
+
+def packed_xnor2_kernel(input, mask):
+    return input[0] ^ input[1] ^ mask
+
+def packed_invalid_kernel(input, mask):
+    invalid_kernel(input)
+    return 0
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Kernel Tables
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Kernels for any number of inputs, indexed by type code
+SCALAR_KERNELS = (not_kernel, or_kernel, and_kernel, xor_kernel, nand_kernel, nor_kernel, xnor_kernel, buffer_kernel)
+PACKED_KERNELS = (packed_not_kernel, packed_or_kernel, packed_and_kernel, packed_xor_kernel,
+                  packed_nand_kernel, packed_nor_kernel, packed_xnor_kernel, packed_buffer_kernel)
+
+# Fast path kernels for gates with exactly 1 input, indexed by type code
+SCALAR_KERNELS_1 = (not_kernel, single_input_kernel, single_input_kernel, single_input_kernel,
+                    inverted_single_input_kernel, inverted_single_input_kernel, inverted_single_input_kernel, buffer_kernel)
+PACKED_KERNELS_1 = (packed_not_kernel, packed_buffer_kernel, packed_buffer_kernel, packed_buffer_kernel,
+                    packed_not_kernel, packed_not_kernel, packed_not_kernel, packed_buffer_kernel)
+
+# Fast path kernels for gates with exactly 2 inputs, indexed by type code
+SCALAR_KERNELS_2 = (not_kernel, or2_kernel, and2_kernel, xor2_kernel, nand2_kernel, nor2_kernel, xnor2_kernel, buffer_kernel)
+PACKED_KERNELS_2 = (packed_not_kernel, packed_or2_kernel, packed_and2_kernel, packed_xor2_kernel,
+                    packed_nand2_kernel, packed_nor2_kernel, packed_xnor2_kernel, packed_buffer_kernel)
+
 #===================================================================================================================================
 #  Class Definition
 #===================================================================================================================================
@@ -25,17 +186,24 @@ from itertools import *
 class Gate(object):
     """Simulate logic gates.
 
+    The evaluation kernels of the gate are bound once at construction from
+    its type code and number of inputs.
+
     Keyword arguments:
     id    -- Block ID
     name  -- Block name
     type  -- Logic gate type
     input -- List of input names
     """
+    __slots__ = ("id", "name", "type", "input", "code", "kernel", "packed_kernel")
+
     def __init__(self, id, name, type, input):
         self.id = id
         self.name = name.upper()
         self.type = type.upper()
         self.input = input
+        self.code = GATE_TYPE_CODES.get(self.type)
+        self.kernel, self.packed_kernel = get_kernels(self.code, len(input))
 
     def output(self, input):
         """Evaluate the output of the current gate based on its type.
@@ -43,26 +211,19 @@ class Gate(object):
         Keyword arguments:
         input -- Input value; could be a list (all) or a single int (NOT gate)
         """
-        if self.type == "NOT":
-            return self.__not(input)
-        elif self.type == "OR":
-            return self.__or(input)
-        elif self.type == "AND":
-            return self.__and(input)
-        elif self.type == "XOR":
-            return self.__xor(input)
-        elif self.type == "NAND":
-            return self.__not(self.__and(input))
-        elif self.type == "NOR":
-            return self.__not(self.__or(input))
-        elif self.type == "XNOR":
-            return self.__not(self.__xor(input))
-        elif self.type == "BUFFER":
-            return self.__buffer(input)
-        else:
-            print("ERROR:: Invalid gate type (type = \"" + self.type + "\")")
-            print("        Use a valid gate type (NOT, OR, AND, XOR, NAND, NOR, or XNOR).")
-            return 0
+        return self.kernel(input)
+
+    def packed_output(self, input, mask):
+        """Evaluate the output of the current gate for many bit combinations at once.
+
+        Each input value packs one bit per combination, so every gate type
+        becomes a single bitwise operation over all the packed combinations.
+
+        Keyword arguments:
+        input -- List of packed input values
+        mask  -- Packed value with a logic 1 for every combination in use
+        """
+        return self.packed_kernel(input, mask)
 
     def truth_table(self, bit_size):
         """Print out the truth table of the logic gate.
@@ -92,11 +253,12 @@ class Gate(object):
             # Generate 2^n bit combinations.
             combinations = list(product([0, 1], repeat=bit_size))
 
-            # Generate the output for each bit combination.
+            # Generate the output for each bit combination, using the kernel for any number of inputs.
+            kernel = SCALAR_KERNELS[self.code] if self.code is not None else self.kernel
             for combination in combinations:
                 for bit in combination:
                     print(str(bit).rjust(2) + " ", end="")
-                print(str(self.output(combination)).rjust(2))
+                print(str(kernel(combination)).rjust(2))
 
     def print_info(self):
         """Print the stored gate information.
@@ -112,105 +274,72 @@ class Gate(object):
         print("    * Type   : " + self.type)
         print("    * Inputs : " + str(self.input))
 
-    def __not(self, input):
-        """Perform a logic NOT on the input value.
-
-        Keyword arguments:
-        input -- Input value
-        """
-        final_input = None
-
-        # If the input is a list, then take the first element.
-        if type(input) is list:
-            final_input = input[0]
-
-        # Otherwise, take the input as is.
-        else:
-            final_input = input
-
-        # If the input was still not assigned, then display an error.
-        if final_input is None:
-            print("ERROR:: Invalid input to NOT gate (input = \"" + input + "\"")
-
-        # Otherwise, evaluate the NOT logic.
-        else:
-            # If input is logic 1, then return a logic 0.
-            if final_input is 1:
-                return 0
-
-            # Otherwise, return a logic 1.
-            else:
-                return 1
-
-    def __and(self, input):
-        """Perform a logic AND on all the input values.
-
-        Keyword arguments:
-        input -- List of input values
-        """
-        # If there is a logic 0 at any moment, then simply return a logic 0.
-        for value in input:
-            if value is 0:
-                return 0
-
-        # Otherwise, return 1 if no logic 0 is found.
-        return 1
-
-    def __or(self, input):
-        """Perform a logic OR on all the input values.
-
-        Keyword arguments:
-        input -- List of input values
-        """
-        # If there is a logic 1 at any moment, then simply return a logic 1.
-        for value in input:
-            if value is 1:
-                return 1
+#===================================================================================================================================
+#  Functions Definition
+#===================================================================================================================================
 
-        # Otherwise, return 0 if no logic 1 is found.
-        return 0
+def get_packed_expression(code, operands, mask):
+    """Get a Python expression evaluating a gate on packed operands.
 
-    def __xor(self, input):
-        """Perform a logic XOR on all the input values.
+    The expression follows the same semantics as the packed combinations kernel of the gate type.
 
-        Keyword arguments:
-        input -- List of input values
-        """
-        output = input[0]
-        for i in range(1, len(input)):
-            # If the stored output is the same as the current input, then set the
-            # output to logic 0.
-            if output is input[i]:
-                output = 0
-
-            # Otherwise, set the output to logic 1.
-            else:
-                output = 1
-
-        # Return the calculated logic output.
-        return output
-        
-    def __buffer(self, input):
-        """Simply buffer for the input value.
-
-        Keyword arguments:
-        input -- Input value
-        """
-        final_input = None
+    Keyword arguments:
+    code     -- Type code of the gate
+    operands -- List of expressions for the packed input values
+    mask     -- Expression for the packed value with a logic 1 for every combination in use
+    """
+    type = GATE_TYPES[code]
+    if type == "NOT":
+        return operands[0] + " ^ " + mask
+    elif type == "BUFFER":
+        return operands[0]
+
+    # Join the operands with the bitwise operator of the gate type.
+    if type == "AND" or type == "NAND":
+        expression = " & ".join(operands) if operands else mask
+    elif type == "OR" or type == "NOR":
+        expression = " | ".join(operands) if operands else "0"
+    else:
+        expression = " ^ ".join(operands) if operands else "0"
+
+    # Invert the expression for NAND, NOR, and XNOR gates.
+    if type == "NAND" or type == "NOR" or type == "XNOR":
+        return "(" + expression + ") ^ " + mask
+    else:
+        return expression
+
+def get_lookup_table(code, num_inputs):
+    """Get the lookup table of the outputs of a gate, indexed by the int whose bit k is the value of input k.
+
+    Tables are built once from the single combination kernel of the gate type and shared by all gates of the same type code and
+    number of inputs.
 
-        # If the input is a list, then take the first element.
-        if type(input) is list:
-            final_input = input[0]
+    Keyword arguments:
+    code       -- Type code of the gate (None for an invalid type)
+    num_inputs -- Number of inputs of the gate
+    """
+    # Gates with an invalid type, no inputs, or too many inputs are evaluated by their kernel instead.
+    if code is None or num_inputs == 0 or num_inputs > MAX_LOOKUP_TABLE_INPUTS:
+        return None
 
-        # Otherwise, take the input as is.
-        else:
-            final_input = input
+    key = (code, num_inputs)
+    if key not in LOOKUP_TABLES:
+        kernel = SCALAR_KERNELS[code]
+        LOOKUP_TABLES[key] = bytes([kernel([(index >> k) & 1 for k in range(num_inputs)]) for index in range(1 << num_inputs)])
+    return LOOKUP_TABLES[key]
 
-        # If the input was still not assigned, then display an error.
-        if final_input is None:
-            print("ERROR:: Invalid input to NOT gate (input = \"" + input + "\"")
+def get_kernels(code, num_inputs):
+    """Get the single combination and packed combinations kernels for a gate.
 
-        # Otherwise, simply perform the buffer logic.
-        else:
-            return final_input
-            
\ No newline at end of file
+    Keyword arguments:
+    code       -- Type code of the gate (None for an invalid type)
+    num_inputs -- Number of inputs of the gate
+    """
+    if code is None:
+        return invalid_kernel, packed_invalid_kernel
+    elif num_inputs == 1:
+        return SCALAR_KERNELS_1[code], PACKED_KERNELS_1[code]
+    elif num_inputs == 2:
+        return SCALAR_KERNELS_2[code], PACKED_KERNELS_2[code]
+    else:
+        return SCALAR_KERNELS[code], PACKED_KERNELS[code]
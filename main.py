@@ -18,22 +18,42 @@
 # Reference: https://docs.python.org/3.3/library/argparse.html
 import argparse
 
-# Common pathname manipulations
-# Reference: https://docs.python.org/2/library/os.path.html
-import os.path
+# Miscellaneous operating system interfaces and common pathname manipulations
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# Generate pseudo-random numbers
+# Reference: https://docs.python.org/3/library/random.html
+import random
+
+# System-specific parameters and functions
+# Reference: https://docs.python.org/3/library/sys.html
+import sys
 
 #-----------------------------------------------------------------------------------------------------------------------------------
 #  Custom Modules
 #-----------------------------------------------------------------------------------------------------------------------------------
 
+# Symbolic analysis with binary decision diagrams
+# Reference: bdd.py
+from bdd import CircuitBDD
+
 # Combinational logic simulation
 # Reference: circuit.py
-from circuit import Circuit
+from circuit import Circuit, ENUMERATIONS
 
 # Logic gate simulation
 # Reference: gate.py
 from gate import Gate
 
+# Checkpoints of truth tables written to files
+# Reference: checkpoint.py
+from checkpoint import CHECKPOINT_EXTENSION, CHECKPOINT_INTERVAL
+
+# Cache compiled circuits on disk
+# Reference: netlistcache.py
+from netlistcache import NetlistCache, DEFAULT_CACHE_SIZE
+
 # Handle basic system operations
 # Reference: system.py
 from system import *
@@ -42,7 +62,7 @@ from system import *
 #  Global Variables
 #===================================================================================================================================
 
-VERSION = "1.2.0"
+VERSION = "1.3.0"
 
 #===================================================================================================================================
 #  Functions
@@ -50,88 +70,532 @@ VERSION = "1.2.0"
 
 def get_args():
     parser = argparse.ArgumentParser(description='v' + VERSION + ' - Simulates combinational logic circuits and generates a truth table.')
-    parser.add_argument('circuit_file',
-                        nargs=1,
-                        help='path to input circuit file (e.g. path/to/circuit.in)')
-    parser.add_argument('-o', '--out',
-                        nargs=1,
-                        dest='output_file',
-                        help='output truth table to specified file instead of printing to console')
-    parser.add_argument('--format-csv',
-                        dest='format_csv',
+    parser.add_argument('circuit_files',
+                        nargs='+',
+                        metavar='circuit_file',
+                        help='path to input circuit file(s) (e.g. path/to/circuit.in)')
+    output_location = parser.add_mutually_exclusive_group()
+    output_location.add_argument('-o', '--out',
+                                 nargs=1,
+                                 dest='output_file',
+                                 help='output truth table to specified file instead of printing to console, compressed if the file ends '
+                                      'with .gz, .bz2, or .xz')
+    output_location.add_argument('--out-dir',
+                                 dest='output_dir',
+                                 help='output each truth table to a file named after its circuit file in the specified directory')
+    parser.add_argument('-s', '--select',
+                        nargs='+',
+                        metavar='ID',
+                        dest='selected_ids',
+                        help='select gates by ID instead of prompting for them')
+    parser.add_argument('-n', '--select-name',
+                        nargs='+',
+                        metavar='NAME',
+                        dest='selected_names',
+                        help='select gates by name instead of prompting for them')
+    parser.add_argument('-a', '--all',
+                        dest='select_all',
+                        action='store_true',
+                        help='select all gates instead of prompting for them')
+    parser.add_argument('-q', '--quiet',
+                        dest='quiet',
+                        action='store_true',
+                        help='do not print the gates in the circuit or progress information')
+    parser.add_argument('--prune-inputs',
+                        dest='prune_inputs',
+                        action='store_true',
+                        help='only enumerate the general inputs that reach the selected gates')
+    parser.add_argument('--no-optimize',
+                        dest='optimize',
+                        action='store_false',
+                        help='evaluate every gate as written instead of eliminating duplicate, redundant, and constant gates first')
+    parser.add_argument('--compile-python',
+                        dest='use_python',
+                        action='store_true',
+                        help='evaluate the truth table with a generated straight-line Python function')
+    parser.add_argument('--export-python',
+                        dest='export_python',
                         action='store_true',
-                        help='output truth table in CSV format instead of whitespace-separated row/col')
+                        help='export the generated Python function for the selected gates next to each circuit file (e.g. circuit.py), '
+                             'refusing to overwrite a file it did not generate')
+    parser.add_argument('--cache-dir',
+                        dest='cache_dir',
+                        help='reuse compiled circuits cached in the specified directory when their file content is unchanged')
+    parser.add_argument('--cache-size',
+                        type=int,
+                        default=DEFAULT_CACHE_SIZE >> 20,
+                        dest='cache_size',
+                        help='maximum size of the circuit cache in MB (default: ' + str(DEFAULT_CACHE_SIZE >> 20) + ')')
+    parser.add_argument('--vectors',
+                        dest='vectors_file',
+                        help='simulate the input vectors in the specified file (one vector per line) instead of every combination '
+                             '(requires NumPy)')
+    table_range = parser.add_mutually_exclusive_group()
+    table_range.add_argument('--rows',
+                             nargs=2,
+                             type=int,
+                             metavar=('START', 'STOP'),
+                             dest='rows',
+                             help='only simulate the combinations from row START up to (but not including) row STOP of the truth table '
+                                  '(e.g. --rows 1073741824 1074790400)')
+    table_range.add_argument('--sample',
+                             type=int,
+                             metavar='N',
+                             dest='sample',
+                             help='simulate N uniformly random combinations instead of every combination')
+    parser.add_argument('--seed',
+                        type=int,
+                        dest='seed',
+                        help='seed of the random combinations simulated by --sample (default: a random seed; the seed used is always '
+                             'printed to stderr so the run can be repeated)')
+    parser.add_argument('--hold',
+                        nargs='+',
+                        metavar='INPUT=VALUE',
+                        dest='held_inputs',
+                        help='hold general inputs at constant values while enumerating the rest (e.g. --hold I3=1 I5=0)')
+    parser.add_argument('--enumeration',
+                        choices=ENUMERATIONS,
+                        default='blocks',
+                        dest='enumeration',
+                        help='order in which combinations are enumerated: blocks (binary order, bit-parallel), gray (Gray-code order, '
+                             're-evaluating only the flipped input\'s fan-out), or gray-binary (gray, reordered to binary order) '
+                             '(default: blocks)')
+    parser.add_argument('--stats',
+                        dest='stats',
+                        action='store_true',
+                        help='print periodic progress (rows done, rows/sec, and ETA), the wall time of each stage, and gate '
+                             'evaluation counters to stderr')
+    parser.add_argument('--resume',
+                        dest='resume',
+                        action='store_true',
+                        help='continue each truth table from the last checkpoint of its output file, truncating any rows written after '
+                             'it (requires -o/--out or --out-dir and the blocks enumeration)')
+    parser.add_argument('--checkpoint-interval',
+                        type=float,
+                        default=CHECKPOINT_INTERVAL,
+                        metavar='SECONDS',
+                        dest='checkpoint_interval',
+                        help='minimum number of seconds between checkpoints of truth tables output to files (default: '
+                             + format(CHECKPOINT_INTERVAL, 'g') + ')')
+    symbolic_analysis = parser.add_mutually_exclusive_group()
+    symbolic_analysis.add_argument('--bdd',
+                                   dest='bdd',
+                                   action='store_true',
+                                   help='instead of generating the truth table, build a binary decision diagram of each selected gate and '
+                                        'print how many combinations set it to 1 along with one such combination')
+    symbolic_analysis.add_argument('--equivalent',
+                                   nargs=2,
+                                   metavar='ID',
+                                   dest='equivalent_ids',
+                                   help='instead of generating the truth table, check if two gates have the same value for every '
+                                        'combination using binary decision diagrams, printing a combination where they differ if not')
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        default=1,
+                        dest='jobs',
+                        help='number of worker processes used to evaluate the truth table (default: 1)')
+    output_format = parser.add_mutually_exclusive_group()
+    output_format.add_argument('--format-csv',
+                               dest='format_csv',
+                               action='store_true',
+                               help='output truth table in CSV format instead of whitespace-separated row/col')
+    output_format.add_argument('--format-binary',
+                               dest='format_binary',
+                               action='store_true',
+                               help='output truth table as bit-packed binary columns (requires -o/--out or --out-dir)')
 
     return parser.parse_args()
 
-def validate_selected_outputs(selected_outputs, num_gates):
-        """Ensure the selected outputs are in range.
+def validate_selected_outputs(selected_outputs, circuit, by_name=False, is_interactive=True):
+        """Ensure the selected outputs refer to gates in the circuit.
+
+        Returns the indexes of the selected gates in the sorted list of gates. Unknown gates are ignored when selected
+        interactively, and otherwise printed to stderr as errors, returning None.
 
         Keyword arguments:
-        selected_outputs -- Original list of selected outputs
-        num_gates        -- Number of gates in the circuit
+        selected_outputs -- Original list of selected gate IDs or names
+        circuit          -- Circuit containing the gates
+        by_name          -- Determines if the outputs are selected by gate name instead of gate ID
+        is_interactive   -- Determines if the outputs were selected at the prompt instead of on the command line
         """
-        for i in range(len(selected_outputs)):
-            if int(selected_outputs[i]) >= num_gates or int(selected_outputs[i]) < 0:
-                print("        Ignoring " + selected_outputs[i] + " out of range... ")
-                selected_outputs.pop(i)
-                i = i - 1
+        output_indexes = []
+        is_valid = True
+        for selected_output in selected_outputs:
+            if by_name:
+                index = circuit.get_gate_index_by_name(selected_output)
+            elif selected_output.isdigit():
+                index = circuit.get_gate_index(int(selected_output))
+            else:
+                index = None
 
-        return selected_outputs
+            if index is None:
+                description = "unknown gate name" if by_name else "out of range"
+                if is_interactive:
+                    print("        Ignoring " + selected_output + " " + description + "... ")
+                else:
+                    print("ERROR:: Selected gate " + selected_output + " " + description + ".", file=sys.stderr)
+                    is_valid = False
+            else:
+                output_indexes.append(index)
 
-def main():
-    # Parse the command-line arguments.
-    args = get_args()
-    circuit_file = args.circuit_file[0]
-    output_file = args.output_file
-    if output_file:
-        output_file = output_file[0]
-    format_csv = args.format_csv
+        return output_indexes if is_valid else None
+
+def parse_held_inputs(held_inputs):
+    """Parse the general inputs to hold at constant values (e.g. ["I3=1", "I5=0"]).
+
+    Returns a dict of {general input position: value}, or None if any of them is invalid.
+
+    Keyword arguments:
+    held_inputs -- List of INPUT=VALUE strings
+    """
+    inputs = {}
+    for held_input in held_inputs:
+        input, separator, value = held_input.upper().partition("=")
+        if input.startswith("I"):
+            input = input[1:]
+        if not separator or not input.isdigit() or value not in ("0", "1"):
+            print("ERROR:: Invalid held input \"" + held_input + "\" (e.g. --hold I3=1).")
+            return None
+        inputs[int(input)] = int(value)
+    return inputs
+
+def print_progress(stats):
+    """Print the progress of a truth table to stderr, followed by a summary once it is done.
+
+    Keyword arguments:
+    stats -- TruthTableStats of the truth table
+    """
+    print("INFO::  " + stats.format_progress(), file=sys.stderr)
+    if stats.is_done:
+        print("INFO::  Printing stats...", file=sys.stderr)
+        for line in stats.format_summary():
+            print("        " + line, file=sys.stderr)
+
+def format_input_values(values):
+    """Format general input values as a vector string (e.g. "0110" for I0=0, I1=1, I2=1, I3=0), as read by --vectors.
+
+    Keyword arguments:
+    values -- List of general input values (None for no values)
+    """
+    if values is None:
+        return "<none>"
+    return "".join([str(value) for value in values])
+
+def analyze_circuit(circuit, selected_outputs):
+    """Print how many combinations set each selected gate to 1 along with one such combination, using binary decision diagrams.
+
+    Keyword arguments:
+    circuit          -- Circuit to analyze
+    selected_outputs -- List of gate indexes to analyze (empty to analyze all gates)
+    """
+    try:
+        circuit_bdd = CircuitBDD(circuit, selected_outputs)
+    except (ValueError, MemoryError) as error:
+        print("ERROR:: Cannot build binary decision diagrams: " + (str(error) or "out of memory"))
+        return
+
+    total_combinations = 2 ** circuit.get_num_of_general_input_values()
+    for output in (selected_outputs or range(circuit.get_num_of_gates())):
+        gate = circuit.get_gate(output)
+        print("        " + str(gate.id).ljust(8) + gate.name.ljust(16) + "Ones: " + str(circuit_bdd.count_satisfying(output))
+              + " / " + str(total_combinations) + ", Example: " + format_input_values(circuit_bdd.get_witness(output)))
+
+def check_equivalence(circuit, equivalent_ids):
+    """Print whether two gates have the same value for every combination, using binary decision diagrams.
+
+    Keyword arguments:
+    circuit        -- Circuit containing the gates
+    equivalent_ids -- List of the two gate IDs to compare
+    """
+    outputs = validate_selected_outputs(equivalent_ids, circuit, False, False)
+    if outputs is None or len(outputs) != 2:
+        print("ERROR:: Equivalence check requires two gate IDs in the circuit.")
+        return
+
+    try:
+        circuit_bdd = CircuitBDD(circuit, outputs)
+    except (ValueError, MemoryError) as error:
+        print("ERROR:: Cannot build binary decision diagrams: " + (str(error) or "out of memory"))
+        return
+
+    if circuit_bdd.is_equivalent(outputs[0], outputs[1]):
+        print("        Gates " + " and ".join(equivalent_ids) + " are equivalent.")
+    else:
+        print("        Gates " + " and ".join(equivalent_ids) + " differ, e.g. at: "
+              + format_input_values(circuit_bdd.get_counterexample(outputs[0], outputs[1])))
+
+def get_output_file(circuit_file, args):
+    """Get the path of the output file for a circuit file (None to print to console).
+
+    Keyword arguments:
+    circuit_file -- Path to input circuit file
+    args         -- Parsed command-line arguments
+    """
+    if args.output_file:
+        return args.output_file[0]
+    elif args.output_dir:
+        if args.format_csv:
+            extension = ".csv"
+        elif args.format_binary:
+            extension = ".bin"
+        else:
+            extension = ".txt"
+        return os.path.join(args.output_dir, os.path.splitext(os.path.basename(circuit_file))[0] + extension)
+    else:
+        return None
+
+def simulate_circuit_file(circuit_file, args, cache, vectors, held_inputs):
+    """Generate the truth table of a single circuit file.
+
+    Keyword arguments:
+    circuit_file -- Path to input circuit file
+    args         -- Parsed command-line arguments
+    cache        -- Netlist cache of compiled circuits (None to always parse the circuit file)
+    vectors      -- 2-D array of input vectors to simulate instead of every combination (None to generate the truth table)
+    held_inputs  -- Dict of {general input position: value} to hold while enumerating the other general inputs
+    """
+    output_file = get_output_file(circuit_file, args)
+    is_interactive = not (args.selected_ids or args.selected_names or args.select_all or args.equivalent_ids)
 
     # If the file exists, then check if it is a supported input file.
     if os.path.isfile(circuit_file):
         # If it is a supported input file, then parse it.
         if circuit_file.endswith(".in"):
             # Create a new Circuit object consisting of the gates from the input file.
-            circuit = Circuit(circuit_file, output_file, format_csv)
-            print("INFO::  Printing gates in circuit...")
-            print()
+            try:
+                circuit = Circuit(circuit_file, output_file, args.format_csv, args.format_binary, args.prune_inputs,
+                                  args.use_python, cache, args.optimize)
+            except ValueError as error:
+                print("ERROR:: Invalid circuit: " + str(error))
+                return
+
+            # Hold the selected general inputs at constant values (if applicable).
+            try:
+                circuit.set_held_inputs(held_inputs)
+            except ValueError as error:
+                print("ERROR:: Invalid held input: " + str(error))
+                return
 
             # Print the list of gates sorted by ID.
-            circuit.print_gates()
-            print()
+            if not args.quiet:
+                print("INFO::  Printing gates in circuit...")
+                print()
+                circuit.print_gates()
+                print()
 
-            # Prompt the user for desired outputs.
-            print("INFO::  Use spaces to select multiples (e.g., 1 4 6).")
-            print("INFO::  To calculate all gates, just press 'Enter' without inputting anything.")
-            selected_output = input("INPUT:: Select gates: ")
+            # Check the equivalence of two gates instead of generating the truth table (if applicable).
+            if args.equivalent_ids:
+                if not args.quiet:
+                    print("INFO::  Checking equivalence of gates " + " and ".join(args.equivalent_ids) + "...")
+                check_equivalence(circuit, args.equivalent_ids)
+                return
+
+            # If no outputs were selected on the command line, then prompt the user for desired outputs.
+            if is_interactive:
+                print("INFO::  Use spaces to select multiples (e.g., 1 4 6).")
+                print("INFO::  To calculate all gates, just press 'Enter' without inputting anything.")
+                selected_output = input("INPUT:: Select gates: ")
+                selected_ids = selected_output.split()
+            else:
+                selected_ids = args.selected_ids or []
 
             # Validate the selected outputs to ensure they are in range.
-            print("INFO::  Validating selected outputs...")
-            selected_outputs = validate_selected_outputs(selected_output.split(), len(circuit.get_gates()))
+            if not args.quiet:
+                print("INFO::  Validating selected outputs...")
+            # An unknown gate selected on the command line skips the circuit file rather than widening the selection to every gate.
+            selected_outputs = validate_selected_outputs(selected_ids, circuit, False, is_interactive)
+            selected_names = validate_selected_outputs(args.selected_names or [], circuit, True, is_interactive)
+            if selected_outputs is None or selected_names is None:
+                return
+            selected_outputs = selected_outputs + selected_names
+
+            # Export the generated Python function for the selected outputs (if applicable).
+            if args.export_python:
+                python_file = os.path.splitext(circuit_file)[0] + ".py"
+                if not args.quiet:
+                    print("INFO::  Exporting Python function to \"" + python_file + "\"...")
+                try:
+                    circuit.export_python_module(python_file, selected_outputs)
+                except (OSError, ValueError) as error:
+                    print("ERROR:: Cannot export Python function: " + str(error))
+                    return
+
+            # Analyze the selected outputs symbolically instead of generating the truth table (if applicable).
+            if args.bdd:
+                if not args.quiet:
+                    print("INFO::  Analyzing selected outputs with binary decision diagrams...")
+                analyze_circuit(circuit, selected_outputs)
+                return
+
+            # If input vectors were given, then simulate only those vectors for the selected outputs.
+            if vectors is not None:
+                if not args.quiet:
+                    if output_file:
+                        print("INFO::  Outputting simulated vectors to \"" + output_file + "\"...")
+                    else:
+                        print("INFO::  Printing simulated vectors for selected outputs...")
+                    print("        Total Vectors: " + str(len(vectors)))
+                    if output_file is None:
+                        print()
+                try:
+                    circuit.print_vector_table(vectors, selected_outputs)
+                except ValueError as error:
+                    print("ERROR:: Invalid input vectors: " + str(error))
+                return
+
+            # If random combinations were requested, then simulate only those combinations for the selected outputs.
+            if args.sample is not None:
+                if not args.quiet:
+                    if output_file:
+                        print("INFO::  Outputting random combinations to \"" + output_file + "\"...")
+                    else:
+                        print("INFO::  Printing random combinations for selected outputs...")
+                    print("        Total Vectors: " + str(args.sample))
+                    if output_file is None:
+                        print()
+                if args.stats:
+                    circuit.set_progress_callback(print_progress)
+                circuit.print_random_table(args.sample, selected_outputs, args.seed)
+                return
+
+            # Generate the truth table (or the selected range of rows) for the selected outputs.
+            start, stop = args.rows or (0, None)
+            if not args.quiet:
+                if output_file:
+                    print("INFO::  Outputting truth table to \"" + output_file + "\"...")
+                else:
+                    print("INFO::  Printing truth table for selected outputs...")
+                print("        This may take awhile for large numbers of inputs because of 2^n combinations...")
+                print("        Total Combinations: " + str(circuit.get_num_of_combinations(selected_outputs)))
+                if args.rows:
+                    print("        Rows: " + str(start) + " to " + str(stop))
+                if output_file is None:
+                    print()
+            if args.stats:
+                circuit.set_progress_callback(print_progress)
+            circuit.set_checkpoint_interval(args.checkpoint_interval)
+            try:
+                circuit.print_truth_table(selected_outputs, args.jobs, args.enumeration, args.resume, start, stop)
+            except ValueError as error:
+                print("ERROR:: Cannot output truth table: " + str(error))
+
+            # If the truth table is interrupted (e.g. Ctrl-C), then report where it can be resumed from instead of a traceback.
+            except KeyboardInterrupt:
+                checkpoint_file = output_file + CHECKPOINT_EXTENSION if output_file else None
+                if checkpoint_file and os.path.isfile(checkpoint_file):
+                    print("INFO::  Truth table interrupted. Progress was saved to checkpoint \"" + checkpoint_file
+                          + "\" (rerun with --resume to continue it).", file=sys.stderr)
+                else:
+                    print("INFO::  Truth table interrupted.", file=sys.stderr)
+                sys.exit(130)
 
-            # Generate the truth table for the selected outputs.
-            if output_file:
-                print("INFO::  Outputting truth table to \"" + output_file + "\"...")
-            else:
-                print("INFO::  Printing truth table for selected outputs...")
-            print("        This may take awhile for large numbers of inputs because of 2^n combinations...")
-            print("        Total Combinations: " + str(pow(2, circuit.get_num_of_general_input_values())))
-            if output_file is None:
-                print()
-            circuit.print_truth_table(selected_outputs)
-            
         # Otherwise, display an error.
         else:
             print("ERROR:: Invalid file: \"" + circuit_file + "\"")
             print("        File must be of extension .in (e.g. circuit1.in).")
-            
+
     # Otherwise, display an error.
     else:
         print("ERROR:: Cannot find file at path \"" + circuit_file + "\"")
 
+def main():
+    # Parse the command-line arguments.
+    args = get_args()
+
+    # Binary truth tables can only be output to a file.
+    if args.format_binary and not (args.output_file or args.output_dir):
+        print("ERROR:: Binary format requires an output file (e.g. --format-binary -o path/to/table.bin).")
+        return
+
+    # Output files are compressed by their extension (e.g. .csv.gz), which is only supported for the text formats.
+    if args.output_file:
+        try:
+            compression = get_output_compression(args.output_file[0])
+        except ValueError as error:
+            print("ERROR:: Cannot compress output file: " + str(error))
+            return
+        if compression and args.format_binary:
+            print("ERROR:: Binary format cannot be compressed (use an output file without .gz, .bz2, or .xz).")
+            return
+
+    # Input vectors are printed in the same text formats as the truth table.
+    if args.vectors_file and args.format_binary:
+        print("ERROR:: Binary format is not supported with --vectors.")
+        return
+
+    # Gray-code enumerations simulate one combination at a time, so they cannot be packed into binary columns or split into jobs.
+    if args.enumeration != "blocks" and (args.format_binary or args.jobs > 1):
+        print("ERROR:: --enumeration " + args.enumeration + " is not supported with --format-binary or -j, --jobs greater than 1.")
+        return
+
+    # Row ranges, random combinations, and held inputs only apply when the combinations are generated instead of read from a file.
+    if args.vectors_file and (args.rows or args.sample is not None or args.held_inputs):
+        print("ERROR:: --rows, --sample, and --hold are not supported with --vectors.")
+        return
+
+    # Row ranges and random combinations are printed in binary order in the text formats.
+    if (args.rows or args.sample is not None) and (args.enumeration != "blocks" or args.format_binary):
+        print("ERROR:: --rows and --sample require the blocks enumeration and a text format.")
+        return
+    if args.sample is not None and (args.sample < 0 or args.resume):
+        print("ERROR:: --sample requires a non-negative number of vectors and cannot be resumed.")
+        return
+
+    # Symbolic analysis and equivalence checks cover every combination of every general input and are printed to the console.
+    if (args.bdd or args.equivalent_ids) and (args.held_inputs or args.rows or args.sample is not None or args.vectors_file
+                                              or args.output_file or args.output_dir):
+        print("ERROR:: --hold, --rows, --sample, --vectors, -o/--out, and --out-dir are not supported with --bdd or --equivalent.")
+        return
+
+    # Only truth tables output to files in binary order can be resumed from a checkpoint.
+    if args.resume and (not (args.output_file or args.output_dir) or args.enumeration != "blocks" or args.vectors_file):
+        print("ERROR:: Resuming requires an output file (e.g. --resume -o path/to/table.txt) and the blocks enumeration.")
+        return
+
+    # A single output file can only hold the truth table of a single circuit.
+    if args.output_file and len(args.circuit_files) > 1:
+        print("ERROR:: Multiple circuit files require --out-dir instead of -o/--out.")
+        return
+
+    # Create the output directory (if applicable).
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    # Open the netlist cache (if applicable).
+    cache = None
+    if args.cache_dir:
+        cache = NetlistCache(args.cache_dir, args.cache_size << 20)
+
+    # Read the input vectors (if applicable).
+    vectors = None
+    if args.vectors_file:
+        try:
+            vectors = read_vectors_file(args.vectors_file)
+        except (ImportError, OSError, ValueError) as error:
+            print("ERROR:: Cannot read input vectors from \"" + args.vectors_file + "\": " + str(error))
+            return
+
+    # Parse the held inputs (if applicable).
+    held_inputs = {}
+    if args.held_inputs:
+        held_inputs = parse_held_inputs(args.held_inputs)
+        if held_inputs is None:
+            return
+
+    # Pick a seed for the random combinations (if applicable), and always report it to stderr (even with -q) so the run can be
+    # repeated.
+    if args.sample is not None:
+        if args.seed is None:
+            args.seed = random.randrange(1 << 32)
+        print("INFO::  Random seed: " + str(args.seed) + " (repeat with --seed " + str(args.seed) + ")", file=sys.stderr)
+
+    # Generate the truth table of each circuit file in order.
+    for circuit_file in args.circuit_files:
+        simulate_circuit_file(circuit_file, args, cache, vectors, held_inputs)
+
 #===================================================================================================================================
 #  Main Execution
 #===================================================================================================================================
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#===================================================================================================================================
+#  File        : netlistcache.py
+#  Project     : Combinational Logic Simulator
+#  Description : Cache compiled circuits on disk.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Secure hashes and message digests
+# Reference: https://docs.python.org/3/library/hashlib.html
+import hashlib
+
+# Miscellaneous operating system interfaces
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# Python object serialization
+# Reference: https://docs.python.org/3/library/pickle.html
+import pickle
+
+# Generate temporary files and directories
+# Reference: https://docs.python.org/3/library/tempfile.html
+import tempfile
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Default maximum total size (in bytes) of the cached circuits
+DEFAULT_CACHE_SIZE = 256 << 20
+
+# File extension of each cached circuit
+CACHE_FILE_EXTENSION = ".pickle"
+
+#===================================================================================================================================
+#  Class Definition
+#===================================================================================================================================
+
+class NetlistCache(object):
+    """Cache compiled circuits on disk, keyed by a hash of the circuit file content.
+
+    Each compiled circuit is stored in its own file. When the total size of the cache goes over its maximum, the least recently
+    used circuits are evicted first. Only use cache directories that you trust, since cached circuits are loaded with pickle.
+
+    Keyword arguments:
+    directory -- Directory holding the cached circuits
+    max_size  -- Maximum total size (in bytes) of the cached circuits
+    """
+    def __init__(self, directory, max_size=DEFAULT_CACHE_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, content, version):
+        """Get the cache key of a circuit file.
+
+        Keyword arguments:
+        content -- Raw bytes of the circuit file
+        version -- Version of the compiled circuit format
+        """
+        return hashlib.sha256(str(version).encode() + b"\0" + content).hexdigest()
+
+    def get(self, key):
+        """Get a cached compiled circuit (None if it is not cached).
+
+        Keyword arguments:
+        key -- Cache key of the circuit file
+        """
+        path = self.__get_path(key)
+        try:
+            with open(path, "rb") as cached_file:
+                state = pickle.load(cached_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # Mark the circuit as the most recently used one.
+        os.utime(path)
+        return state
+
+    def put(self, key, state):
+        """Store a compiled circuit in the cache, then evict the least recently used circuits if the cache is too large.
+
+        Keyword arguments:
+        key   -- Cache key of the circuit file
+        state -- Compiled circuit to store
+        """
+        # Write to a temporary file first so an interrupted write never leaves a partial cached circuit behind.
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as cached_file:
+                pickle.dump(state, cached_file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.__get_path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        self.__evict()
+
+    def __get_path(self, key):
+        """Get the path of a cached circuit.
+
+        Keyword arguments:
+        key -- Cache key of the circuit file
+        """
+        return os.path.join(self.directory, key + CACHE_FILE_EXTENSION)
+
+    def __evict(self):
+        """Remove the least recently used circuits until the cache fits in its maximum size.
+
+        Keyword arguments:
+        <None>
+        """
+        # Get the last use time and size of each cached circuit.
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.directory):
+            if name.endswith(CACHE_FILE_EXTENSION):
+                path = os.path.join(self.directory, name)
+                status = os.stat(path)
+                entries.append((status.st_mtime, status.st_size, path))
+                total_size = total_size + status.st_size
+
+        # Remove the oldest circuits first.
+        entries.sort()
+        for last_used, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            os.remove(path)
+            total_size = total_size - size
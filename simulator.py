@@ -0,0 +1,195 @@
+#===================================================================================================================================
+#  File        : simulator.py
+#  Project     : Combinational Logic Simulator
+#  Description : Simulate combinational logic circuits one input vector at a time.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Logic gate simulation
+# Reference: gate.py
+from gate import get_kernels, get_lookup_table
+
+#===================================================================================================================================
+#  Class Definition
+#===================================================================================================================================
+
+class Simulator(object):
+    """Simulate a combinational logic circuit one input vector at a time.
+
+    The simulator keeps the current value of every general input and gate. When inputs change, only the gates in the fan-out cone
+    of the changed values are re-evaluated, level by level, and propagation stops at any gate whose value does not change. All
+    general inputs start at logic 0.
+
+    Each gate with a lookup table also keeps the int formed by its current input bits, which is updated by flipping a single bit
+    whenever one of its inputs changes, so re-evaluating the gate is a single lookup.
+
+    If outputs are selected, then only the gates in their fan-in cone are simulated, and the values of all other gates are left
+    at logic 0.
+
+    Keyword arguments:
+    circuit          -- Circuit to simulate
+    selected_outputs -- List of gate indexes to simulate the fan-in cone of (None to simulate all gates)
+    """
+    def __init__(self, circuit, selected_outputs=None):
+        self.__num_general_values, self.__input_slots, fan_out, self.__levels, order = circuit.get_netlist()
+        codes = circuit.get_gate_type_codes()
+        num_gates = len(codes)
+        self.__kernels = [get_kernels(codes[i], len(self.__input_slots[i]))[0] for i in range(num_gates)]
+        self.__lookup_tables = [get_lookup_table(codes[i], len(self.__input_slots[i])) for i in range(num_gates)]
+
+        # Track the gates fed by each value slot along with the bit of their lookup index the slot sets.
+        self.__fan_out = [[] for slots in fan_out]
+        for i in range(num_gates):
+            for k, slot in enumerate(self.__input_slots[i]):
+                self.__fan_out[slot].append((i, 1 << k))
+
+        # Mark the gates to simulate, walking back from the selected outputs (if applicable).
+        if selected_outputs:
+            self.__is_active = [False] * num_gates
+            pending = [int(output) for output in selected_outputs]
+            while pending:
+                i = pending.pop()
+                if not self.__is_active[i]:
+                    self.__is_active[i] = True
+                    pending.extend([slot - self.__num_general_values for slot in self.__input_slots[i]
+                                    if slot >= self.__num_general_values])
+            order = [i for i in order if self.__is_active[i]]
+        else:
+            self.__is_active = [True] * num_gates
+
+        # Track the gates scheduled for re-evaluation in one bucket per level.
+        self.__buckets = [[] for i in range(max(self.__levels, default=0) + 1)]
+        self.__is_scheduled = [False] * num_gates
+
+        # Count the number of gate evaluations performed so far.
+        self.num_evaluations = 0
+
+        # Evaluate every gate in topological order for the initial all-zero input vector.
+        self.__values = [0] * (self.__num_general_values + num_gates)
+        self.__lookup_indexes = [0] * num_gates
+        for i in order:
+            input_values = [self.__values[slot] for slot in self.__input_slots[i]]
+            self.__lookup_indexes[i] = sum([value << k for k, value in enumerate(input_values)])
+            self.__values[self.__num_general_values + i] = self.__kernels[i](input_values)
+        self.num_evaluations = len(order)
+
+    def set_input(self, input, value):
+        """Set the value of a single general input and propagate the change.
+
+        Keyword arguments:
+        input -- Position of the general input (e.g. 3 for I3)
+        value -- New logic value of the general input
+        """
+        self.set_inputs({input: value})
+
+    def flip_input(self, input):
+        """Invert the value of a single general input and propagate the change.
+
+        Keyword arguments:
+        input -- Position of the general input (e.g. 3 for I3)
+        """
+        self.set_inputs({input: self.__values[input] ^ 1})
+
+    def set_inputs(self, inputs):
+        """Set the values of several general inputs at once and propagate the changes.
+
+        Keyword arguments:
+        inputs -- Either a dict of {general input position: value} or a list of values for every general input
+        """
+        if not isinstance(inputs, dict):
+            if len(inputs) != self.__num_general_values:
+                raise ValueError("Expected " + str(self.__num_general_values) + " general input values but got " + str(len(inputs)))
+            inputs = dict(enumerate(inputs))
+
+        # Schedule the gates fed by each general input that actually changes.
+        for input, value in inputs.items():
+            if input < 0 or input >= self.__num_general_values:
+                raise IndexError("General input I" + str(input) + " is out of range")
+            if value != 0 and value != 1:
+                raise ValueError("General input I" + str(input) + " must be 0 or 1")
+            if self.__values[input] != value:
+                self.__values[input] = value
+                self.__schedule(self.__fan_out[input])
+
+        self.__propagate()
+
+    def get_input(self, input):
+        """Get the current value of a general input.
+
+        Keyword arguments:
+        input -- Position of the general input (e.g. 3 for I3)
+        """
+        return self.__values[input]
+
+    def get_output(self, output):
+        """Get the current value of a gate.
+
+        Keyword arguments:
+        output -- Index of the gate in the sorted list of gates
+        """
+        return self.__values[self.__num_general_values + output]
+
+    def get_outputs(self, selected_outputs=None):
+        """Get the current values of the selected gates (if applicable).
+
+        If no outputs are selected, then the values of all gates are returned.
+
+        Keyword arguments:
+        selected_outputs -- List of gate indexes
+        """
+        if selected_outputs:
+            return [self.__values[self.__num_general_values + int(output)] for output in selected_outputs]
+        else:
+            return self.__values[self.__num_general_values:]
+
+    def __schedule(self, gates):
+        """Flip the lookup index bit of gates fed by a changed value and schedule them for re-evaluation in the bucket of their level.
+
+        Keyword arguments:
+        gates -- List of (gate index, lookup index bit) fed by the changed value
+        """
+        lookup_indexes = self.__lookup_indexes
+        for i, bit in gates:
+            lookup_indexes[i] = lookup_indexes[i] ^ bit
+            if self.__is_active[i] and not self.__is_scheduled[i]:
+                self.__is_scheduled[i] = True
+                self.__buckets[self.__levels[i]].append(i)
+
+    def __propagate(self):
+        """Re-evaluate the scheduled gates level by level until no gate changes.
+
+        A gate only feeds gates at higher levels, so each gate is evaluated at most once per propagation.
+
+        Keyword arguments:
+        <None>
+        """
+        num_general_values = self.__num_general_values
+        values = self.__values
+        lookup_tables = self.__lookup_tables
+        lookup_indexes = self.__lookup_indexes
+        for bucket in self.__buckets:
+            for i in bucket:
+                self.__is_scheduled[i] = False
+
+                # Look up the gate value if possible, otherwise evaluate its kernel on its input values.
+                lookup_table = lookup_tables[i]
+                if lookup_table is not None:
+                    value = lookup_table[lookup_indexes[i]]
+                else:
+                    value = self.__kernels[i]([values[slot] for slot in self.__input_slots[i]])
+                self.num_evaluations = self.num_evaluations + 1
+
+                # If the gate value changed, then schedule the gates it feeds.
+                if values[num_general_values + i] != value:
+                    values[num_general_values + i] = value
+                    self.__schedule(self.__fan_out[num_general_values + i])
+            bucket.clear()
@@ -0,0 +1,176 @@
+#===================================================================================================================================
+#  File        : stats.py
+#  Project     : Combinational Logic Simulator
+#  Description : Track the progress and performance of generating truth tables.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Basic date and time types
+# Reference: https://docs.python.org/3/library/datetime.html
+from datetime import timedelta
+
+# Time access and conversions
+# Reference: https://docs.python.org/3/library/time.html
+from time import perf_counter
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Minimum number of seconds between periodic progress callbacks
+PROGRESS_INTERVAL = 1.0
+
+# Stages of loading a circuit and generating its truth table, in the order they happen
+STAGES = ("cache", "parse", "index", "compile", "optimize", "evaluate", "format", "write")
+
+#===================================================================================================================================
+#  Class Definition
+#===================================================================================================================================
+
+class TruthTableStats(object):
+    """Track the progress and performance of generating a truth table.
+
+    The wall time of each stage is accumulated in stage_times, and the number of gate evaluations in gate_evaluations (calls to a
+    gate kernel) and gate_row_evaluations (gate values calculated, counting each combination of a packed block separately).
+
+    Keyword arguments:
+    total_rows  -- Number of rows in the truth table
+    stage_times -- Dict of wall times in seconds of the stages already done (e.g. parsing the circuit)
+    callback    -- Function called with the stats periodically and once the truth table is done (None for no callback)
+    interval    -- Minimum number of seconds between periodic callbacks
+    """
+    def __init__(self, total_rows, stage_times=None, callback=None, interval=PROGRESS_INTERVAL):
+        self.total_rows = total_rows
+        self.rows_done = 0
+        self.gate_evaluations = 0
+        self.gate_row_evaluations = 0
+        self.stage_times = dict(stage_times or {})
+        self.is_done = False
+        self.__callback = callback
+        self.__interval = interval
+        self.__start_time = perf_counter()
+        self.__last_callback_time = self.__start_time
+
+    def add_time(self, stage, seconds):
+        """Add wall time to a stage.
+
+        Keyword arguments:
+        stage   -- Name of the stage (see STAGES)
+        seconds -- Wall time in seconds
+        """
+        self.stage_times[stage] = self.stage_times.get(stage, 0.0) + seconds
+
+    def time_iterations(self, iterable, stage, exclude=None):
+        """Generate the items of an iterable while adding the time spent producing them to a stage.
+
+        Keyword arguments:
+        iterable -- Iterable to generate the items of
+        stage    -- Name of the stage to add the time to
+        exclude  -- Name of a stage timed while producing the items, whose time is not added again (None to add all the time)
+        """
+        iterator = iter(iterable)
+        while True:
+            excluded_time = self.stage_times.get(exclude, 0.0)
+            start_time = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add_time(stage, perf_counter() - start_time - (self.stage_times.get(exclude, 0.0) - excluded_time))
+            yield item
+
+    def add_rows(self, num_rows, gate_evaluations=0, gate_row_evaluations=0):
+        """Count rows of the truth table as done and report the progress if the callback interval passed.
+
+        Keyword arguments:
+        num_rows             -- Number of rows done
+        gate_evaluations     -- Number of calls to a gate kernel made for the rows
+        gate_row_evaluations -- Number of gate values calculated for the rows
+        """
+        self.rows_done = self.rows_done + num_rows
+        self.gate_evaluations = self.gate_evaluations + gate_evaluations
+        self.gate_row_evaluations = self.gate_row_evaluations + gate_row_evaluations
+        if self.__callback:
+            now = perf_counter()
+            if now - self.__last_callback_time >= self.__interval:
+                self.__last_callback_time = now
+                self.__callback(self)
+
+    def finish(self):
+        """Mark the truth table as done and report the final stats.
+
+        Keyword arguments:
+        <None>
+        """
+        self.is_done = True
+        self.__elapsed_time = perf_counter() - self.__start_time
+        if self.__callback:
+            self.__callback(self)
+
+    def get_elapsed_time(self):
+        """Get the wall time in seconds since the truth table was started (until it was done, if applicable).
+
+        Keyword arguments:
+        <None>
+        """
+        if self.is_done:
+            return self.__elapsed_time
+        return perf_counter() - self.__start_time
+
+    def get_rows_per_second(self):
+        """Get the average number of rows done per second.
+
+        Keyword arguments:
+        <None>
+        """
+        elapsed_time = self.get_elapsed_time()
+        return self.rows_done / elapsed_time if elapsed_time > 0 else 0.0
+
+    def get_eta(self):
+        """Get the estimated number of seconds until the truth table is done (None if no rows are done yet).
+
+        Keyword arguments:
+        <None>
+        """
+        rows_per_second = self.get_rows_per_second()
+        if rows_per_second == 0:
+            return None
+        return (self.total_rows - self.rows_done) / rows_per_second
+
+    def format_progress(self):
+        """Format the progress of the truth table as a single line.
+
+        Keyword arguments:
+        <None>
+        """
+        percent = 100.0 * self.rows_done / self.total_rows if self.total_rows else 100.0
+        eta = self.get_eta()
+        return ("Rows: " + str(self.rows_done) + " / " + str(self.total_rows) + " (" + format(percent, ".1f") + "%), "
+                + format(self.get_rows_per_second(), ",.0f") + " rows/sec, ETA "
+                + (str(timedelta(seconds=round(eta))) if eta is not None else "unknown"))
+
+    def format_summary(self):
+        """Format the wall time of each stage and the gate evaluation counters as a list of lines.
+
+        Keyword arguments:
+        <None>
+        """
+        lines = []
+        for stage in STAGES:
+            if stage in self.stage_times:
+                lines.append(stage.capitalize().ljust(9) + ": " + format(self.stage_times[stage], ".3f") + " s")
+        lines.append("Table    : " + format(self.get_elapsed_time(), ".3f") + " s for " + str(self.rows_done) + " rows ("
+                     + format(self.get_rows_per_second(), ",.0f") + " rows/sec)")
+        lines.append("Gate evaluations     : " + str(self.gate_evaluations))
+        lines.append("Gate row evaluations : " + str(self.gate_row_evaluations))
+        return lines
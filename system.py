@@ -6,33 +6,320 @@
 #  Engineer    : Byron Phung
 #===================================================================================================================================
 
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Miscellaneous operating system interfaces
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# A synchronized queue class
+# Reference: https://docs.python.org/3/library/queue.html
+from queue import Queue
+
+# System-specific parameters and functions
+# Reference: https://docs.python.org/3/library/sys.html
+import sys
+
+# Thread-based parallelism
+# Reference: https://docs.python.org/3/library/threading.html
+from threading import Thread
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Optional Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Fundamental package for array computing (only needed to read input vectors)
+# Reference: https://numpy.org/doc/stable/
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Compression codecs for output files (only available if Python was built with their libraries)
+# Reference: https://docs.python.org/3/library/archiving.html
+try:
+    import gzip
+except ImportError:
+    gzip = None
+try:
+    import bz2
+except ImportError:
+    bz2 = None
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Number of characters buffered by an output writer before they are written out
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Compression codec of output files by file extension, as (module, codec name, keyword arguments of the module's open()). The
+# fastest levels are used, since truth tables are repetitive enough to compress well at any level and the codec should keep up
+# with evaluating the rows.
+OUTPUT_COMPRESSIONS = {".gz": (gzip, "gzip", {"compresslevel": 1}), ".bz2": (bz2, "bzip2", {"compresslevel": 1}),
+                       ".xz": (lzma, "xz", {"preset": 1})}
+
+# Maximum number of buffered chunks waiting for the background thread to compress them
+OUTPUT_QUEUE_SIZE = 8
+
+#===================================================================================================================================
+#  Class Definition
+#===================================================================================================================================
+
+class OutputWriter(object):
+    """Print to console or output to file through a single buffered handle.
+
+    The output file is opened once and written in large chunks, then flushed and closed when the writer is closed. It can be used
+    as a context manager.
+
+    If the output file ends with a compressed extension (see OUTPUT_COMPRESSIONS, e.g. table.csv.gz), then the output is compressed
+    by a background thread, so compression overlaps with evaluating the rows. Each sync() ends the current compressed stream, so a
+    file truncated to the size returned by sync() is still valid, and resuming appends a new stream that decompresses as part of
+    the same file.
+
+    Keyword arguments:
+    output_file   -- Path to output file (None to print to console)
+    buffer_size   -- Number of characters to buffer before writing
+    resume_offset -- Size in bytes to truncate the output file to before continuing to write it (None to append to the file, or 0 to
+                     start a new file)
+    """
+    def __init__(self, output_file=None, buffer_size=OUTPUT_BUFFER_SIZE, resume_offset=None):
+        self.__compression = get_output_compression(output_file) if output_file else None
+        binary = "b" if self.__compression else ""
+        if output_file and resume_offset:
+            self.__file = open(output_file, "r+" + binary)
+            self.__file.truncate(resume_offset)
+            self.__file.seek(0, os.SEEK_END)
+        elif output_file:
+            self.__file = open(output_file, ("a" if resume_offset is None else "w") + binary)
+        else:
+            self.__file = None
+        self.__buffer = []
+        self.__buffered_size = 0
+        self.__buffer_size = buffer_size
+        self.__error = None
+        self.__is_error_raised = False
+
+        # Start the background thread compressing the buffered chunks into the output file (if applicable).
+        if self.__compression:
+            self.__compressed_file = self.__open_compressed_stream()
+            self.__queue = Queue(OUTPUT_QUEUE_SIZE)
+            self.__thread = Thread(target=self.__compress_chunks, daemon=True)
+            self.__thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def write(self, output, is_same_line=True):
+        """Buffer the output to be printed to console or output to file.
+
+        Keywords arguments:
+        output       -- Output string
+        is_same_line -- Determines if output should have newline or not
+        """
+        if not is_same_line:
+            output = output + "\n"
+        self.__buffer.append(output)
+        self.__buffered_size = self.__buffered_size + len(output)
+        if self.__buffered_size >= self.__buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write out all the buffered output.
+
+        Keywords arguments:
+        <None>
+        """
+        if self.__buffer:
+            output = "".join(self.__buffer)
+            self.__buffer = []
+            self.__buffered_size = 0
+            if self.__compression:
+                self.__raise_error()
+                self.__queue.put(output)
+            elif self.__file:
+                self.__file.write(output)
+            else:
+                sys.stdout.write(output)
+        if self.__compression:
+            return
+        elif self.__file:
+            self.__file.flush()
+        else:
+            sys.stdout.flush()
+
+    def sync(self):
+        """Write out all the buffered output, force it to disk, and get the size of the output file in bytes.
+
+        Keywords arguments:
+        <None>
+        """
+        self.flush()
+        if not self.__file:
+            return 0
+
+        # Wait for every chunk to be compressed, then end the compressed stream (if applicable).
+        if self.__compression:
+            self.__queue.join()
+            self.__raise_error()
+            self.__close_compressed_stream()
+            self.__file.flush()
+        os.fsync(self.__file.fileno())
+        offset = self.__file.tell()
+
+        # Start a new compressed stream after the synced output (if applicable).
+        if self.__compression:
+            self.__compressed_file = self.__open_compressed_stream()
+        return offset
+
+    def close(self):
+        """Flush the buffered output and close the output file (if applicable).
+
+        Keywords arguments:
+        <None>
+        """
+        try:
+            # Drop the buffered output if the compressed stream already failed.
+            if not self.__is_error_raised:
+                self.flush()
+
+            # Stop the background thread once it compressed every chunk, then end the compressed stream unless it failed.
+            if self.__compression and self.__file:
+                self.__queue.put(None)
+                self.__thread.join()
+                if self.__error is None:
+                    self.__close_compressed_stream()
+        finally:
+            # Closing the output file after the compressed stream failed only repeats the error (e.g. a full disk).
+            if self.__file:
+                file = self.__file
+                self.__file = None
+                try:
+                    file.close()
+                except Exception:
+                    if self.__error is None:
+                        raise
+
+        # Raise the error of the background thread unless it was already raised (so it is not raised again or hidden).
+        if self.__compression and not self.__is_error_raised:
+            self.__raise_error()
+
+    def __open_compressed_stream(self):
+        """Start a new compressed stream at the current position of the output file.
+
+        Keyword arguments:
+        <None>
+        """
+        module, name, arguments = self.__compression
+        return module.open(self.__file, "wb", **arguments)
+
+    def __close_compressed_stream(self):
+        """End the current compressed stream, keeping any error so that no later output is written to the failed stream.
+
+        Keyword arguments:
+        <None>
+        """
+        try:
+            self.__compressed_file.close()
+        except Exception as error:
+            self.__error = error
+            self.__is_error_raised = True
+            raise
+
+    def __compress_chunks(self):
+        """Compress each queued chunk into the output file until the writer is closed (run by the background thread).
+
+        Any error is kept and raised by the next flush, sync, or close, and later chunks are dropped.
+
+        Keyword arguments:
+        <None>
+        """
+        while True:
+            chunk = self.__queue.get()
+            try:
+                if chunk is not None and self.__error is None:
+                    self.__compressed_file.write(chunk.encode("utf-8"))
+            except Exception as error:
+                self.__error = error
+            finally:
+                self.__queue.task_done()
+            if chunk is None:
+                return
+
+    def __raise_error(self):
+        """Raise the error of the background thread (if applicable).
+
+        The error is kept once it happens, so every later flush or sync raises it again instead of writing to the failed stream.
+
+        Keyword arguments:
+        <None>
+        """
+        if self.__error is not None:
+            self.__is_error_raised = True
+            raise self.__error
+
 #===================================================================================================================================
 #  Functions Definition
 #===================================================================================================================================
 
-def print_or_output(output, output_file=None, is_same_line=True):
-    """Print to console or output to file.
+def get_output_compression(file):
+    """Get the (module, codec name, keyword arguments) of the compression codec of an output file (None if uncompressed).
 
-    Keywords arguments:
-    output       -- Output string
-    is_same_line -- Determines if print should have newline or not
-    output_file  -- Path to output file
+    Raises a ValueError if the file has a compressed extension but Python was built without the codec.
+
+    Keyword arguments:
+    file -- Path to output file
     """
-    if is_same_line:
-        end_line = ""
-    else:
-        end_line = "\n"
-    if output_file:
-        print(output, end=end_line, file=open(output_file, "a"))
-    else:
-        print(output, end=end_line)
-
-def read_file(file):
-    """Read the raw content of a file.
+    compression = OUTPUT_COMPRESSIONS.get(os.path.splitext(file)[1].lower())
+    if compression and compression[0] is None:
+        raise ValueError("Python was built without " + compression[1] + " support for \"" + file + "\"")
+    return compression
+
+def read_binary_file(file):
+    """Read the raw bytes of a file.
 
     Keyword arguments:
     file -- File to read
     """
-    file_content = open(file)
-    return file_content.read()
-    
\ No newline at end of file
+    with open(file, "rb") as file_content:
+        return file_content.read()
+
+def read_vectors_file(file):
+    """Read a file of input vectors into a 2-D NumPy array of 0 and 1 values.
+
+    Each line holds one vector with a 0 or 1 for every general input (e.g. "0110", "0 1 1 0", or "0,1,1,0"). Blank lines and
+    comments (starting with #) are ignored.
+
+    Keyword arguments:
+    file -- File to read
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required to read input vectors")
+
+    # Strip the separators from each vector and check that every vector has the same length.
+    rows = []
+    with open(file) as lines:
+        for line_number, line in enumerate(lines, 1):
+            row = "".join(line.split("#", 1)[0].replace(",", " ").split())
+            if not row:
+                continue
+            if row.strip("01") or (rows and len(row) != len(rows[0])):
+                raise ValueError("Line " + str(line_number) + ": Invalid input vector \"" + line.strip() + "\"")
+            rows.append(row)
+
+    # Convert the characters of every vector to 0 and 1 values at once.
+    num_values = len(rows[0]) if rows else 0
+    return (numpy.frombuffer("".join(rows).encode("ascii"), numpy.uint8) - ord("0")).reshape(len(rows), num_values)
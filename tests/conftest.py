@@ -0,0 +1,56 @@
+#===================================================================================================================================
+#  File        : conftest.py
+#  Project     : Combinational Logic Simulator
+#  Description : Shared fixtures of the regression tests.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Miscellaneous operating system interfaces
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# System-specific parameters and functions
+# Reference: https://docs.python.org/3/library/sys.html
+import sys
+
+# Testing framework
+# Reference: https://docs.pytest.org/
+import pytest
+
+# The simulator modules live in the repository root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Synthetic circuit generators
+# Reference: benchmark.py
+from benchmark import GENERATORS
+
+#===================================================================================================================================
+#  Fixtures
+#===================================================================================================================================
+
+@pytest.fixture
+def write_circuit(tmp_path):
+    """Get a function writing a generated circuit file (see benchmark.GENERATORS) and returning its path.
+
+    Keyword arguments:
+    tmp_path -- Temporary directory of the test
+    """
+    def write(generator, *arguments):
+        builder = GENERATORS[generator](*arguments)[0]
+        file = str(tmp_path / (generator + "_" + "_".join([str(argument) for argument in arguments]) + ".in"))
+        builder.write(file)
+        return file
+    return write
@@ -0,0 +1,119 @@
+#===================================================================================================================================
+#  File        : test_bdd.py
+#  Project     : Combinational Logic Simulator
+#  Description : Regression tests of the symbolic analysis against enumerated truth tables.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# System-specific parameters and functions
+# Reference: https://docs.python.org/3/library/sys.html
+import sys
+
+# Testing framework
+# Reference: https://docs.pytest.org/
+import pytest
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Synthetic circuit generators
+# Reference: benchmark.py
+from benchmark import carry_lookahead_adder, ripple_carry_adder
+
+# Symbolic analysis with binary decision diagrams
+# Reference: bdd.py
+from bdd import CircuitBDD
+
+# Combinational logic simulation
+# Reference: circuit.py
+from circuit import Circuit
+
+# Command-line interface
+# Reference: main.py
+import main
+
+# Event-driven simulation of single input vectors
+# Reference: simulator.py
+from simulator import Simulator
+
+#===================================================================================================================================
+#  Tests
+#===================================================================================================================================
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_analysis_matches_truth_table(write_circuit, seed):
+    # Enumerate the truth table of every gate without optimizing the circuit, so it is independent of the optimized netlist.
+    circuit = Circuit(write_circuit("random_dag", 8, 4, 8, seed), None, False, optimize=False)
+    num_gates = circuit.get_num_of_gates()
+    rows = list(circuit.generate_truth_table_rows())
+    columns = [tuple([gate_values[i] for combination, gate_values in rows]) for i in range(num_gates)]
+    circuit_bdd = CircuitBDD(circuit)
+
+    # Each gate must be 1 for the same number of combinations, including the witness.
+    simulator = Simulator(circuit)
+    for i in range(num_gates):
+        assert circuit_bdd.count_satisfying(i) == sum(columns[i])
+        witness = circuit_bdd.get_witness(i)
+        if witness is None:
+            assert sum(columns[i]) == 0
+        else:
+            simulator.set_inputs(witness)
+            assert simulator.get_output(i) == 1
+
+    # Two gates are equivalent exactly when their columns are equal, and otherwise differ at the counterexample.
+    for a in range(num_gates):
+        for b in range(a + 1, num_gates):
+            assert circuit_bdd.is_equivalent(a, b) == (columns[a] == columns[b])
+            counterexample = circuit_bdd.get_counterexample(a, b)
+            if counterexample is None:
+                assert columns[a] == columns[b]
+            else:
+                simulator.set_inputs(counterexample)
+                assert simulator.get_output(a) != simulator.get_output(b)
+
+def test_equivalent_adders(tmp_path):
+    # Place a ripple-carry adder and a carry-lookahead adder of the same inputs in one circuit, renumbering the second one.
+    lines = ripple_carry_adder(16)[0].lines
+    offset = len(lines)
+    for line in carry_lookahead_adder(16)[0].lines:
+        tokens = line.split()
+        inputs = [token if token.startswith("I") else str(int(token) + offset) for token in tokens[3:]]
+        lines.append(" ".join([str(int(tokens[0]) + offset), "LA_" + tokens[1], tokens[2]] + inputs))
+    circuit_file = str(tmp_path / "adders.in")
+    with open(circuit_file, "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+    circuit = Circuit(circuit_file, None, False, optimize=False)
+    circuit_bdd = CircuitBDD(circuit)
+    for name in ["S" + str(i) for i in range(16)] + ["C16"]:
+        assert circuit_bdd.is_equivalent(circuit.get_gate_index_by_name(name), circuit.get_gate_index_by_name("LA_" + name))
+    assert not circuit_bdd.is_equivalent(circuit.get_gate_index_by_name("S3"), circuit.get_gate_index_by_name("LA_S4"))
+
+def test_deep_parity_tree(write_circuit):
+    # A parity tree over thousands of inputs must not hit the recursion limit.
+    circuit = Circuit(write_circuit("parity_tree", 1500), None, False)
+    output = circuit.get_num_of_gates() - 1
+    circuit_bdd = CircuitBDD(circuit, [output])
+    assert circuit_bdd.count_satisfying(output) == 1 << 1499
+    assert sum(circuit_bdd.get_witness(output)) % 2 == 1
+
+@pytest.mark.parametrize("analysis", [["--bdd"], ["--equivalent", "0", "1"]])
+@pytest.mark.parametrize("option", [["--hold", "I0=1"], ["--rows", "0", "2"], ["--sample", "3"], ["-o", "table.txt"],
+                                    ["--out-dir", "tables"]])
+def test_analysis_rejects_partial_tables(write_circuit, tmp_path, monkeypatch, capsys, analysis, option):
+    # The analysis covers every combination on the console, so options restricting or redirecting the table must be rejected.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["main.py", write_circuit("random_dag", 4, 2, 4, 9), "-a", "-q"] + analysis + option)
+    main.main()
+    assert capsys.readouterr().out.startswith("ERROR:: ")
+    assert not (tmp_path / "table.txt").exists() and not (tmp_path / "tables").exists()
@@ -0,0 +1,163 @@
+#===================================================================================================================================
+#  File        : test_checkpoint.py
+#  Project     : Combinational Logic Simulator
+#  Description : Regression tests of checkpointing and resuming truth tables written to files.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Support for gzip files
+# Reference: https://docs.python.org/3/library/gzip.html
+import gzip
+
+# Miscellaneous operating system interfaces
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# System-specific parameters and functions
+# Reference: https://docs.python.org/3/library/sys.html
+import sys
+
+# Testing framework
+# Reference: https://docs.pytest.org/
+import pytest
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Combinational logic simulation
+# Reference: circuit.py
+from circuit import Circuit
+
+# Checkpoints of truth tables written to files
+# Reference: checkpoint.py
+from checkpoint import CHECKPOINT_EXTENSION
+
+# Command-line interface
+# Reference: main.py
+import main
+
+#===================================================================================================================================
+#  Functions
+#===================================================================================================================================
+
+def print_table(circuit_file, output_file, format, resume=False, interrupt_after=None):
+    """Print the truth table of every gate to a file, checkpointing after every range of combinations.
+
+    Keyword arguments:
+    circuit_file    -- Circuit file to read
+    output_file     -- Path to output file
+    format          -- Output format (text, csv, or binary)
+    resume          -- Determines if the truth table continues from the checkpoint of its output file
+    interrupt_after -- Number of ranges of combinations to write before interrupting the truth table (None to finish it)
+    """
+    circuit = Circuit(circuit_file, output_file, format == "csv", format == "binary")
+    circuit.set_checkpoint_interval(0)
+
+    # Interrupt the truth table from its progress callback, which is called after each range is written and checkpointed.
+    if interrupt_after is not None:
+        def interrupt(stats):
+            if stats.rows_done >= interrupt_after * 4096 and not stats.is_done:
+                raise KeyboardInterrupt
+        circuit.set_progress_callback(interrupt, 0)
+    circuit.print_truth_table([], resume=resume)
+
+def read_binary(file):
+    """Read the raw bytes of a file.
+
+    Keyword arguments:
+    file -- File to read
+    """
+    with open(file, "rb") as output_file:
+        return output_file.read()
+
+#===================================================================================================================================
+#  Tests
+#===================================================================================================================================
+
+@pytest.mark.parametrize("format", ["text", "csv", "binary"])
+def test_resume_matches_fresh_run(write_circuit, tmp_path, format):
+    circuit_file = write_circuit("random_dag", 14, 3, 16, 1)
+    expected_file = str(tmp_path / "expected.out")
+    output_file = str(tmp_path / "table.out")
+    print_table(circuit_file, expected_file, format)
+
+    # Interrupt the truth table partway through, leaving a checkpoint and some rows written after it.
+    with pytest.raises(KeyboardInterrupt):
+        print_table(circuit_file, output_file, format, interrupt_after=2)
+    assert os.path.isfile(output_file + CHECKPOINT_EXTENSION)
+    if format != "binary":
+        with open(output_file, "a") as partial_file:
+            partial_file.write("0 1 0 partial row")
+
+    # Resuming must produce the same bytes as a run that was never interrupted, then remove the checkpoint.
+    print_table(circuit_file, output_file, format, resume=True)
+    assert read_binary(output_file) == read_binary(expected_file)
+    assert not os.path.isfile(output_file + CHECKPOINT_EXTENSION)
+
+@pytest.mark.parametrize("format", ["text", "binary"])
+def test_rerun_without_resume_keeps_checkpoint(write_circuit, tmp_path, format):
+    circuit_file = write_circuit("random_dag", 14, 3, 16, 2)
+    expected_file = str(tmp_path / "expected.out")
+    output_file = str(tmp_path / "table.out")
+    print_table(circuit_file, expected_file, format)
+    with pytest.raises(KeyboardInterrupt):
+        print_table(circuit_file, output_file, format, interrupt_after=1)
+    partial_table = read_binary(output_file)
+
+    # Running again without resuming must neither append to the partial table nor delete its checkpoint.
+    with pytest.raises(ValueError):
+        print_table(circuit_file, output_file, format)
+    assert read_binary(output_file) == partial_table
+    assert os.path.isfile(output_file + CHECKPOINT_EXTENSION)
+
+    # Once the checkpoint is removed, a new run overwrites the partial table from the start.
+    os.remove(output_file + CHECKPOINT_EXTENSION)
+    print_table(circuit_file, output_file, format)
+    assert read_binary(output_file) == read_binary(expected_file)
+
+def test_rerun_overwrites_finished_table(write_circuit, tmp_path):
+    circuit_file = write_circuit("random_dag", 8, 3, 8, 3)
+    output_file = str(tmp_path / "table.txt")
+    print_table(circuit_file, output_file, "text")
+    finished_table = read_binary(output_file)
+    print_table(circuit_file, output_file, "text")
+    assert read_binary(output_file) == finished_table
+
+def test_interrupted_command_reports_checkpoint(write_circuit, tmp_path, monkeypatch, capsys):
+    circuit_file = write_circuit("random_dag", 14, 3, 16, 10)
+    expected_file = str(tmp_path / "expected.txt.gz")
+    output_file = str(tmp_path / "table.txt.gz")
+    print_table(circuit_file, expected_file, "text")
+
+    # Interrupt the truth table after its first range, as if Ctrl-C was pressed during the command.
+    print_truth_table = Circuit.print_truth_table
+    def interrupted_print_truth_table(circuit, *arguments):
+        def interrupt(stats):
+            if stats.rows_done and not stats.is_done:
+                raise KeyboardInterrupt
+        circuit.set_progress_callback(interrupt, 0)
+        print_truth_table(circuit, *arguments)
+    monkeypatch.setattr(Circuit, "print_truth_table", interrupted_print_truth_table)
+    monkeypatch.setattr(sys, "argv", ["main.py", circuit_file, "-a", "-q", "--checkpoint-interval", "0", "-o", output_file])
+    with pytest.raises(SystemExit) as exit:
+        main.main()
+    assert exit.value.code != 0
+    assert output_file + CHECKPOINT_EXTENSION in capsys.readouterr().err
+
+    # Resuming the command must finish the same table as a run that was never interrupted (the compressed streams differ only
+    # in their headers).
+    monkeypatch.setattr(Circuit, "print_truth_table", print_truth_table)
+    monkeypatch.setattr(sys, "argv", ["main.py", circuit_file, "-a", "-q", "--resume", "-o", output_file])
+    main.main()
+    assert gzip.decompress(read_binary(output_file)) == gzip.decompress(read_binary(expected_file))
+    assert not os.path.isfile(output_file + CHECKPOINT_EXTENSION)
@@ -0,0 +1,101 @@
+#===================================================================================================================================
+#  File        : test_optimize.py
+#  Project     : Combinational Logic Simulator
+#  Description : Regression tests of the circuit optimizer against the unoptimized circuit.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Testing framework
+# Reference: https://docs.pytest.org/
+import pytest
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Combinational logic simulation
+# Reference: circuit.py
+from circuit import Circuit
+
+#===================================================================================================================================
+#  Global Variables
+#===================================================================================================================================
+
+# Circuit with duplicate gates, BUFFER gates, double inverters, repeated and complementary inputs, and constants
+REDUNDANT_CIRCUIT = """\
+0  a     AND    I0 I1
+1  a2    AND    I1 I0
+2  b     BUFFER 0
+3  n     NOT    I2
+4  nn    NOT    3
+5  x     XOR    I2 4
+6  one   XNOR   I3 I3
+7  zero  AND    I3 3 4 I3
+8  c1    OR     7 I1 6
+9  c2    NAND   8 1
+10 d     XOR    I0 I0 I1 6
+11 e     NOR    I3 7
+12 f     AND    2 1 I1
+13 g     OR     9 12 10 11
+14 h     XNOR   5 13 I3
+15 k     NAND   14
+"""
+
+#===================================================================================================================================
+#  Functions
+#===================================================================================================================================
+
+def get_tables(circuit_file, optimize, use_python=False):
+    """Get the truth table of every gate in binary order and in Gray-code order reordered back to binary order.
+
+    Keyword arguments:
+    circuit_file -- Circuit file to read
+    optimize     -- Determines if the circuit is optimized before evaluation
+    use_python   -- Determines if the truth table is evaluated by a generated straight-line Python function
+    """
+    circuit = Circuit(circuit_file, None, False, optimize=optimize, use_python=use_python)
+    return list(circuit.generate_truth_table_rows()), list(circuit.generate_gray_code_rows(None, True))
+
+#===================================================================================================================================
+#  Tests
+#===================================================================================================================================
+
+@pytest.mark.parametrize("use_python", [False, True])
+def test_redundant_circuit_matches_unoptimized(tmp_path, use_python):
+    circuit_file = str(tmp_path / "redundant.in")
+    with open(circuit_file, "w") as file:
+        file.write(REDUNDANT_CIRCUIT)
+    expected_rows = get_tables(circuit_file, False)[0]
+    for rows in get_tables(circuit_file, True, use_python):
+        assert rows == expected_rows
+
+    # The optimizer must evaluate fewer gates, while every gate can still be selected by its original ID.
+    optimized = Circuit(circuit_file, None, False)
+    unoptimized = Circuit(circuit_file, None, False, optimize=False)
+    assert optimized.get_num_of_evaluated_gates() < unoptimized.get_num_of_evaluated_gates()
+    for id in (1, 4, 9, 15):
+        outputs = [optimized.get_gate_index(id)]
+        assert list(optimized.generate_truth_table_rows(outputs)) == list(unoptimized.generate_truth_table_rows(outputs))
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_circuit_matches_unoptimized(write_circuit, seed):
+    circuit_file = write_circuit("random_dag", 8, 6, 12, seed)
+    expected_rows = get_tables(circuit_file, False)[0]
+    for rows in get_tables(circuit_file, True) + get_tables(circuit_file, True, True):
+        assert rows == expected_rows
+
+def test_vectors_match_unoptimized(write_circuit):
+    numpy = pytest.importorskip("numpy")
+    circuit_file = write_circuit("random_dag", 12, 5, 16, 11)
+    vectors = numpy.random.default_rng(1).integers(0, 2, (1000, 12))
+    expected = Circuit(circuit_file, None, False, optimize=False).simulate_vectors(vectors)
+    assert (Circuit(circuit_file, None, False).simulate_vectors(vectors) == expected).all()
@@ -0,0 +1,141 @@
+#===================================================================================================================================
+#  File        : test_partial_tables.py
+#  Project     : Combinational Logic Simulator
+#  Description : Regression tests of row ranges, random samples, and held inputs against the full truth table.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# System-specific parameters and functions
+# Reference: https://docs.python.org/3/library/sys.html
+import sys
+
+# Testing framework
+# Reference: https://docs.pytest.org/
+import pytest
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Combinational logic simulation
+# Reference: circuit.py
+from circuit import Circuit
+
+# Command-line interface
+# Reference: main.py
+import main
+
+#===================================================================================================================================
+#  Functions
+#===================================================================================================================================
+
+def read_lines(file):
+    """Read the lines of a text file.
+
+    Keyword arguments:
+    file -- File to read
+    """
+    with open(file) as text_file:
+        return text_file.read().splitlines()
+
+#===================================================================================================================================
+#  Tests
+#===================================================================================================================================
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_row_range_matches_full_table(write_circuit, tmp_path, jobs):
+    circuit_file = write_circuit("random_dag", 14, 3, 16, 4)
+    full_file = str(tmp_path / "full.txt")
+    Circuit(circuit_file, full_file, False).print_truth_table([])
+    full_lines = read_lines(full_file)
+
+    # Ranges starting and stopping inside blocks, on block boundaries, or empty must print the same rows as the full table.
+    for start, stop in [(0, 16384), (1000, 9000), (4096, 8192), (5, 5), (16383, 16384)]:
+        range_file = str(tmp_path / ("range_" + str(start) + "_" + str(stop) + ".txt"))
+        circuit = Circuit(circuit_file, range_file, False)
+        circuit.print_truth_table([], jobs, start=start, stop=stop)
+        assert read_lines(range_file) == full_lines[:1] + full_lines[1 + start:1 + stop]
+        assert list(circuit.generate_truth_table_rows(None, None, start, stop)) == \
+               list(circuit.generate_truth_table_rows())[start:stop]
+
+    with pytest.raises(ValueError):
+        Circuit(circuit_file, None, False).print_truth_table([], start=10, stop=16385)
+
+@pytest.mark.parametrize("use_python", [False, True])
+def test_held_inputs_match_filtered_table(write_circuit, use_python):
+    circuit = Circuit(write_circuit("random_dag", 10, 3, 10, 5), None, False, use_python=use_python)
+    full_rows = list(circuit.generate_truth_table_rows())
+
+    # Holding I2 at 1 and I7 at 0 must give the rows of the full table with those values, without their columns.
+    circuit.set_held_inputs({2: 1, 7: 0})
+    expected_rows = [(combination[:2] + combination[3:7] + combination[8:], gate_values)
+                     for combination, gate_values in full_rows if combination[2] == 1 and combination[7] == 0]
+    assert circuit.get_truth_table_inputs() == [0, 1, 3, 4, 5, 6, 8, 9]
+    assert list(circuit.generate_truth_table_rows()) == expected_rows
+    assert list(circuit.generate_gray_code_rows(None, True)) == expected_rows
+
+    with pytest.raises(ValueError):
+        circuit.set_held_inputs({10: 1})
+    with pytest.raises(ValueError):
+        circuit.set_held_inputs({0: 2})
+
+@pytest.mark.parametrize("use_python", [False, True])
+def test_random_rows_match_full_table(write_circuit, use_python):
+    circuit = Circuit(write_circuit("random_dag", 10, 3, 10, 6), None, False, use_python=use_python)
+    full_table = dict(circuit.generate_truth_table_rows())
+
+    # The same seed must give the same rows, each of which must be a row of the full table, spanning several blocks.
+    rows = list(circuit.generate_random_rows(10000, None, 7))
+    assert len(rows) == 10000
+    assert rows == list(circuit.generate_random_rows(10000, None, 7))
+    assert rows != list(circuit.generate_random_rows(10000, None, 8))
+    for combination, gate_values in rows:
+        assert full_table[combination] == gate_values
+
+    # Most of the 1024 combinations must come up in 10000 uniform draws.
+    assert len(set([combination for combination, gate_values in rows])) > 1000
+
+def test_random_table_file_matches_rows(write_circuit, tmp_path):
+    circuit_file = write_circuit("random_dag", 10, 3, 10, 7)
+    output_file = str(tmp_path / "sample.csv")
+    circuit = Circuit(circuit_file, output_file, True)
+    circuit.print_random_table(5000, [], 3)
+    circuit.print_random_table(5000, [], 3)
+    lines = read_lines(output_file)
+    assert len(lines) == 5001
+    assert lines[1:] == [",".join([str(value) for value in combination + gate_values])
+                         for combination, gate_values in circuit.generate_random_rows(5000, None, 3)]
+
+def test_quiet_sample_reports_seed(write_circuit, tmp_path, monkeypatch, capsys):
+    circuit_file = write_circuit("random_dag", 6, 2, 6, 8)
+    output_file = str(tmp_path / "sample.txt")
+    monkeypatch.setattr(sys, "argv", ["main.py", circuit_file, "-a", "-q", "--sample", "100", "-o", output_file])
+    main.main()
+    seed = int(capsys.readouterr().err.split("Random seed: ")[1].split()[0])
+    first_lines = read_lines(output_file)
+
+    # Repeating the run with the reported seed must give the same sample.
+    monkeypatch.setattr(sys, "argv", ["main.py", circuit_file, "-a", "-q", "--sample", "100", "--seed", str(seed), "-o",
+                                      output_file])
+    main.main()
+    assert read_lines(output_file) == first_lines
+
+@pytest.mark.parametrize("selection", [["-s", "999"], ["-s", "0", "x"], ["-n", "NOPE"], ["-s", "0", "-n", "NOPE"]])
+def test_unknown_selection_skips_file(write_circuit, tmp_path, monkeypatch, capsys, selection):
+    # An unknown gate must never widen the selection to every gate, and its error must stay out of the table stream.
+    output_file = tmp_path / "table.txt"
+    monkeypatch.setattr(sys, "argv", ["main.py", write_circuit("random_dag", 4, 2, 4, 9), "-q", "-o", str(output_file)] + selection)
+    main.main()
+    output = capsys.readouterr()
+    assert output.out == ""
+    assert output.err.startswith("ERROR:: Selected gate ")
+    assert not output_file.exists()
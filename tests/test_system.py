@@ -0,0 +1,66 @@
+#===================================================================================================================================
+#  File        : test_system.py
+#  Project     : Combinational Logic Simulator
+#  Description : Regression tests of the buffered output writer.
+#  Company     : Cal Poly Pomona
+#  Engineer    : Byron Phung
+#===================================================================================================================================
+
+#===================================================================================================================================
+#  Libraries
+#===================================================================================================================================
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Existing Python Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Miscellaneous operating system interfaces
+# Reference: https://docs.python.org/3/library/os.html
+import os
+
+# Testing framework
+# Reference: https://docs.pytest.org/
+import pytest
+
+#-----------------------------------------------------------------------------------------------------------------------------------
+#  Custom Modules
+#-----------------------------------------------------------------------------------------------------------------------------------
+
+# Handle basic system operations
+# Reference: system.py
+from system import OutputWriter
+
+#===================================================================================================================================
+#  Tests
+#===================================================================================================================================
+
+@pytest.mark.skipif(not os.path.exists("/dev/full"), reason="requires /dev/full")
+def test_compression_error_is_kept(tmp_path):
+    # Compress into a device that is always full, so the background thread fails on its first chunk.
+    output_file = str(tmp_path / "table.txt.gz")
+    os.symlink("/dev/full", output_file)
+    writer = OutputWriter(output_file, 1 << 16, 0)
+    with pytest.raises(OSError) as first_error:
+        for i in range(1000):
+            writer.write("0" * (1 << 16))
+        writer.sync()
+
+    # Every later flush or sync must raise the same error instead of writing to the failed stream, and closing must not
+    # raise again or hide it.
+    writer.write("0")
+    for operation in (writer.flush, writer.sync):
+        with pytest.raises(OSError) as error:
+            operation()
+        assert error.value is first_error.value
+    writer.close()
+
+@pytest.mark.skipif(not os.path.exists("/dev/full"), reason="requires /dev/full")
+def test_compression_error_is_raised_by_close(tmp_path):
+    # An error not yet raised by a flush or sync must be raised by closing the writer, which still closes the output file.
+    output_file = str(tmp_path / "table.txt.gz")
+    os.symlink("/dev/full", output_file)
+    writer = OutputWriter(output_file, 1 << 20, 0)
+    writer.write("0" * (1 << 16))
+    with pytest.raises(OSError):
+        writer.close()
+    writer.close()